@@ -10,7 +10,8 @@ Functions:
 - clear_datastore_path(): Clear the currently set datastore path.
 - dump_frame(df, subdir, filename): Save a DataFrame as a Parquet file in the datastore.
 - file_exists(subdir, filename): Check if a file exists in the datastore.
-- load_frame(subdir, filename): Load a DataFrame from a Parquet file in the datastore.
+- load_frame(subdir, filename, columns): Load a DataFrame (or some of its columns) from a Parquet file in the datastore.
+- file_fingerprint(subdir, filename): Get the size and modification time of a file in the datastore.
 
 Make sure to set the datastore path using `set_datastore_path()` before using other functions.
 This will cache the path in a local file for future use.
@@ -128,7 +129,7 @@ def file_exists(subdir: str, filename: str) -> bool:
     return os.path.exists(file_path)
 
 
-def load_frame(subdir: str, filename: str) -> pd.DataFrame:
+def load_frame(subdir: str, filename: str, columns: list[str] = None) -> pd.DataFrame:
     """
     Load a DataFrame from a Parquet file in the datastore path.
 
@@ -138,6 +139,8 @@ def load_frame(subdir: str, filename: str) -> pd.DataFrame:
         The name of the subdirectory to create.
     filename : str
         The name of the file to create.
+    columns : list[str], optional
+        The columns to load. If not provided, all columns are loaded.
 
     Returns
     -------
@@ -151,4 +154,36 @@ def load_frame(subdir: str, filename: str) -> pd.DataFrame:
         )
 
     file_path = os.path.join(path, subdir, filename)
-    return pd.read_parquet(file_path)
+    return pd.read_parquet(file_path, columns=columns)
+
+
+def file_fingerprint(subdir: str, filename: str) -> tuple[int, int] | None:
+    """
+    Get the size and modification time of a file in the datastore path.
+
+    The file is not read, so this is a cheap way to tell whether it was rewritten.
+
+    Parameters
+    ----------
+    subdir : str
+        The name of the subdirectory.
+    filename : str
+        The name of the file.
+
+    Returns
+    -------
+    tuple[int, int] or None
+        The size in bytes and the modification time in nanoseconds, or None if the file does not exist.
+    """
+    path = _get_datastore_path()
+    if path is None:
+        raise ValueError(
+            "Datastore path is not set. Please set it using `set_datastore_path()`."
+        )
+
+    file_path = os.path.join(path, subdir, filename)
+    if not os.path.exists(file_path):
+        return None
+
+    stat = os.stat(file_path)
+    return stat.st_size, stat.st_mtime_ns
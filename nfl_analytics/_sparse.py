@@ -0,0 +1,162 @@
+import warnings
+import numpy as np
+
+# The relative residual at which the conjugate gradient stops
+_CG_TOLERANCE = 1e-8
+
+# The maximum number of conjugate gradient iterations
+_CG_MAX_ITERATIONS = 1000
+
+
+class SparseMatrix:
+    """
+    A sparse matrix in coordinate format, supporting the products needed by iterative solvers.
+
+    The products are computed with `np.bincount` over the nonzero entries,
+    so they take time and memory linear in the number of nonzeros.
+    Repeated coordinates are summed.
+    """
+
+    def __init__(
+        self,
+        rows: np.ndarray,
+        cols: np.ndarray,
+        values: np.ndarray,
+        shape: tuple[int, int],
+    ):
+        """
+        Initialize the matrix from its nonzero entries.
+
+        Parameters
+        ----------
+            rows : np.ndarray
+                The row of each entry.
+            cols : np.ndarray
+                The column of each entry.
+            values : np.ndarray
+                The value of each entry.
+            shape : tuple[int, int]
+                The number of rows and columns of the matrix.
+        """
+        self.rows = np.asarray(rows, dtype=np.intp)
+        self.cols = np.asarray(cols, dtype=np.intp)
+        self.values = np.asarray(values, dtype=np.float64)
+        self.shape = shape
+
+    def dot(self, x: np.ndarray) -> np.ndarray:
+        """
+        Get the product of the matrix with a vector of length `shape[1]`.
+        """
+        return np.bincount(
+            self.rows, weights=self.values * x[self.cols], minlength=self.shape[0]
+        )
+
+    def transpose_dot(self, y: np.ndarray) -> np.ndarray:
+        """
+        Get the product of the transposed matrix with a vector of length `shape[0]`.
+        """
+        return np.bincount(
+            self.cols, weights=self.values * y[self.rows], minlength=self.shape[1]
+        )
+
+    def column_square_sums(self, weights: np.ndarray = None) -> np.ndarray:
+        """
+        Get the (weighted) sum of squares of each column, i.e. the diagonal of the normal equations.
+
+        Parameters
+        ----------
+            weights : np.ndarray, optional
+                The weight of each row. If not provided, the rows are equally weighted.
+        """
+        squares = self.values**2
+        if weights is not None:
+            squares = squares * weights[self.rows]
+
+        return np.bincount(self.cols, weights=squares, minlength=self.shape[1])
+
+    def to_dense(self) -> np.ndarray:
+        """
+        Get the matrix as a dense array.
+        """
+        dense = np.zeros(self.shape)
+        np.add.at(dense, (self.rows, self.cols), self.values)
+
+        return dense
+
+
+def solve_ridge(
+    matrix: SparseMatrix,
+    targets: np.ndarray,
+    penalties: np.ndarray,
+    weights: np.ndarray = None,
+    tol: float = _CG_TOLERANCE,
+    max_iter: int = _CG_MAX_ITERATIONS,
+) -> tuple[np.ndarray, int]:
+    """
+    Solve a (weighted) ridge least squares problem with the preconditioned conjugate gradient.
+
+    The normal equations (X'WX + diag(penalties)) b = X'Wy are never formed:
+    each iteration applies X and X' to a vector, and the diagonal of the normal equations
+    is used as a (Jacobi) preconditioner.
+    The unpenalized columns must be identified by the data for the system to be positive definite.
+
+    Parameters
+    ----------
+        matrix : SparseMatrix
+            The design matrix X.
+        targets : np.ndarray
+            The target y of each row.
+        penalties : np.ndarray
+            The ridge penalty of each column, 0 for the unpenalized columns.
+        weights : np.ndarray, optional
+            The weight W of each row. If not provided, the rows are equally weighted.
+        tol : float
+            The relative residual of the normal equations at which to stop.
+        max_iter : int
+            The maximum number of iterations. A warning is raised if they do not converge.
+
+    Returns
+    -------
+        tuple[np.ndarray, int]
+            The coefficients b, and the number of iterations.
+    """
+    weights = np.ones(matrix.shape[0]) if weights is None else weights
+    penalties = np.asarray(penalties, dtype=np.float64)
+
+    def normal_dot(x: np.ndarray) -> np.ndarray:
+        return matrix.transpose_dot(weights * matrix.dot(x)) + penalties * x
+
+    diagonal = matrix.column_square_sums(weights) + penalties
+    inverse_diagonal = np.divide(
+        1.0, diagonal, out=np.zeros_like(diagonal), where=diagonal > 0
+    )
+
+    rhs = matrix.transpose_dot(weights * targets)
+    threshold = tol * np.linalg.norm(rhs)
+
+    x = np.zeros(matrix.shape[1])
+    residual = rhs.copy()
+    z = inverse_diagonal * residual
+    direction = z.copy()
+    rz = residual @ z
+
+    for iteration in range(max_iter):
+        if np.linalg.norm(residual) <= threshold:
+            return x, iteration
+
+        product = normal_dot(direction)
+        step = rz / (direction @ product)
+        x += step * direction
+        residual -= step * product
+
+        z = inverse_diagonal * residual
+        rz, rz_previous = residual @ z, rz
+        direction = z + (rz / rz_previous) * direction
+
+    if np.linalg.norm(residual) > threshold:
+        warnings.warn(
+            f"The conjugate gradient did not converge in {max_iter} iterations "
+            f"(relative residual {np.linalg.norm(residual) / np.linalg.norm(rhs):.2e})."
+        )
+
+    return x, max_iter
@@ -0,0 +1,341 @@
+import pandas as pd
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from nfl_analytics.nfl_data import NflWeek
+from nfl_analytics import nfl_data
+from nfl_analytics import srs_model
+from typing import Literal
+
+# The schedule columns needed to fit and predict the games
+_SCHEDULE_COLUMNS = [
+    "game_id",
+    "season",
+    "week",
+    "home_team",
+    "away_team",
+    "home_score",
+    "away_score",
+    "location",
+]
+
+# The schedule columns needed to score the predictions
+_SCORING_COLUMNS = ["spread_line"]
+
+# The data shared with each worker process, set once by the pool initializer
+_WORKER_DATA = {}
+
+
+def _init_worker(schedules_df: pd.DataFrame, point_breakdown_df: pd.DataFrame):
+    """
+    Store the data shared by every task of a worker process.
+    """
+    _WORKER_DATA["schedules_df"] = schedules_df
+    _WORKER_DATA["point_breakdown_df"] = point_breakdown_df
+
+
+def _worker_predict_block(windows: list[tuple[NflWeek, NflWeek]]) -> pd.DataFrame:
+    """
+    Predict a block of weeks from the data shared with the worker process.
+    """
+    return _predict_block(
+        windows, _WORKER_DATA["schedules_df"], _WORKER_DATA["point_breakdown_df"]
+    )
+
+
+def _predict_block(
+    windows: list[tuple[NflWeek, NflWeek]],
+    schedules_df: pd.DataFrame,
+    point_breakdown_df: pd.DataFrame,
+) -> pd.DataFrame:
+    """
+    Predict the games of the week following each window with the SRS fit on the window.
+
+    Parameters
+    ----------
+        windows : list[tuple[NflWeek, NflWeek]]
+            The (start, end) weeks of each window (both inclusive).
+        schedules_df : pd.DataFrame
+            A DataFrame containing the schedule data, covering the windows and the predicted weeks.
+        point_breakdown_df : pd.DataFrame
+            A DataFrame containing the point breakdown data, covering the windows.
+    """
+    teams, ratings, hfa = srs_model.fit_windows(
+        windows, schedules_df, point_breakdown_df
+    )
+
+    # Get the week predicted by each window
+    target_keys = []
+    for _, end in windows:
+        target_week = NflWeek(end.season, end.week)
+        target_week.advance()
+        target_keys.append(nfl_data.week_key(target_week))
+
+    # Get the games of the predicted weeks
+    games = schedules_df.loc[
+        np.isin(nfl_data.week_key(schedules_df), target_keys),
+        ["game_id", "season", "week", "home_team", "away_team"],
+    ]
+    window_idx = pd.Index(target_keys).get_indexer(nfl_data.week_key(games))
+    non_neutral = schedules_df.loc[games.index, "location"].to_numpy() != "Neutral"
+
+    # Teams without a rating in the window gather a trailing row of NaN
+    ratings = np.concatenate((ratings, np.full((len(windows), 1, 3), np.nan)), axis=1)
+    team_index = pd.Index(teams)
+    home_codes = team_index.get_indexer(games["home_team"])
+    away_codes = team_index.get_indexer(games["away_team"])
+
+    # Spread components, then the overall spread
+    spreads = (
+        ratings[window_idx, home_codes]
+        - ratings[window_idx, away_codes]
+        + hfa[window_idx, 1:] * non_neutral[:, None]
+    )
+    games = games.assign(
+        pred_spread=ratings[window_idx, home_codes].sum(axis=1)
+        - ratings[window_idx, away_codes].sum(axis=1)
+        + hfa[window_idx, 0] * non_neutral,
+        pred_spread_O=spreads[:, 0],
+        pred_spread_D=spreads[:, 1],
+        pred_spread_ST=spreads[:, 2],
+    )
+
+    return games
+
+
+def _backtest_data(
+    first_week: NflWeek,
+    last_week: NflWeek,
+    window: int | Literal["season"] | None,
+    workers: int | None,
+) -> tuple[list[tuple[NflWeek, NflWeek]], pd.DataFrame, pd.DataFrame]:
+    """
+    Get the windows predicting each week of the backtest, and load the data covering them once.
+
+    Returns
+    -------
+        windows, schedules_df, point_breakdown_df : tuple[list, pd.DataFrame, pd.DataFrame]
+            The (start, end) weeks of each window, the schedule data of the windows and predicted weeks,
+            and the point breakdown of the windows.
+    """
+    # The windows end on the week before each predicted week
+    first_as_of, last_as_of = (
+        NflWeek(first_week.season, first_week.week),
+        NflWeek(last_week.season, last_week.week),
+    )
+    first_as_of.go_back()
+    last_as_of.go_back()
+    windows = nfl_data.week_windows(first_as_of, last_as_of, window)
+
+    # Load the data covering every window and predicted week once
+    start_week = min((start for start, _ in windows), key=nfl_data.week_key)
+    schedules_df = nfl_data.schedules(start_week, last_week)[
+        _SCHEDULE_COLUMNS + _SCORING_COLUMNS
+    ]
+    point_breakdown_df = nfl_data.point_breakdown(
+        start_week, last_as_of, workers=workers
+    )
+
+    return windows, schedules_df, point_breakdown_df
+
+
+def _predict_windows(
+    windows: list[tuple[NflWeek, NflWeek]],
+    schedules_df: pd.DataFrame,
+    point_breakdown_df: pd.DataFrame,
+    workers: int | None,
+) -> pd.DataFrame:
+    """
+    Predict the week following each window, in one block of windows per predicted season.
+
+    See `run_srs_backtest` for the returned predictions.
+    """
+    # Split the windows into one block per predicted season
+    blocks = {}
+    for start, end in windows:
+        target_week = NflWeek(end.season, end.week)
+        target_week.advance()
+        blocks.setdefault(target_week.season, []).append((start, end))
+    blocks = list(blocks.values())
+
+    # Solve the blocks, keeping the order they were submitted in
+    if workers is not None and workers > 1 and len(blocks) > 1:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(schedules_df[_SCHEDULE_COLUMNS], point_breakdown_df),
+        ) as executor:
+            predictions = list(executor.map(_worker_predict_block, blocks))
+    else:
+        predictions = [
+            _predict_block(block, schedules_df, point_breakdown_df) for block in blocks
+        ]
+
+    predictions = pd.concat(predictions)
+    predictions = predictions.sort_values(["season", "week", "game_id"])
+
+    return predictions.reset_index(drop=True)
+
+
+def run_srs_backtest(
+    first_week: NflWeek,
+    last_week: NflWeek,
+    window: int | Literal["season"] | None = "season",
+    workers: int = None,
+) -> pd.DataFrame:
+    """
+    Backtest the SRS model by predicting every game in the given range with the data available before it.
+
+    The games of each week are predicted with the SRS fit as of the previous week.
+    The data is loaded once, and the weeks are split into one block per season,
+    solved in parallel processes that each receive the data once when they start.
+
+    Parameters
+    ----------
+        first_week : NflWeek
+            The first week to predict (inclusive).
+        last_week : NflWeek
+            The last week to predict (inclusive).
+        window : int or "season", optional
+            The games used as of each week, see `nfl_data.week_windows`. Default is "season".
+            If None, the windows expand from the week before `first_week`.
+        workers : int, optional
+            The number of processes solving the seasons in parallel.
+            If not provided, the seasons are solved in the current process.
+
+    Returns
+    -------
+        pd.DataFrame
+            The "game_id", "season", "week", "home_team" and "away_team" of each game,
+            with the "pred_spread", "pred_spread_O", "pred_spread_D" and "pred_spread_ST" of the home team,
+            ordered by season, week and game id.
+    """
+    windows, schedules_df, point_breakdown_df = _backtest_data(
+        first_week, last_week, window, workers
+    )
+
+    return _predict_windows(windows, schedules_df, point_breakdown_df, workers)
+
+
+def score_srs_backtest(
+    first_week: NflWeek,
+    last_week: NflWeek,
+    window: int | Literal["season"] | None = "season",
+    workers: int = None,
+    by: Literal["week", "season"] = "week",
+) -> pd.DataFrame:
+    """
+    Backtest the SRS model and score its predicted spreads against the results and the closing lines.
+
+    The data is loaded once for every week, see `run_srs_backtest`. The predictions are joined
+    to the results and lines of the schedules by integer position, and every metric of every group
+    is accumulated at once with bincounts.
+
+    Parameters
+    ----------
+        first_week : NflWeek
+            The first week to predict (inclusive).
+        last_week : NflWeek
+            The last week to predict (inclusive).
+        window : int or "season", optional
+            The games used as of each week, see `run_srs_backtest`. Default is "season".
+        workers : int, optional
+            The number of processes solving the seasons in parallel, see `run_srs_backtest`.
+        by : {"week", "season"}
+            The groups of games scored together. Default is "week".
+
+    Returns
+    -------
+        pd.DataFrame
+            The "season" (and "week") of each group, with:
+            - "games": the number of completed games with a predicted spread
+            - "MAE", "RMSE": the mean absolute and root mean squared error of the predicted margin
+            - "bias": the mean predicted minus actual margin
+            - "calibration": the slope of the actual margin regressed on the predicted spread, 1 when calibrated
+            - "line_MAE", "line_RMSE": the errors of the closing line, for the games with a line
+            - "ATS_games", "ATS_rate": the games picked against the spread, excluding pushes
+              and predictions equal to the line, and the share of them picked correctly
+    """
+    windows, schedules_df, point_breakdown_df = _backtest_data(
+        first_week, last_week, window, workers
+    )
+    predictions = _predict_windows(windows, schedules_df, point_breakdown_df, workers)
+
+    return _score_predictions(predictions, schedules_df, by)
+
+
+def _score_predictions(
+    predictions: pd.DataFrame,
+    schedules_df: pd.DataFrame,
+    by: Literal["week", "season"],
+) -> pd.DataFrame:
+    """
+    Score the predicted spreads of `run_srs_backtest` by group, see `score_srs_backtest`.
+    """
+    if by not in ("week", "season"):
+        raise ValueError(f'Scores must be by "week" or "season", got {by}.')
+
+    # Gather the results and lines of the predicted games by their position in the schedules
+    game_codes = pd.Index(schedules_df["game_id"]).get_indexer(predictions["game_id"])
+    margins = (
+        schedules_df["home_score"].to_numpy(dtype=float)
+        - schedules_df["away_score"].to_numpy(dtype=float)
+    )[game_codes]
+    lines = schedules_df["spread_line"].to_numpy(dtype=float)[game_codes]
+    spreads = predictions["pred_spread"].to_numpy(dtype=float)
+
+    # Keep the completed games with a prediction
+    scored = ~np.isnan(margins) & ~np.isnan(spreads)
+    margins, lines, spreads = margins[scored], lines[scored], spreads[scored]
+    if by == "week":
+        keys = nfl_data.week_key(predictions)[scored]
+    else:
+        keys = predictions["season"].to_numpy()[scored]
+    group_keys, groups = np.unique(keys, return_inverse=True)
+
+    def group_sums(values: np.ndarray, mask: np.ndarray = None) -> np.ndarray:
+        weights = values if mask is None else np.where(mask, values, 0.0)
+        return np.bincount(groups, weights=weights, minlength=len(group_keys))
+
+    # The errors of the predictions
+    errors = spreads - margins
+    n_games = group_sums(np.ones(len(errors)))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        scores = {
+            "games": n_games.astype(int),
+            "MAE": group_sums(np.abs(errors)) / n_games,
+            "RMSE": np.sqrt(group_sums(errors**2) / n_games),
+            "bias": group_sums(errors) / n_games,
+        }
+
+        # The least squares slope of the margins on the spreads
+        mean_spread = group_sums(spreads) / n_games
+        mean_margin = group_sums(margins) / n_games
+        covariance = group_sums(spreads * margins) / n_games - mean_spread * mean_margin
+        variance = group_sums(spreads**2) / n_games - mean_spread**2
+        scores["calibration"] = covariance / variance
+
+        # The errors of the closing lines
+        has_line = ~np.isnan(lines)
+        n_lines = group_sums(np.ones(len(lines)), has_line)
+        line_errors = np.nan_to_num(lines - margins)
+        scores["line_MAE"] = group_sums(np.abs(line_errors), has_line) / n_lines
+        scores["line_RMSE"] = np.sqrt(group_sums(line_errors**2, has_line) / n_lines)
+
+        # The picks against the spread, without pushes and predictions on the line
+        pick = np.sign(np.nan_to_num(spreads - lines))
+        cover = np.sign(np.nan_to_num(margins - lines))
+        picked = has_line & (pick != 0) & (cover != 0)
+        n_picked = group_sums(np.ones(len(pick)), picked)
+        scores["ATS_games"] = n_picked.astype(int)
+        scores["ATS_rate"] = (
+            group_sums((pick == cover).astype(float), picked) / n_picked
+        )
+
+    if by == "week":
+        results = pd.DataFrame({"season": group_keys // 100, "week": group_keys % 100})
+    else:
+        results = pd.DataFrame({"season": group_keys})
+    for name, values in scores.items():
+        results[name] = values
+
+    return results
@@ -0,0 +1,259 @@
+import pandas as pd
+import numpy as np
+from nfl_analytics.nfl_data import NflWeek
+from nfl_analytics import nfl_data
+from nfl_analytics import _sparse
+from typing import Literal
+
+# The play types whose efficiency is rated
+_RATED_PLAY_TYPES = ["pass", "run"]
+
+# The default ridge penalty of the team ratings, in plays
+_DEFAULT_RIDGE = 100.0
+
+# The win probability of the offense beyond which a play is in garbage time
+_GARBAGE_WIN_PROBABILITY = 0.1
+
+# The yards to go of a short, and of a long, distance
+_SHORT_DISTANCE = 3
+_LONG_DISTANCE = 11
+
+# The unpenalized covariates of each play, after the intercept
+_COVARIATES = [
+    "home",
+    "down_2",
+    "down_3",
+    "down_4",
+    "short_distance",
+    "long_distance",
+    "garbage_leading",
+    "garbage_trailing",
+]
+
+# The play-by-play columns used by the regression
+_PBP_COLUMNS = [
+    "posteam",
+    "defteam",
+    "posteam_type",
+    "play_type",
+    "down",
+    "ydstogo",
+    "wp",
+    "epa",
+    "success",
+]
+
+
+def _covariate_matrix(plays: pd.DataFrame) -> np.ndarray:
+    """
+    Get the 0/1 covariates of each play, one column per entry of `_COVARIATES`.
+    """
+    down = plays["down"].to_numpy()
+    ydstogo = plays["ydstogo"].to_numpy()
+    wp = plays["wp"].to_numpy()
+
+    return np.column_stack(
+        [
+            (plays["posteam_type"] == "home").to_numpy(),
+            down == 2,
+            down == 3,
+            down == 4,
+            ydstogo <= _SHORT_DISTANCE,
+            ydstogo >= _LONG_DISTANCE,
+            wp > 1 - _GARBAGE_WIN_PROBABILITY,
+            wp < _GARBAGE_WIN_PROBABILITY,
+        ]
+    )
+
+
+class _EfficiencyFitter:
+    def __init__(
+        self,
+        start_week: NflWeek,
+        end_week: NflWeek,
+        metric: Literal["epa", "success"] = "epa",
+        ridge: float = _DEFAULT_RIDGE,
+        pbp_df: pd.DataFrame = None,
+    ):
+        """
+        Initialize the opponent-adjusted efficiency regression of the given weeks.
+
+        The metric of each pass and run play is regressed on an intercept, +1 for the offense,
+        -1 for the defense (so a positive defensive rating means a lower metric allowed),
+        and the play's covariates: the offense being at home, the down, a short or long distance to go,
+        and garbage time for a leading or trailing offense (win probability beyond 90% or below 10%).
+        The team ratings are shrunk toward 0 by the ridge penalty, which also centers them,
+        while the intercept and the covariates are not penalized.
+
+        The design has one sparse row per play, holding only the nonzero indicators,
+        and the normal equations are solved by the conjugate gradient without being formed,
+        so multi-season windows take memory linear in their plays.
+
+        Parameters
+        ----------
+            start_week : NflWeek
+                The start week of the plays (inclusive).
+            end_week : NflWeek
+                The end week of the plays (inclusive).
+            metric : {"epa", "success"}
+                The per play metric to rate.
+            ridge : float
+                The ridge penalty of the team ratings, in plays:
+                a rating is shrunk as if the team had that many more plays of average efficiency.
+                Must be positive, since the offenses (and the defenses) of the plays always sum to 1.
+            pbp_df : pd.DataFrame, optional
+                A DataFrame containing the play-by-play data for the given weeks.
+                If not provided, only the needed columns are fetched.
+        """
+        if metric not in ("epa", "success"):
+            raise ValueError(f'Metric must be "epa" or "success", got {metric}.')
+        if ridge <= 0:
+            raise ValueError(f"Ridge penalty must be positive, got {ridge}.")
+
+        self.start_week = start_week
+        self.end_week = end_week
+        self.metric = metric
+        self.ridge = ridge
+        self.pbp_df = pbp_df
+
+    def fit(self):
+        """
+        Fit the team ratings and the covariate effects.
+        """
+        self._get_data()
+        self._setup_design()
+        self._solve()
+        self._create_rating_frame()
+
+    def _get_data(self):
+        """
+        Get the rated plays of the weeks.
+        """
+        if not isinstance(self.pbp_df, pd.DataFrame):
+            self.pbp_df = nfl_data.play_by_play(
+                self.start_week, self.end_week, columns=_PBP_COLUMNS
+            )
+
+        # Keep the scrimmage plays with a down and a metric
+        self.plays = self.pbp_df.loc[
+            self.pbp_df["play_type"].isin(_RATED_PLAY_TYPES)
+            & self.pbp_df["down"].notna()
+            & self.pbp_df[self.metric].notna(),
+            _PBP_COLUMNS,
+        ]
+
+    def _setup_design(self):
+        """
+        Set up the sparse design: the intercept, the covariates, then the offensive and defensive ratings.
+        """
+        n_plays = len(self.plays)
+        n_covariates = len(_COVARIATES)
+
+        # One code per team, shared by the offensive and defensive ratings
+        codes, self.teams = pd.factorize(
+            np.concatenate(
+                [self.plays["posteam"].to_numpy(), self.plays["defteam"].to_numpy()]
+            ),
+            sort=True,
+        )
+        n_teams = len(self.teams)
+        offense_codes, defense_codes = codes[:n_plays], codes[n_plays:]
+
+        # Keep only the nonzero covariates
+        covariate_rows, covariate_cols = np.nonzero(_covariate_matrix(self.plays))
+
+        plays = np.arange(n_plays)
+        self.design = _sparse.SparseMatrix(
+            np.concatenate([plays, covariate_rows, plays, plays]),
+            np.concatenate(
+                [
+                    np.zeros(n_plays, dtype=np.intp),
+                    1 + covariate_cols,
+                    1 + n_covariates + offense_codes,
+                    1 + n_covariates + n_teams + defense_codes,
+                ]
+            ),
+            np.concatenate(
+                [
+                    np.ones(n_plays + len(covariate_rows) + n_plays),
+                    -np.ones(n_plays),
+                ]
+            ),
+            (n_plays, 1 + n_covariates + 2 * n_teams),
+        )
+
+        self.off_plays = np.bincount(offense_codes, minlength=n_teams)
+        self.def_plays = np.bincount(defense_codes, minlength=n_teams)
+
+    def _solve(self):
+        """
+        Solve the ridge regression, leaving the intercept and the covariates unpenalized.
+        """
+        n_covariates = len(_COVARIATES)
+        penalties = np.full(self.design.shape[1], float(self.ridge))
+        penalties[: 1 + n_covariates] = 0.0
+
+        coefficients, self.iterations = _sparse.solve_ridge(
+            self.design, self.plays[self.metric].to_numpy(dtype=float), penalties
+        )
+
+        n_teams = len(self.teams)
+        self.effects = pd.Series(
+            coefficients[: 1 + n_covariates], index=["intercept", *_COVARIATES]
+        )
+        self.off_ratings = coefficients[1 + n_covariates : 1 + n_covariates + n_teams]
+        self.def_ratings = coefficients[1 + n_covariates + n_teams :]
+
+    def _create_rating_frame(self):
+        """
+        Create the frame of the team ratings.
+        """
+        self.rating_frame = pd.DataFrame(
+            {
+                "Team": self.teams,
+                "off_plays": self.off_plays,
+                "def_plays": self.def_plays,
+                "off_rating": self.off_ratings,
+                "def_rating": self.def_ratings,
+                "rating": self.off_ratings + self.def_ratings,
+            }
+        )
+
+
+def efficiency_ratings(
+    start_week: NflWeek,
+    end_week: NflWeek,
+    metric: Literal["epa", "success"] = "epa",
+    ridge: float = _DEFAULT_RIDGE,
+    pbp_df: pd.DataFrame = None,
+) -> tuple[pd.DataFrame, pd.Series]:
+    """
+    Get the opponent-adjusted offensive and defensive efficiency of each team over the given weeks.
+
+    A play-level companion of the SRS: see `_EfficiencyFitter` for the regression.
+
+    Parameters
+    ----------
+        start_week : NflWeek
+            The start week of the plays (inclusive).
+        end_week : NflWeek
+            The end week of the plays (inclusive).
+        metric : {"epa", "success"}
+            The per play metric to rate. Default is "epa".
+        ridge : float
+            The ridge penalty of the team ratings, in plays. Default is 100.
+        pbp_df : pd.DataFrame, optional
+            A DataFrame containing the play-by-play data for the given weeks.
+            If not provided, only the needed columns are fetched.
+
+    Returns
+    -------
+        tuple[pd.DataFrame, pd.Series]
+            The "Team", the number of "off_plays" and "def_plays", the "off_rating" (metric added on offense),
+            "def_rating" (metric prevented on defense) and their sum "rating" of each team,
+            and the effects of the "intercept" and of each covariate.
+    """
+    fitter = _EfficiencyFitter(start_week, end_week, metric, ridge, pbp_df)
+    fitter.fit()
+
+    return fitter.rating_frame, fitter.effects
@@ -1,6 +1,8 @@
 from nfl_analytics.nfl_data.basic_data import (
     schedules,
     play_by_play,
+    participation,
+    team_descriptions,
 )
 
 
@@ -8,11 +10,21 @@ from nfl_analytics.nfl_data.advanced_data import (
     point_breakdown,
     margin_of_victory,
     home_field_advantage,
+    home_field_advantage_windows,
+    team_week_stats,
+    TeamWeekCube,
 )
 
 
 from nfl_analytics.nfl_data.utils import (
     NflWeek,
+    week_key,
     filter_data_weekly,
     filter_data_seasonaly,
+    week_windows,
+    compact_frame,
+    COMPACT_RELATIVE_ERROR,
 )
+
+
+from nfl_analytics.nfl_data.session import AnalysisSession
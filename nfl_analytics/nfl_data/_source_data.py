@@ -6,6 +6,7 @@ It supports fetching datasets such as play-by-play, rosters, injuries, and more,
 with options for caching and local storage.
 """
 
+import hashlib
 import pandas as pd
 from nfl_analytics import _local_storage
 from typing import Literal, Callable
@@ -123,6 +124,51 @@ _SOURCE_FUNCTIONS: dict[str, Callable[[dict], pd.DataFrame]] = {
 }
 
 
+def _filename(data_type: str, args: dict = None) -> str:
+    """
+    Get the name of the local file storing the given data.
+
+    Parameters
+    ----------
+    data_type : str
+        The type of data.
+    args : dict
+        The arguments passed to the source function.
+    """
+    filename = f"{data_type}.parquet"
+    if args:
+        args_str = "-".join([f"{k}={v}" for k, v in sorted(args.items())])
+        filename = f"{data_type}-{args_str}.parquet"
+
+    return filename
+
+
+def fingerprint(sources: list[tuple[str, dict]]) -> str:
+    """
+    Fingerprint the local files of the given data from their sizes and modification times.
+
+    The fingerprint changes whenever one of the files is refreshed, created or removed,
+    without reading any of them.
+
+    Parameters
+    ----------
+    sources : list[tuple[str, dict]]
+        The data type and source function arguments (or None) of each file.
+
+    Returns
+    -------
+    str
+        A hex digest of the state of the files.
+    """
+    digest = hashlib.sha256()
+    for data_type, args in sources:
+        filename = _filename(data_type, args)
+        file_state = _local_storage.file_fingerprint(_DATASTORE_SUBDIR, filename)
+        digest.update(f"{filename}:{file_state}\n".encode())
+
+    return digest.hexdigest()
+
+
 def get(
     data_type: Literal[
         "players",
@@ -148,6 +194,7 @@ def get(
     ],
     force_refresh: bool = False,
     args: dict = None,
+    columns: list[str] = None,
 ) -> pd.DataFrame:
     """
     Get the specific data from the web or from the local storage.
@@ -160,17 +207,17 @@ def get(
         If True, we automatically get the most up-to-date data from NFL Verse and overwrite the local file.
     args : dict
         The arguments to pass to the source function.
+    columns : list[str], optional
+        The columns to return. If not provided, all columns are returned.
+        Only these columns are read when loading from the local storage.
     """
     # the file name to save the data to
-    filename = f"{data_type}.parquet"
-    if args:
-        args_str = "-".join([f"{k}={v}" for k, v in sorted(args.items())])
-        filename = f"{data_type}-{args_str}.parquet"
+    filename = _filename(data_type, args)
 
     # if we are not forcing a refresh and the file exists, load the file, otherwise imprort from NFL Verse
     if not force_refresh and _local_storage.file_exists(_DATASTORE_SUBDIR, filename):
         # load the file
-        df = _local_storage.load_frame(_DATASTORE_SUBDIR, filename)
+        df = _local_storage.load_frame(_DATASTORE_SUBDIR, filename, columns)
 
         return df
     else:
@@ -180,4 +227,7 @@ def get(
         # dump the file
         _local_storage.dump_frame(df, _DATASTORE_SUBDIR, filename)
 
+        if columns is not None:
+            df = df[columns]
+
         return df
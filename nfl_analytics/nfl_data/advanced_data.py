@@ -1,46 +1,41 @@
 import pandas as pd
-from nfl_analytics.nfl_data import basic_data
+from nfl_analytics.nfl_data import basic_data, utils, _source_data
 from nfl_analytics.nfl_data.utils import NflWeek
 import numpy as np
-
-
-def point_breakdown(
-    start_week: NflWeek, end_week: NflWeek, pbp_df: pd.DataFrame = None
-) -> pd.DataFrame:
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Sequence
+
+if TYPE_CHECKING:
+    from nfl_analytics.nfl_data.session import AnalysisSession
+
+# The play-by-play columns needed for the point breakdown
+_POINT_BREAKDOWN_COLUMNS = [
+    "game_id",
+    "home_team",
+    "away_team",
+    "posteam",
+    "defteam",
+    "posteam_score",
+    "defteam_score",
+    "posteam_score_post",
+    "defteam_score_post",
+    "special",
+]
+
+
+def _reduce_point_breakdown(pbp_df: pd.DataFrame) -> pd.DataFrame:
     """
-    Get the point breakdown for each game during the given weeks.
+    Reduce play-by-play data to the point breakdown of each game.
 
     Parameters
     ----------
-        start_week : NflWeek
-            The start week to filter from (inclusive).
-        end_week : NflWeek
-            The end week to filter to (inclusive).
-        pbp_df : pd.DataFrame, optional
-            A DataFrame containing the play-by-play data for the given seasons.
-            If not provided, it will be fetched.
-            Useful for reducing IO calls when the data is already readily available.
+        pbp_df : pd.DataFrame
+            A DataFrame containing the play-by-play data.
     """
-    # Get the play-by-play data for the given weeks if necessary
-    if not isinstance(pbp_df, pd.DataFrame):
-        pbp_df = basic_data.play_by_play(start_week, end_week)
-
     # Get only scoring plays and relevant columns
     pbp_df = pbp_df[pbp_df["sp"].astype(bool)]
-    pbp_df = pbp_df[
-        [
-            "game_id",
-            "home_team",
-            "away_team",
-            "posteam",
-            "defteam",
-            "posteam_score",
-            "defteam_score",
-            "posteam_score_post",
-            "defteam_score_post",
-            "special",
-        ]
-    ]
+    pbp_df = pbp_df[_POINT_BREAKDOWN_COLUMNS]
     pbp_df["special"] = pbp_df["special"].astype(bool)
 
     # =======================================================================
@@ -119,8 +114,92 @@ def point_breakdown(
     return point_breakdown
 
 
+def _season_point_breakdown(start_week: NflWeek, end_week: NflWeek) -> pd.DataFrame:
+    """
+    Get the point breakdown for weeks within a single season.
+
+    Only the needed play-by-play columns of the season are loaded.
+
+    Parameters
+    ----------
+        start_week : NflWeek
+            The start week to filter from (inclusive).
+        end_week : NflWeek
+            The end week to filter to (inclusive), in the same season as `start_week`.
+    """
+    pbp_df = basic_data.play_by_play(
+        start_week, end_week, columns=["sp", *_POINT_BREAKDOWN_COLUMNS]
+    )
+
+    return _reduce_point_breakdown(pbp_df)
+
+
+def point_breakdown(
+    start_week: NflWeek,
+    end_week: NflWeek,
+    pbp_df: pd.DataFrame = None,
+    workers: int = None,
+    compact: bool = False,
+) -> pd.DataFrame:
+    """
+    Get the point breakdown for each game during the given weeks.
+
+    When the play-by-play data is fetched, each season is loaded and reduced to game level one at a time,
+    so memory is bounded by the largest single season.
+
+    Parameters
+    ----------
+        start_week : NflWeek
+            The start week to filter from (inclusive).
+        end_week : NflWeek
+            The end week to filter to (inclusive).
+        pbp_df : pd.DataFrame, optional
+            A DataFrame containing the play-by-play data for the given seasons.
+            If not provided, it will be fetched.
+            Useful for reducing IO calls when the data is already readily available.
+        workers : int, optional
+            The number of processes used to reduce the seasons in parallel when the data is fetched.
+            If not provided, the seasons are reduced in the current process.
+        compact : bool
+            If True, the breakdown is returned in float32, see `utils.compact_frame` for the precision bound.
+    """
+    if utils.week_key(start_week) > utils.week_key(end_week):
+        raise ValueError(
+            f"Start week {start_week.season}-{start_week.week} is after "
+            f"end week {end_week.season}-{end_week.week}."
+        )
+
+    # Reduce the given play-by-play data directly
+    if isinstance(pbp_df, pd.DataFrame):
+        breakdown = _reduce_point_breakdown(pbp_df)
+        return utils.compact_frame(breakdown) if compact else breakdown
+
+    # Split the weeks into one chunk per season
+    chunks = [
+        (
+            start_week if season == start_week.season else NflWeek(season, 1),
+            end_week if season == end_week.season else NflWeek(season, 22),
+        )
+        for season in range(start_week.season, end_week.season + 1)
+    ]
+
+    # Reduce each season to game level before loading the next
+    if workers is not None and workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            breakdowns = list(executor.map(_season_point_breakdown, *zip(*chunks)))
+    else:
+        breakdowns = [_season_point_breakdown(*chunk) for chunk in chunks]
+
+    breakdown = pd.concat(breakdowns)
+    return utils.compact_frame(breakdown) if compact else breakdown
+
+
 def margin_of_victory(
-    start_week: NflWeek, end_week: NflWeek, schedules_df: pd.DataFrame = None
+    start_week: NflWeek,
+    end_week: NflWeek,
+    schedules_df: pd.DataFrame = None,
+    session: "AnalysisSession" = None,
+    compact: bool = False,
 ) -> pd.DataFrame:
     """
     Get the margin of victory (MoV) for each game in a given week.
@@ -135,7 +214,23 @@ def margin_of_victory(
             A DataFrame containing the schedule data for the given seasons.
             If not provided, it will be fetched.
             Useful for reducing IO calls when the data is already readily available.
+        session : AnalysisSession, optional
+            A session covering the given weeks, used when `schedules_df` is not provided.
+            The schedules are then loaded at most once, and the result is memoized in the session.
+        compact : bool
+            If True, the margins are returned in float32 with categorical teams,
+            see `utils.compact_frame` for the precision bound. The session memoizes the full precision result.
     """
+    # Get the memoized result of the session if possible
+    if session is not None and not isinstance(schedules_df, pd.DataFrame):
+        mov = session.memoize(
+            ("margin_of_victory", utils.week_key(start_week), utils.week_key(end_week)),
+            lambda: margin_of_victory(
+                start_week, end_week, session.schedules(start_week, end_week)
+            ),
+        )
+        return utils.compact_frame(mov) if compact else mov
+
     # Get the schedule data for the given weeks if necessary
     if not isinstance(schedules_df, pd.DataFrame):
         schedules_df = basic_data.schedules(start_week, end_week)
@@ -157,7 +252,7 @@ def margin_of_victory(
     mov = mov.reset_index()
     mov = mov.sort_values(by="Team")
 
-    return mov
+    return utils.compact_frame(mov) if compact else mov
 
 
 def home_field_advantage(
@@ -165,6 +260,7 @@ def home_field_advantage(
     end_week: NflWeek,
     schedules_df: pd.DataFrame = None,
     point_breakdown_df: pd.DataFrame = None,
+    session: "AnalysisSession" = None,
 ) -> tuple[float, float, float, float]:
     """
     Get the home field advantage (HFA) for each team in a given week.
@@ -179,11 +275,34 @@ def home_field_advantage(
             A DataFrame containing the point breakdown data for the given seasons.
             If not provided, it will be fetched.
             Useful for reducing IO calls when the data is already readily available.
+        session : AnalysisSession, optional
+            A session covering the given weeks, used when neither DataFrame is provided.
+            The data is then loaded at most once, and the result is memoized in the session.
 
     Returns
     -------
         hfa, hfa_o, hfa_d, hfa_st : tuple[float, float, float, float]
     """
+    # Get the memoized result of the session if possible
+    if (
+        session is not None
+        and not isinstance(schedules_df, pd.DataFrame)
+        and not isinstance(point_breakdown_df, pd.DataFrame)
+    ):
+        return session.memoize(
+            (
+                "home_field_advantage",
+                utils.week_key(start_week),
+                utils.week_key(end_week),
+            ),
+            lambda: home_field_advantage(
+                start_week,
+                end_week,
+                session.schedules(start_week, end_week),
+                session.point_breakdown(start_week, end_week),
+            ),
+        )
+
     # Get the schedule data for the given weeks if necessary
     if not isinstance(schedules_df, pd.DataFrame):
         schedules_df = basic_data.schedules(start_week, end_week)
@@ -217,3 +336,614 @@ def home_field_advantage(
     hfa = hfa_o + hfa_d + hfa_st
 
     return hfa, hfa_o, hfa_d, hfa_st
+
+
+# The per-team metrics accumulated by `TeamWeekCube`, in cube order
+_CUBE_METRICS = (
+    "scheduled",
+    "games",
+    "points_scored",
+    "points_allowed",
+    "breakdown_games",
+    "offensive_points",
+    "defensive_points",
+    "special_teams_points",
+    "offensive_points_allowed",
+    "defensive_points_allowed",
+    "special_teams_points_allowed",
+)
+
+# The league-wide sums over non-neutral games used for the home field advantage
+_CUBE_HFA_SUMS = (
+    "count",
+    "home_offensive_points",
+    "away_offensive_points",
+    "home_defensive_points",
+    "away_defensive_points",
+    "home_special_teams_points",
+    "away_special_teams_points",
+)
+
+
+class TeamWeekCube:
+    """
+    Cumulative (week × team × metric) aggregates for constant time range queries.
+
+    The cube is built once from the schedules and point breakdown of a range of weeks.
+    Any query over a contiguous sub-range is then answered by differencing two prefix slices.
+    """
+
+    def __init__(
+        self,
+        start_week: NflWeek,
+        end_week: NflWeek,
+        schedules_df: pd.DataFrame = None,
+        point_breakdown_df: pd.DataFrame = None,
+    ):
+        """
+        Build the cube for the given weeks.
+
+        Parameters
+        ----------
+            start_week : NflWeek
+                The start week of the cube (inclusive).
+            end_week : NflWeek
+                The end week of the cube (inclusive).
+            schedules_df : pd.DataFrame, optional
+                A DataFrame containing the schedule data for the given weeks.
+                If not provided, it will be fetched.
+            point_breakdown_df : pd.DataFrame, optional
+                A DataFrame containing the point breakdown data for the given weeks.
+                If not provided, it will be fetched.
+                Games missing from the schedules are not included in the cube.
+        """
+        # Get the schedule and point breakdown data for the given weeks if necessary
+        if not isinstance(schedules_df, pd.DataFrame):
+            schedules_df = basic_data.schedules(start_week, end_week)
+        if not isinstance(point_breakdown_df, pd.DataFrame):
+            point_breakdown_df = point_breakdown(start_week, end_week)
+
+        # Index the weeks and teams present in the schedules
+        week_keys = utils.week_key(schedules_df)
+        self.week_keys = np.unique(week_keys)
+        self.teams = np.array(
+            sorted(
+                pd.concat(
+                    (schedules_df["home_team"], schedules_df["away_team"])
+                ).unique()
+            ),
+            dtype=object,
+        )
+
+        self._build_team_cube(schedules_df, point_breakdown_df, week_keys)
+        self._build_hfa_cube(schedules_df, point_breakdown_df, week_keys)
+
+    def _build_team_cube(
+        self,
+        schedules_df: pd.DataFrame,
+        point_breakdown_df: pd.DataFrame,
+        week_keys: np.ndarray,
+    ):
+        """
+        Build the cumulative per-team metrics.
+        """
+        n_weeks, n_teams = len(self.week_keys), len(self.teams)
+        cube = np.zeros((n_weeks, n_teams, len(_CUBE_METRICS)))
+        metric = {name: i for i, name in enumerate(_CUBE_METRICS)}
+
+        # Schedule based metrics for both sides of each game
+        week_idx = np.searchsorted(self.week_keys, week_keys)
+        home_score = schedules_df["home_score"].to_numpy(dtype=float)
+        away_score = schedules_df["away_score"].to_numpy(dtype=float)
+        for team_col, scored, allowed in (
+            ("home_team", home_score, away_score),
+            ("away_team", away_score, home_score),
+        ):
+            team_idx = np.searchsorted(self.teams, schedules_df[team_col].to_numpy())
+            flat = week_idx * n_teams + team_idx
+            for name, values in (
+                ("scheduled", np.ones(len(flat))),
+                ("games", ~np.isnan(scored)),
+                ("points_scored", np.nan_to_num(scored)),
+                ("points_allowed", np.nan_to_num(allowed)),
+            ):
+                cube[..., metric[name]] += np.bincount(
+                    flat, weights=values, minlength=n_weeks * n_teams
+                ).reshape(n_weeks, n_teams)
+
+        # Point breakdown metrics, placed in the week of the scheduled game
+        games = pd.Series(week_keys, index=schedules_df["game_id"].to_numpy())
+        pb_keys = games.reindex(point_breakdown_df.index).to_numpy()
+        pb_df = point_breakdown_df[~np.isnan(pb_keys)]
+        pb_week_idx = np.searchsorted(self.week_keys, pb_keys[~np.isnan(pb_keys)])
+        for side, other in (("home", "away"), ("away", "home")):
+            team_idx = np.searchsorted(self.teams, pb_df[f"{side}_team"].to_numpy())
+            flat = pb_week_idx * n_teams + team_idx
+            columns = [("breakdown_games", np.ones(len(flat)))]
+            for unit in ("offensive", "defensive", "special_teams"):
+                columns.append(
+                    (f"{unit}_points", pb_df[f"{side}_{unit}_points"].to_numpy())
+                )
+                columns.append(
+                    (
+                        f"{unit}_points_allowed",
+                        pb_df[f"{other}_{unit}_points"].to_numpy(),
+                    )
+                )
+            for name, values in columns:
+                cube[..., metric[name]] += np.bincount(
+                    flat, weights=values, minlength=n_weeks * n_teams
+                ).reshape(n_weeks, n_teams)
+
+        # Prefix sums with a leading row of zeros
+        self._team_prefix = np.concatenate(
+            (np.zeros((1, n_teams, len(_CUBE_METRICS))), np.cumsum(cube, axis=0))
+        )
+
+    def _build_hfa_cube(
+        self,
+        schedules_df: pd.DataFrame,
+        point_breakdown_df: pd.DataFrame,
+        week_keys: np.ndarray,
+    ):
+        """
+        Build the cumulative league-wide sums for the home field advantage.
+        """
+        # Only games played at the home team's stadium count towards the HFA
+        games = pd.DataFrame(
+            {
+                "key": week_keys,
+                "neutral": schedules_df["location"].to_numpy() == "Neutral",
+            },
+            index=schedules_df["game_id"].to_numpy(),
+        ).reindex(point_breakdown_df.index)
+        mask = (
+            games["key"].notna().to_numpy() & ~games["neutral"].astype(bool).to_numpy()
+        )
+        pb_df = point_breakdown_df[mask]
+        week_idx = np.searchsorted(self.week_keys, games["key"].to_numpy()[mask])
+
+        n_weeks = len(self.week_keys)
+        sums = np.zeros((n_weeks, len(_CUBE_HFA_SUMS)))
+        sums[:, 0] = np.bincount(week_idx, minlength=n_weeks)
+        for i, name in enumerate(_CUBE_HFA_SUMS[1:], start=1):
+            sums[:, i] = np.bincount(
+                week_idx, weights=pb_df[name].to_numpy(), minlength=n_weeks
+            )
+
+        self._hfa_prefix = np.concatenate(
+            (np.zeros((1, len(_CUBE_HFA_SUMS))), np.cumsum(sums, axis=0))
+        )
+
+    def window_bounds(
+        self, windows: list[tuple[NflWeek, NflWeek]]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get the prefix slice bounds of many week windows.
+
+        Parameters
+        ----------
+            windows : list[tuple[NflWeek, NflWeek]]
+                The (start, end) weeks of each window (both inclusive).
+
+        Returns
+        -------
+            lower, upper : tuple[np.ndarray, np.ndarray]
+                The sums over each window are `prefix[upper] - prefix[lower]`,
+                with prefix row `i` holding the sums of the first `i` weeks in `week_keys`.
+        """
+        start_keys = np.array(
+            [utils.week_key(start) for start, _ in windows], dtype=int
+        )
+        end_keys = np.array([utils.week_key(end) for _, end in windows], dtype=int)
+        lower = np.searchsorted(self.week_keys, start_keys, side="left")
+        upper = np.searchsorted(self.week_keys, end_keys, side="right")
+
+        return lower, np.maximum(lower, upper)
+
+    def team_totals_windows(self, windows: list[tuple[NflWeek, NflWeek]]) -> np.ndarray:
+        """
+        Get the summed metrics of every team for many week windows at once.
+
+        Parameters
+        ----------
+            windows : list[tuple[NflWeek, NflWeek]]
+                The (start, end) weeks of each window (both inclusive).
+
+        Returns
+        -------
+            np.ndarray
+                An array of shape (len(windows), len(teams), len(_CUBE_METRICS)).
+                Teams not scheduled during a window have a "scheduled" count of 0.
+        """
+        lower, upper = self.window_bounds(windows)
+
+        return self._team_prefix[upper] - self._team_prefix[lower]
+
+    def margin_of_victory_windows(
+        self, windows: list[tuple[NflWeek, NflWeek]]
+    ) -> np.ndarray:
+        """
+        Get the margin of victory (MoV) of every team for many week windows at once.
+
+        Parameters
+        ----------
+            windows : list[tuple[NflWeek, NflWeek]]
+                The (start, end) weeks of each window (both inclusive).
+
+        Returns
+        -------
+            np.ndarray
+                An array of shape (len(windows), len(teams)),
+                NaN for teams not scheduled during a window.
+        """
+        totals = self.team_totals_windows(windows)
+        metric = {name: i for i, name in enumerate(_CUBE_METRICS)}
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mov = (
+                totals[..., metric["points_scored"]]
+                - totals[..., metric["points_allowed"]]
+            ) / totals[..., metric["games"]]
+        mov[totals[..., metric["scheduled"]] == 0] = np.nan
+
+        return mov
+
+    def team_totals(self, start_week: NflWeek, end_week: NflWeek) -> pd.DataFrame:
+        """
+        Get the summed metrics of each team scheduled during the given weeks.
+
+        Parameters
+        ----------
+            start_week : NflWeek
+                The start week to sum from (inclusive).
+            end_week : NflWeek
+                The end week to sum to (inclusive).
+
+        Returns
+        -------
+            pd.DataFrame
+                One row per team with a column for each metric in the cube.
+        """
+        totals = self.team_totals_windows([(start_week, end_week)])[0]
+        mask = totals[:, 0] > 0
+
+        totals_df = pd.DataFrame(totals[mask], columns=list(_CUBE_METRICS))
+        totals_df.insert(0, "Team", pd.Series(self.teams[mask].tolist()))
+
+        return totals_df
+
+    def margin_of_victory(self, start_week: NflWeek, end_week: NflWeek) -> pd.DataFrame:
+        """
+        Get the margin of victory (MoV) of each team during the given weeks.
+
+        Matches `margin_of_victory` for the same weeks.
+
+        Parameters
+        ----------
+            start_week : NflWeek
+                The start week to filter from (inclusive).
+            end_week : NflWeek
+                The end week to filter to (inclusive).
+        """
+        totals = self.team_totals(start_week, end_week)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mov = (totals["points_scored"] - totals["points_allowed"]) / totals["games"]
+
+        return pd.DataFrame({"Team": totals["Team"], "MoV": mov})
+
+    def points_per_game(self, start_week: NflWeek, end_week: NflWeek) -> pd.DataFrame:
+        """
+        Get the points scored and allowed per game by each team during the given weeks.
+
+        Parameters
+        ----------
+            start_week : NflWeek
+                The start week to filter from (inclusive).
+            end_week : NflWeek
+                The end week to filter to (inclusive).
+
+        Returns
+        -------
+            pd.DataFrame
+                Columns "PF" and "PA" are per scheduled game with a score,
+                the offensive/defensive/special teams splits ("PF_O", "PA_O", ...) are per game in the point breakdown.
+        """
+        totals = self.team_totals(start_week, end_week)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ppg = pd.DataFrame(
+                {
+                    "Team": totals["Team"],
+                    "PF": totals["points_scored"] / totals["games"],
+                    "PA": totals["points_allowed"] / totals["games"],
+                }
+            )
+            for unit, suffix in (
+                ("offensive", "O"),
+                ("defensive", "D"),
+                ("special_teams", "ST"),
+            ):
+                ppg[f"PF_{suffix}"] = (
+                    totals[f"{unit}_points"] / totals["breakdown_games"]
+                )
+                ppg[f"PA_{suffix}"] = (
+                    totals[f"{unit}_points_allowed"] / totals["breakdown_games"]
+                )
+
+        return ppg
+
+    def home_field_advantage(
+        self, start_week: NflWeek, end_week: NflWeek
+    ) -> tuple[float, float, float, float]:
+        """
+        Get the home field advantage (HFA) during the given weeks.
+
+        Matches `home_field_advantage` for the same weeks.
+
+        Parameters
+        ----------
+            start_week : NflWeek
+                The start week to filter from (inclusive).
+            end_week : NflWeek
+                The end week to filter to (inclusive).
+
+        Returns
+        -------
+            hfa, hfa_o, hfa_d, hfa_st : tuple[float, float, float, float]
+        """
+        hfa = self.home_field_advantage_windows([(start_week, end_week)])[0]
+
+        return tuple(float(value) for value in hfa)
+
+    def home_field_advantage_windows(
+        self, windows: list[tuple[NflWeek, NflWeek]]
+    ) -> np.ndarray:
+        """
+        Get the home field advantage (HFA) for many week windows at once.
+
+        Parameters
+        ----------
+            windows : list[tuple[NflWeek, NflWeek]]
+                The (start, end) weeks of each window (both inclusive).
+                See `utils.week_windows` for building rolling windows.
+
+        Returns
+        -------
+            np.ndarray
+                An array of shape (len(windows), 4) with columns hfa, hfa_o, hfa_d, hfa_st.
+        """
+        lower, upper = self.window_bounds(windows)
+        sums = self._hfa_prefix[upper] - self._hfa_prefix[lower]
+        count = sums[:, 0]
+
+        # Difference of the home and away means of each unit
+        hfa = np.empty((len(windows), 4))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            hfa[:, 1] = sums[:, 1] / count - sums[:, 2] / count
+            hfa[:, 2] = sums[:, 3] / count - sums[:, 4] / count
+            hfa[:, 3] = sums[:, 5] / count - sums[:, 6] / count
+        hfa[:, 0] = hfa[:, 1] + hfa[:, 2] + hfa[:, 3]
+
+        return hfa
+
+
+def home_field_advantage_windows(
+    windows: list[tuple[NflWeek, NflWeek]],
+    schedules_df: pd.DataFrame = None,
+    point_breakdown_df: pd.DataFrame = None,
+) -> np.ndarray:
+    """
+    Get the home field advantage (HFA) for many week windows at once.
+
+    The league-wide sums are computed once and shared by every window.
+
+    Parameters
+    ----------
+        windows : list[tuple[NflWeek, NflWeek]]
+            The (start, end) weeks of each window (both inclusive).
+            See `utils.week_windows` for building rolling windows.
+        schedules_df : pd.DataFrame, optional
+            A DataFrame containing the schedule data covering every window.
+            If not provided, it will be fetched.
+        point_breakdown_df : pd.DataFrame, optional
+            A DataFrame containing the point breakdown data covering every window.
+            If not provided, it will be fetched.
+
+    Returns
+    -------
+        np.ndarray
+            An array of shape (len(windows), 4) with columns hfa, hfa_o, hfa_d, hfa_st.
+    """
+    # Build the cube over the union of all the windows
+    start_week = min((start for start, _ in windows), key=utils.week_key)
+    end_week = max((end for _, end in windows), key=utils.week_key)
+    cube = TeamWeekCube(start_week, end_week, schedules_df, point_breakdown_df)
+
+    return cube.home_field_advantage_windows(windows)
+
+
+# The efficiency metrics available in `team_week_stats`.
+# Each metric is the mean of a pbp column over the plays of a given type (None for all plays).
+_TEAM_WEEK_METRICS = {
+    "epa": ("epa", None),
+    "success_rate": ("success", None),
+    "yards_per_play": ("yards_gained", None),
+    "pass_epa": ("epa", "pass"),
+    "pass_success_rate": ("success", "pass"),
+    "pass_yards_per_play": ("yards_gained", "pass"),
+    "rush_epa": ("epa", "rush"),
+    "rush_success_rate": ("success", "rush"),
+    "rush_yards_per_play": ("yards_gained", "rush"),
+}
+
+
+# Per-season `team_week_stats` results, keyed by season,
+# with the fingerprint of the season's play-by-play file they were computed from
+_TEAM_WEEK_STATS_CACHE: dict[int, tuple[str, pd.DataFrame]] = {}
+
+# Guards the reads and writes of `_TEAM_WEEK_STATS_CACHE`, which is shared by the threads of a process.
+# Entries are replaced whole and never changed in place, so the computations run outside the lock
+# and concurrent writers of a season at most drop metrics that are then recomputed.
+_TEAM_WEEK_STATS_LOCK = threading.Lock()
+
+
+def _pbp_fingerprint(season: int) -> str:
+    """
+    Fingerprint the local play-by-play file of a season, see `_source_data.fingerprint`.
+    """
+    return _source_data.fingerprint([("pbp", {"year": season})])
+
+
+def _season_team_week_stats(
+    season: int, metrics: list[str], force_refresh: bool = False
+) -> pd.DataFrame:
+    """
+    Compute the team-week efficiency metrics for every week of a season.
+
+    Parameters
+    ----------
+        season : int
+            The season to compute.
+        metrics : list[str]
+            The metrics to compute, keys of `_TEAM_WEEK_METRICS`.
+        force_refresh : bool
+            If True, we automatically get the most up-to-date data from NFL Verse and overwrite the local file.
+    """
+    # Load only the columns needed by the requested metrics
+    value_columns = sorted({_TEAM_WEEK_METRICS[metric][0] for metric in metrics})
+    pbp_df = basic_data.play_by_play(
+        NflWeek(season, 1),
+        NflWeek(season, 22),
+        force_refresh,
+        ["posteam", "defteam", "pass", "rush", *value_columns],
+    )
+
+    # Keep only the offensive plays
+    is_pass = (pbp_df["pass"] == 1).to_numpy()
+    is_rush = (pbp_df["rush"] == 1).to_numpy()
+    plays = pbp_df[is_pass | is_rush]
+    play_types = {None: np.ones(len(plays), dtype=bool)}
+    play_types["pass"] = is_pass[is_pass | is_rush]
+    play_types["rush"] = is_rush[is_pass | is_rush]
+
+    # Categorical team and week codes shared by the offense and defense
+    teams = np.array(
+        sorted(pd.concat((plays["posteam"], plays["defteam"])).dropna().unique()),
+        dtype=object,
+    )
+    weeks, week_codes = np.unique(plays["week"].to_numpy(), return_inverse=True)
+    n_cells = len(weeks) * len(teams)
+
+    stats = {}
+    for side, team_col in (("off", "posteam"), ("def", "defteam")):
+        team_codes = pd.Categorical(plays[team_col], categories=teams).codes
+        valid = team_codes >= 0
+        cell = week_codes * len(teams) + team_codes
+
+        stats[f"{side}_plays"] = np.bincount(cell[valid], minlength=n_cells)
+        for metric in metrics:
+            column, play_type = _TEAM_WEEK_METRICS[metric]
+            values = plays[column].to_numpy(dtype=float)
+            mask = valid & play_types[play_type] & ~np.isnan(values)
+            totals = np.bincount(cell[mask], weights=values[mask], minlength=n_cells)
+            counts = np.bincount(cell[mask], minlength=n_cells)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                stats[f"{side}_{metric}"] = totals / counts
+
+    # One row for each team-week with at least one play
+    stats_df = pd.DataFrame(
+        {
+            "season": season,
+            "week": np.repeat(weeks, len(teams)),
+            "team": np.tile(teams, len(weeks)),
+            **stats,
+        }
+    )
+    stats_df = stats_df[(stats_df["off_plays"] > 0) | (stats_df["def_plays"] > 0)]
+
+    return stats_df.reset_index(drop=True)
+
+
+def team_week_stats(
+    start_week: NflWeek,
+    end_week: NflWeek,
+    metrics: Sequence[str] = ("epa", "success_rate", "yards_per_play"),
+    force_refresh: bool = False,
+    compact: bool = False,
+) -> pd.DataFrame:
+    """
+    Get the offensive and defensive efficiency of each team in each of the given weeks.
+
+    All metrics are computed in one grouped pass over the play-by-play data,
+    loading only the needed columns. Results are cached per season,
+    and recomputed once the season's play-by-play file changes (e.g. new weeks are downloaded).
+    The cache is safe to share between threads, each process keeps its own.
+
+    Parameters
+    ----------
+        start_week : NflWeek
+            The start week to filter from (inclusive).
+        end_week : NflWeek
+            The end week to filter to (inclusive).
+        metrics : Sequence[str]
+            The metrics to compute. Any of "epa", "success_rate", "yards_per_play",
+            optionally prefixed with "pass_" or "rush_" for the pass/rush splits.
+        force_refresh : bool
+            If True, we automatically get the most up-to-date data from NFL Verse and overwrite the local file.
+        compact : bool
+            If True, the stats are returned in float32 with categorical teams and int16 weeks,
+            see `utils.compact_frame` for the precision bound. The cache keeps the full precision stats.
+
+    Returns
+    -------
+        pd.DataFrame
+            One row per team-week with the "off_plays" and "def_plays" counts,
+            and the per play "off_{metric}" and "def_{metric}" of each metric.
+    """
+    metrics = list(metrics)
+    if not metrics:
+        raise ValueError("At least one metric is needed.")
+    unknown = [metric for metric in metrics if metric not in _TEAM_WEEK_METRICS]
+    if unknown:
+        raise ValueError(
+            f"Unknown metrics {unknown}. Choose from {list(_TEAM_WEEK_METRICS)}."
+        )
+
+    frames = []
+    for season in range(start_week.season, end_week.season + 1):
+        # Compute the metrics missing from the cache for this season,
+        # discarding the cached metrics if the play-by-play file changed since
+        cached_df = None
+        with _TEAM_WEEK_STATS_LOCK:
+            cached = None if force_refresh else _TEAM_WEEK_STATS_CACHE.get(season)
+        if cached is not None and cached[0] == _pbp_fingerprint(season):
+            cached_df = cached[1]
+        missing = [
+            metric
+            for metric in metrics
+            if cached_df is None or f"off_{metric}" not in cached_df
+        ]
+        if missing:
+            season_df = _season_team_week_stats(season, missing, force_refresh)
+            if cached_df is not None:
+                season_df = cached_df.merge(
+                    season_df, on=["season", "week", "team", "off_plays", "def_plays"]
+                )
+            # Fingerprint the file after loading it, since loading may download it
+            fingerprint = _pbp_fingerprint(season)
+            with _TEAM_WEEK_STATS_LOCK:
+                _TEAM_WEEK_STATS_CACHE[season] = (fingerprint, season_df)
+            cached_df = season_df
+
+        columns = ["season", "week", "team", "off_plays", "def_plays"]
+        columns += [f"off_{metric}" for metric in metrics]
+        columns += [f"def_{metric}" for metric in metrics]
+        frames.append(cached_df[columns])
+
+    stats_df = pd.concat(frames, ignore_index=True)
+    stats_df = utils.filter_data_weekly(stats_df, start_week, end_week)
+    stats_df = stats_df.reset_index(drop=True)
+
+    return utils.compact_frame(stats_df) if compact else stats_df
@@ -25,7 +25,10 @@ def schedules(
 
 
 def play_by_play(
-    start_week: NflWeek, end_week: NflWeek, force_refresh: bool = False
+    start_week: NflWeek,
+    end_week: NflWeek,
+    force_refresh: bool = False,
+    columns: list[str] = None,
 ) -> pd.DataFrame:
     """
     Get the play-by-play data for the given weeks.
@@ -38,13 +41,79 @@ def play_by_play(
             The end week to get data to (inclusive).
         force_refresh : bool
             If True, we automatically get the most up-to-date data from NFL Verse and overwrite the local file.
+        columns : list[str], optional
+            The columns to load. If not provided, all columns are loaded.
+            The "season" and "week" columns are always loaded for filtering.
     """
+    # Always load the columns needed to filter the weeks
+    if columns is not None:
+        columns = list(dict.fromkeys(["season", "week", *columns]))
+
     df = pd.concat(
         [
-            _source_data.get("pbp", force_refresh, {"year": year})
+            _source_data.get("pbp", force_refresh, {"year": year}, columns)
             for year in range(start_week.season, end_week.season + 1)
         ]
     )
     df = utils.filter_data_weekly(df, start_week, end_week)
 
     return df
+
+
+def participation(
+    start_week: NflWeek,
+    end_week: NflWeek,
+    force_refresh: bool = False,
+    columns: list[str] = None,
+) -> pd.DataFrame:
+    """
+    Get the players on the field of each play for the given weeks.
+
+    The season and week of each play are parsed from its "nflverse_game_id",
+    and the weeks are filtered as in `play_by_play`.
+
+    Parameters
+    ----------
+        start_week : NflWeek
+            The start week to get data from (inclusive).
+        end_week : NflWeek
+            The end week to get data to (inclusive).
+        force_refresh : bool
+            If True, we automatically get the most up-to-date data from NFL Verse and overwrite the local file.
+        columns : list[str], optional
+            The columns to load. If not provided, all columns are loaded.
+            The "nflverse_game_id" column is always loaded for filtering.
+    """
+    # Always load the column needed to filter the weeks
+    if columns is not None:
+        columns = list(dict.fromkeys(["nflverse_game_id", *columns]))
+
+    df = pd.concat(
+        [
+            _source_data.get("participation", force_refresh, {"year": year}, columns)
+            for year in range(start_week.season, end_week.season + 1)
+        ],
+        ignore_index=True,
+    )
+
+    # Parse the season and week once per game, from ids like "2023_01_ARI_WAS"
+    game_codes, game_ids = pd.factorize(df["nflverse_game_id"])
+    df["season"] = game_ids.str[:4].astype(int).to_numpy()[game_codes]
+    df["week"] = game_ids.str[5:7].astype(int).to_numpy()[game_codes]
+    df = utils.filter_data_weekly(df, start_week, end_week)
+
+    return df
+
+
+def team_descriptions(force_refresh: bool = False) -> pd.DataFrame:
+    """
+    Get the description of every team, including its conference and division.
+
+    Parameters
+    ----------
+        force_refresh : bool
+            If True, we automatically get the most up-to-date data from NFL Verse and overwrite the local file.
+    """
+    df = _source_data.get("team_desc", force_refresh)
+
+    return df
@@ -0,0 +1,148 @@
+import pandas as pd
+from nfl_analytics.nfl_data import basic_data, advanced_data, utils
+from nfl_analytics.nfl_data.utils import NflWeek
+from typing import Any, Callable, Hashable
+
+
+class AnalysisSession:
+    """
+    Data shared by every analysis over a range of weeks.
+
+    Each dataset is loaded lazily, at most once, and derived tables are memoized,
+    so the analyses given the same session never touch the storage twice for the same data.
+    The returned DataFrames are shared between the analyses and must not be modified.
+    """
+
+    def __init__(self, start_week: NflWeek, end_week: NflWeek):
+        """
+        Initialize an empty session for the given weeks.
+
+        Parameters
+        ----------
+            start_week : NflWeek
+                The start week of the session (inclusive).
+            end_week : NflWeek
+                The end week of the session (inclusive).
+        """
+        self.start_week = start_week
+        self.end_week = end_week
+        self._tables = {}
+
+    def memoize(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Get a table of the session, computing it only the first time it is requested.
+
+        Parameters
+        ----------
+            key : Hashable
+                The key identifying the table, including the weeks it covers if relevant.
+            compute : Callable[[], Any]
+                The function computing the table.
+        """
+        if key not in self._tables:
+            self._tables[key] = compute()
+
+        return self._tables[key]
+
+    def schedules(
+        self, start_week: NflWeek = None, end_week: NflWeek = None
+    ) -> pd.DataFrame:
+        """
+        Get the schedules for the given weeks within the session.
+
+        Parameters
+        ----------
+            start_week : NflWeek, optional
+                The start week (inclusive). Defaults to the start of the session.
+            end_week : NflWeek, optional
+                The end week (inclusive). Defaults to the end of the session.
+        """
+        start_week, end_week = self._weeks(start_week, end_week)
+        schedules_df = self.memoize(
+            "schedules",
+            lambda: basic_data.schedules(self.start_week, self.end_week),
+        )
+
+        if self._is_session_range(start_week, end_week):
+            return schedules_df
+        return utils.filter_data_weekly(schedules_df, start_week, end_week)
+
+    def play_by_play(self, columns: list[str] = None) -> pd.DataFrame:
+        """
+        Get the play-by-play data of the session.
+
+        Parameters
+        ----------
+            columns : list[str], optional
+                The columns to load. If not provided, all columns are loaded.
+                Each distinct selection is loaded once.
+        """
+        key = ("play_by_play", None if columns is None else tuple(columns))
+        return self.memoize(
+            key,
+            lambda: basic_data.play_by_play(
+                self.start_week, self.end_week, columns=columns
+            ),
+        )
+
+    def point_breakdown(
+        self, start_week: NflWeek = None, end_week: NflWeek = None
+    ) -> pd.DataFrame:
+        """
+        Get the point breakdown for the given weeks within the session.
+
+        The breakdown is reduced from the full play-by-play data if the session already loaded it,
+        otherwise only the needed play-by-play columns are loaded.
+        Within a narrower range, only the games scheduled during the weeks are kept.
+
+        Parameters
+        ----------
+            start_week : NflWeek, optional
+                The start week (inclusive). Defaults to the start of the session.
+            end_week : NflWeek, optional
+                The end week (inclusive). Defaults to the end of the session.
+        """
+        start_week, end_week = self._weeks(start_week, end_week)
+
+        def compute():
+            pbp_df = self._tables.get(("play_by_play", None))
+            return advanced_data.point_breakdown(
+                self.start_week, self.end_week, pbp_df=pbp_df
+            )
+
+        point_breakdown_df = self.memoize("point_breakdown", compute)
+
+        if self._is_session_range(start_week, end_week):
+            return point_breakdown_df
+        game_ids = self.schedules(start_week, end_week)["game_id"]
+        return point_breakdown_df[point_breakdown_df.index.isin(game_ids)]
+
+    def _weeks(
+        self, start_week: NflWeek | None, end_week: NflWeek | None
+    ) -> tuple[NflWeek, NflWeek]:
+        """
+        Get the requested weeks, defaulting to the session's, and check they are within the session.
+        """
+        start_week = self.start_week if start_week is None else start_week
+        end_week = self.end_week if end_week is None else end_week
+
+        session_weeks = (utils.week_key(self.start_week), utils.week_key(self.end_week))
+        if (
+            utils.week_key(start_week) < session_weeks[0]
+            or utils.week_key(end_week) > session_weeks[1]
+        ):
+            raise ValueError(
+                f"Weeks {start_week.season}-{start_week.week} to {end_week.season}-{end_week.week} "
+                f"are outside the session's weeks "
+                f"{self.start_week.season}-{self.start_week.week} to {self.end_week.season}-{self.end_week.week}."
+            )
+
+        return start_week, end_week
+
+    def _is_session_range(self, start_week: NflWeek, end_week: NflWeek) -> bool:
+        """
+        Check whether the given weeks are the session's weeks.
+        """
+        weeks = (utils.week_key(start_week), utils.week_key(end_week))
+        session_weeks = (utils.week_key(self.start_week), utils.week_key(self.end_week))
+        return weeks == session_weeks
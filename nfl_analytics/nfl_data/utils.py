@@ -1,4 +1,12 @@
 import pandas as pd
+import numpy as np
+from typing import Literal
+
+# The largest relative error of the values of a compact frame, from rounding float64 to float32
+COMPACT_RELATIVE_ERROR = 2.0**-24
+
+# The columns holding team abbreviations, stored as categories in a compact frame
+_TEAM_COLUMNS = ("Team", "team", "home_team", "away_team", "posteam", "defteam")
 
 
 class NflWeek:
@@ -83,6 +91,36 @@ class NflWeek:
             self._go_back_week()
 
 
+def week_key(
+    week: NflWeek | pd.DataFrame,
+    season_col: str = "season",
+    week_col: str = "week",
+) -> int | np.ndarray:
+    """
+    Get a sortable integer key of a week, or of the week of each row of a DataFrame.
+
+    The key is season * 100 + week, so comparing keys compares the weeks chronologically.
+
+    Parameters
+    ----------
+        week : NflWeek or pd.DataFrame
+            The week, or a DataFrame with a season and a week column.
+        season_col : str
+            The name of the column containing the season information. Default is "season".
+        week_col : str
+            The name of the column containing the week information. Default is "week".
+
+    Returns
+    -------
+        int or np.ndarray
+            The key of the week, or the key of each row.
+    """
+    if isinstance(week, NflWeek):
+        return week.season * 100 + week.week
+
+    return (week[season_col] * 100 + week[week_col]).to_numpy()
+
+
 def filter_data_weekly(
     df: pd.DataFrame,
     start_week: NflWeek = NflWeek(1900, 1),
@@ -157,3 +195,78 @@ def filter_data_seasonaly(
     df = df[start_mask & end_mask]
 
     return df
+
+
+def week_windows(
+    first_week: NflWeek,
+    last_week: NflWeek,
+    window: int | Literal["season"] | None = None,
+) -> list[tuple[NflWeek, NflWeek]]:
+    """
+    Get the rolling (start, end) week windows ending at each week in the given range.
+
+    Parameters
+    ----------
+        first_week : NflWeek
+            The first week to end a window on (inclusive).
+        last_week : NflWeek
+            The last week to end a window on (inclusive).
+        window : int or "season", optional
+            The rolling specification. If not provided, the windows expand from `first_week`.
+            An integer gives trailing windows of that many weeks.
+            "season" gives windows expanding from week 1 of each window's season.
+
+    Returns
+    -------
+        list[tuple[NflWeek, NflWeek]]
+            The (start, end) windows, ordered by end week.
+    """
+    if isinstance(window, int) and window < 1:
+        raise ValueError(f"Window must be at least 1 week, got {window}.")
+
+    windows = []
+    end_week = NflWeek(first_week.season, first_week.week)
+    while week_key(end_week) <= week_key(last_week):
+        # Get the start of the window ending at this week
+        if window is None:
+            start_week = NflWeek(first_week.season, first_week.week)
+        elif window == "season":
+            start_week = NflWeek(end_week.season, 1)
+        else:
+            start_week = NflWeek(end_week.season, end_week.week)
+            start_week.go_back(window - 1)
+
+        windows.append((start_week, NflWeek(end_week.season, end_week.week)))
+        end_week.advance()
+
+    return windows
+
+
+def compact_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Get a compact version of a result DataFrame, for storing or scoring many rows.
+
+    The float64 columns are rounded to float32, the team columns become categoricals
+    (their integer codes are `.cat.codes`) and the "season" and "week" columns become int16.
+    The index is shared with the given frame rather than copied.
+
+    Rounding to the nearest float32 changes each value by at most `COMPACT_RELATIVE_ERROR` (2**-24)
+    times its magnitude, i.e. less than 6e-6 points for ratings and spreads under 100 points.
+    Only the outputs are rounded, the computations stay in float64.
+
+    Parameters
+    ----------
+        df : pd.DataFrame
+            The DataFrame to compact.
+    """
+    columns = {}
+    for name, column in df.items():
+        if name in _TEAM_COLUMNS:
+            column = column.astype("category")
+        elif column.dtype == np.float64:
+            column = column.astype(np.float32)
+        elif name in ("season", "week") and pd.api.types.is_integer_dtype(column):
+            column = column.astype(np.int16)
+        columns[name] = column.array
+
+    return pd.DataFrame(columns, index=df.index, copy=False)
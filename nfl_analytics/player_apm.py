@@ -0,0 +1,222 @@
+import pandas as pd
+import numpy as np
+from nfl_analytics.nfl_data import NflWeek
+from nfl_analytics import nfl_data
+from nfl_analytics import _sparse
+
+# The play types whose EPA is regressed on the players on the field
+_APM_PLAY_TYPES = ["pass", "run"]
+
+# The default ridge penalty, roughly the variance of the EPA of a play over the variance of the player ratings
+_DEFAULT_RIDGE = 2000.0
+
+# The play-by-play columns used by the regression
+_PBP_COLUMNS = ["game_id", "play_id", "play_type", "epa"]
+
+# The participation columns used by the regression
+_PARTICIPATION_COLUMNS = ["play_id", "offense_players", "defense_players"]
+
+
+def _split_players(players: pd.Series) -> tuple[np.ndarray, list[str]]:
+    """
+    Split the ";" separated players of each play, without exploding a DataFrame.
+
+    Returns the play (position in `players`) of each player entry, and the player ids.
+    """
+    players = players.fillna("")
+    on_field = (players != "").to_numpy()
+    counts = np.where(on_field, players.str.count(";").to_numpy() + 1, 0)
+
+    rows = np.repeat(np.arange(len(players)), counts)
+    ids = ";".join(players[on_field]).split(";") if on_field.any() else []
+
+    return rows, ids
+
+
+class _PlayerApmFitter:
+    def __init__(
+        self,
+        start_week: NflWeek,
+        end_week: NflWeek,
+        ridge: float = _DEFAULT_RIDGE,
+        pbp_df: pd.DataFrame = None,
+        participation_df: pd.DataFrame = None,
+    ):
+        """
+        Initialize the adjusted plus-minus (APM) regression of the given weeks.
+
+        The EPA of each pass and run play is regressed on an intercept and indicators of the players on the field:
+        +1 for each offensive player and -1 for each defensive player,
+        so a positive defensive rating means fewer EPA allowed.
+        Each player has one offensive and one defensive rating, shrunk toward 0 by the ridge penalty,
+        and the intercept (about the league average EPA per play) is not penalized.
+
+        The design has one row per play and is kept sparse (about 22 nonzeros per row),
+        and the normal equations are solved by the conjugate gradient without being formed.
+
+        Parameters
+        ----------
+            start_week : NflWeek
+                The start week of the plays (inclusive).
+            end_week : NflWeek
+                The end week of the plays (inclusive).
+            ridge : float
+                The ridge penalty of the player ratings, in plays:
+                a rating is shrunk as if the player had that many more plays of average EPA.
+                Must be positive, since the players on the field always sum to the same counts.
+            pbp_df : pd.DataFrame, optional
+                A DataFrame containing the play-by-play data for the given weeks.
+                If not provided, only the needed columns are fetched.
+            participation_df : pd.DataFrame, optional
+                A DataFrame containing the participation data for the given weeks.
+                If not provided, only the needed columns are fetched.
+        """
+        if ridge <= 0:
+            raise ValueError(f"Ridge penalty must be positive, got {ridge}.")
+
+        self.start_week = start_week
+        self.end_week = end_week
+        self.ridge = ridge
+        self.pbp_df = pbp_df
+        self.participation_df = participation_df
+
+    def fit(self):
+        """
+        Fit the player ratings.
+        """
+        self._get_data()
+        self._setup_design()
+        self._solve()
+        self._create_apm_frame()
+
+    def _get_data(self):
+        """
+        Get the plays of the weeks, with the players on the field.
+        """
+        if not isinstance(self.pbp_df, pd.DataFrame):
+            self.pbp_df = nfl_data.play_by_play(
+                self.start_week, self.end_week, columns=_PBP_COLUMNS
+            )
+        if not isinstance(self.participation_df, pd.DataFrame):
+            self.participation_df = nfl_data.participation(
+                self.start_week, self.end_week, columns=_PARTICIPATION_COLUMNS
+            )
+
+        # Keep the scrimmage plays with an EPA
+        pbp_df = self.pbp_df[
+            self.pbp_df["play_type"].isin(_APM_PLAY_TYPES) & self.pbp_df["epa"].notna()
+        ]
+
+        self.plays = pbp_df[["game_id", "play_id", "epa"]].merge(
+            self.participation_df[
+                ["nflverse_game_id", "play_id", "offense_players", "defense_players"]
+            ],
+            left_on=["game_id", "play_id"],
+            right_on=["nflverse_game_id", "play_id"],
+        )
+
+    def _setup_design(self):
+        """
+        Set up the sparse design: the intercept, then the offensive and the defensive ratings of each player.
+        """
+        offense_rows, offense_ids = _split_players(self.plays["offense_players"])
+        defense_rows, defense_ids = _split_players(self.plays["defense_players"])
+
+        # One code per player, shared by the offensive and defensive ratings
+        codes, self.players = pd.factorize(
+            np.array(offense_ids + defense_ids, dtype=object), sort=True
+        )
+        n_players = len(self.players)
+        offense_codes = codes[: len(offense_ids)]
+        defense_codes = codes[len(offense_ids) :]
+
+        n_plays = len(self.plays)
+        self.design = _sparse.SparseMatrix(
+            np.concatenate([np.arange(n_plays), offense_rows, defense_rows]),
+            np.concatenate(
+                [
+                    np.zeros(n_plays, dtype=np.intp),
+                    1 + offense_codes,
+                    1 + n_players + defense_codes,
+                ]
+            ),
+            np.concatenate(
+                [
+                    np.ones(n_plays + len(offense_ids)),
+                    -np.ones(len(defense_ids)),
+                ]
+            ),
+            (n_plays, 1 + 2 * n_players),
+        )
+
+        self.off_plays = np.bincount(offense_codes, minlength=n_players)
+        self.def_plays = np.bincount(defense_codes, minlength=n_players)
+
+    def _solve(self):
+        """
+        Solve the ridge regression, leaving the intercept unpenalized.
+        """
+        penalties = np.full(self.design.shape[1], float(self.ridge))
+        penalties[0] = 0.0
+
+        coefficients, self.iterations = _sparse.solve_ridge(
+            self.design, self.plays["epa"].to_numpy(dtype=float), penalties
+        )
+
+        n_players = len(self.players)
+        self.intercept = coefficients[0]
+        self.off_ratings = coefficients[1 : 1 + n_players]
+        self.def_ratings = coefficients[1 + n_players :]
+
+    def _create_apm_frame(self):
+        """
+        Create the frame of the player ratings.
+        """
+        self.apm_frame = pd.DataFrame(
+            {
+                "player_id": self.players,
+                "off_plays": self.off_plays,
+                "def_plays": self.def_plays,
+                "off_apm": self.off_ratings,
+                "def_apm": self.def_ratings,
+            }
+        )
+
+
+def player_apm(
+    start_week: NflWeek,
+    end_week: NflWeek,
+    ridge: float = _DEFAULT_RIDGE,
+    pbp_df: pd.DataFrame = None,
+    participation_df: pd.DataFrame = None,
+) -> pd.DataFrame:
+    """
+    Get the adjusted plus-minus (APM) of each player, in EPA per play, over the given weeks.
+
+    See `_PlayerApmFitter` for the regression.
+
+    Parameters
+    ----------
+        start_week : NflWeek
+            The start week of the plays (inclusive).
+        end_week : NflWeek
+            The end week of the plays (inclusive).
+        ridge : float
+            The ridge penalty of the player ratings, in plays. Default is 2000.
+        pbp_df : pd.DataFrame, optional
+            A DataFrame containing the play-by-play data for the given weeks.
+            If not provided, only the needed columns are fetched.
+        participation_df : pd.DataFrame, optional
+            A DataFrame containing the participation data for the given weeks.
+            If not provided, only the needed columns are fetched.
+
+    Returns
+    -------
+        pd.DataFrame
+            The "player_id", the number of "off_plays" and "def_plays",
+            and the "off_apm" (EPA added on offense) and "def_apm" (EPA prevented on defense) of each player.
+    """
+    fitter = _PlayerApmFitter(start_week, end_week, ridge, pbp_df, participation_df)
+    fitter.fit()
+
+    return fitter.apm_frame
@@ -0,0 +1,379 @@
+import pandas as pd
+import numpy as np
+from nfl_analytics.nfl_data import NflWeek
+from nfl_analytics import nfl_data
+from nfl_analytics.srs_model import SrsModel
+from nfl_analytics.standings import _StandingsEngine, _PLAYOFF_SEEDS
+from typing import Iterator, Literal
+
+# The standard deviation of NFL game margins around the spread
+_MARGIN_SCALE = 13.5
+
+# The number of simulations drawn at once by default, bounding the memory of the margins
+_SIMULATION_CHUNK_SIZE = 100_000
+
+# The number of simulations ranked at once by default, bounding the memory of the head-to-head records
+_STANDINGS_CHUNK_SIZE = 10_000
+
+
+class _SeasonSimulator:
+    def __init__(
+        self,
+        model: SrsModel,
+        schedules_df: pd.DataFrame,
+        noise: Literal["normal", "t"] = "normal",
+        scale: float = _MARGIN_SCALE,
+        df: float = 5.0,
+    ):
+        """
+        Initialize the simulator of the remaining games of a schedule.
+
+        The games with a score keep their result, the others are simulated as the model's spread
+        plus a random error. The spreads are looked up once, so the simulations only draw the errors.
+
+        Parameters
+        ----------
+            model : SrsModel
+                The fitted model predicting the spreads of the remaining games.
+            schedules_df : pd.DataFrame
+                The schedule data of the games to simulate, as returned by `nfl_data.schedules`.
+            noise : {"normal", "t"}
+                The distribution of the error of the margin around the spread.
+                "t" draws from a Student's t distribution, with heavier tails than the normal.
+            scale : float
+                The standard deviation of the error. Default is 13.5 points.
+            df : float
+                The degrees of freedom of the "t" noise, above 2. Default is 5.
+        """
+        if noise not in ("normal", "t"):
+            raise ValueError(f'Noise must be "normal" or "t", got {noise}.')
+        if noise == "t" and df <= 2:
+            raise ValueError(
+                f"The t noise needs more than 2 degrees of freedom, got {df}."
+            )
+        self.noise = noise
+        self.scale = scale
+        self.df = df
+
+        # Factorize the teams of every game
+        self.teams = np.array(
+            sorted(
+                pd.concat(
+                    (schedules_df["home_team"], schedules_df["away_team"])
+                ).unique()
+            ),
+            dtype=object,
+        )
+        team_index = pd.Index(self.teams)
+        home_codes = team_index.get_indexer(schedules_df["home_team"])
+        away_codes = team_index.get_indexer(schedules_df["away_team"])
+
+        # The margins of the completed games
+        margins = schedules_df["home_score"].to_numpy(dtype=float) - schedules_df[
+            "away_score"
+        ].to_numpy(dtype=float)
+        remaining = np.isnan(margins)
+        self.completed_margins = margins[~remaining]
+
+        # The spreads of the remaining games
+        self.remaining_games = schedules_df.loc[
+            remaining, ["game_id", "season", "week", "home_team", "away_team"]
+        ].reset_index(drop=True)
+        self.spreads = model.lookup_spreads(
+            model.team_codes(self.remaining_games["home_team"]),
+            model.team_codes(self.remaining_games["away_team"]),
+            schedules_df.loc[remaining, "location"].to_numpy() == "Neutral",
+        )[:, 0]
+        if np.isnan(self.spreads).any():
+            raise ValueError(
+                "Remaining games have teams without a rating in the model."
+            )
+
+        # The +1 home and -1 away indicators of the teams of each game
+        self._home_codes, self._away_codes = home_codes, away_codes
+        self._remaining = remaining
+        self._remaining_teams = np.zeros((remaining.sum(), len(self.teams)))
+        self._remaining_teams[np.arange(remaining.sum()), home_codes[remaining]] = 1
+        self._remaining_teams[np.arange(remaining.sum()), away_codes[remaining]] = -1
+
+        # The wins of the completed games, with ties counted as half a win
+        completed = np.sign(self.completed_margins)
+        self.completed_wins = np.bincount(
+            home_codes[~remaining],
+            weights=(completed + 1) / 2,
+            minlength=len(self.teams),
+        ) + np.bincount(
+            away_codes[~remaining],
+            weights=(1 - completed) / 2,
+            minlength=len(self.teams),
+        )
+
+    def margins(self, n_sims: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Draw the home margins of the remaining games.
+
+        Parameters
+        ----------
+            n_sims : int
+                The number of simulations.
+            rng : np.random.Generator
+                The generator of the errors.
+
+        Returns
+        -------
+            np.ndarray
+                The (n_sims, n_remaining_games) float32 margins.
+        """
+        n_games = len(self.spreads)
+        if self.noise == "normal":
+            errors = rng.standard_normal((n_sims, n_games), dtype=np.float32)
+            errors *= np.float32(self.scale)
+        else:
+            # Rescale the t draws to the requested standard deviation
+            errors = rng.standard_t(self.df, (n_sims, n_games)).astype(np.float32)
+            errors *= np.float32(self.scale * np.sqrt((self.df - 2) / self.df))
+
+        errors += self.spreads.astype(np.float32)
+        return errors
+
+    def chunks(
+        self, n_sims: int, seed: int = None, chunk_size: int = _SIMULATION_CHUNK_SIZE
+    ) -> Iterator[np.ndarray]:
+        """
+        Draw the margins of the remaining games in chunks of simulations.
+
+        The chunks are drawn in sequence from one generator,
+        so the simulations do not depend on the chunk size.
+
+        Parameters
+        ----------
+            n_sims : int
+                The total number of simulations.
+            seed : int, optional
+                The seed of the simulations.
+            chunk_size : int
+                The maximum number of simulations of each chunk.
+        """
+        rng = np.random.default_rng(seed)
+        for chunk_start in range(0, n_sims, chunk_size):
+            yield self.margins(min(chunk_size, n_sims - chunk_start), rng)
+
+    def season_margins(self, margins: np.ndarray) -> np.ndarray:
+        """
+        Get the margins of every game of the schedule, completed or simulated.
+
+        Parameters
+        ----------
+            margins : np.ndarray
+                The (n_sims, n_remaining_games) margins from `margins`.
+
+        Returns
+        -------
+            np.ndarray
+                The (n_sims, n_games) home margins, in the order of the schedule.
+        """
+        season_margins = np.empty((len(margins), len(self._remaining)))
+        season_margins[:, ~self._remaining] = self.completed_margins
+        season_margins[:, self._remaining] = margins
+
+        return season_margins
+
+    def win_totals(self, margins: np.ndarray) -> np.ndarray:
+        """
+        Get the season win totals of every team from simulated margins of the remaining games.
+
+        Parameters
+        ----------
+            margins : np.ndarray
+                The (n_sims, n_remaining_games) margins from `margins`.
+
+        Returns
+        -------
+            np.ndarray
+                The (n_sims, n_teams) wins of each team, including the completed games.
+        """
+        # Each game gives +1/2 to the winner and -1/2 to the loser on top of half a game each
+        results = np.sign(margins)
+        games_played = np.abs(self._remaining_teams).sum(axis=0)
+
+        return (
+            self.completed_wins
+            + games_played / 2
+            + (results @ self._remaining_teams.astype(np.float32)) / 2
+        )
+
+
+def simulate_season(
+    model: SrsModel,
+    season: int,
+    n_sims: int = 10_000,
+    noise: Literal["normal", "t"] = "normal",
+    scale: float = _MARGIN_SCALE,
+    df: float = 5.0,
+    seed: int = None,
+    chunk_size: int = _SIMULATION_CHUNK_SIZE,
+    schedules_df: pd.DataFrame = None,
+) -> pd.DataFrame:
+    """
+    Simulate the rest of a regular season from the spreads of a fitted SRS model.
+
+    Every remaining game of every simulation is drawn at once as a (sims x games) array of margins,
+    in chunks of simulations to bound the memory, and the win totals are accumulated per chunk.
+
+    Parameters
+    ----------
+        model : SrsModel
+            The fitted model predicting the spreads of the remaining games.
+        season : int
+            The season to simulate.
+        n_sims : int
+            The number of simulations. Default is 10,000.
+        noise : {"normal", "t"}
+            The distribution of the error of the margin around the spread, see `_SeasonSimulator`.
+        scale : float
+            The standard deviation of the error. Default is 13.5 points.
+        df : float
+            The degrees of freedom of the "t" noise. Default is 5.
+        seed : int, optional
+            The seed of the simulations.
+        chunk_size : int
+            The maximum number of simulations drawn at once. Default is 100,000.
+        schedules_df : pd.DataFrame, optional
+            A DataFrame containing the schedule data for the season.
+            If not provided, it will be fetched.
+
+    Returns
+    -------
+        pd.DataFrame
+            The probability of each win total (columns, in steps of half a win) of each team (index),
+            with the "mean_wins" of each team first.
+    """
+    if not isinstance(schedules_df, pd.DataFrame):
+        schedules_df = nfl_data.schedules(NflWeek(season, 1), NflWeek(season, 22))
+    schedules_df = schedules_df[
+        (schedules_df["season"] == season) & (schedules_df["game_type"] == "REG")
+    ]
+    simulator = _SeasonSimulator(model, schedules_df, noise, scale, df)
+    n_teams = len(simulator.teams)
+
+    # Count the simulations of each team and win total, in half wins
+    max_half_wins = 2 * len(schedules_df)
+    counts = np.zeros((n_teams, max_half_wins + 1))
+    team_offsets = np.arange(n_teams) * (max_half_wins + 1)
+    for margins in simulator.chunks(n_sims, seed, chunk_size):
+        half_wins = np.rint(2 * simulator.win_totals(margins)).astype(np.intp)
+        counts += np.bincount(
+            (half_wins + team_offsets).ravel(), minlength=counts.size
+        ).reshape(counts.shape)
+
+    # Keep the win totals reached by any team
+    reached = np.flatnonzero(counts.any(axis=0))
+    reached = np.arange(reached.min(), reached.max() + 1)
+    distribution = pd.DataFrame(
+        counts[:, reached] / n_sims,
+        index=pd.Index(simulator.teams.tolist(), name="Team"),
+        columns=reached / 2,
+    )
+    distribution.insert(
+        0, "mean_wins", distribution.to_numpy() @ distribution.columns.to_numpy()
+    )
+
+    return distribution
+
+
+def simulate_playoff_odds(
+    model: SrsModel,
+    season: int,
+    n_sims: int = 10_000,
+    noise: Literal["normal", "t"] = "normal",
+    scale: float = _MARGIN_SCALE,
+    df: float = 5.0,
+    seed: int = None,
+    chunk_size: int = _STANDINGS_CHUNK_SIZE,
+    schedules_df: pd.DataFrame = None,
+    team_desc_df: pd.DataFrame = None,
+) -> pd.DataFrame:
+    """
+    Simulate the rest of a regular season and get the odds of every playoff seed and draft pick.
+
+    The simulated seasons are ranked in chunks by the standings engine,
+    which breaks the ties of every simulation of a chunk at once, see `_StandingsEngine`.
+
+    Parameters
+    ----------
+        model : SrsModel
+            The fitted model predicting the spreads of the remaining games.
+        season : int
+            The season to simulate.
+        n_sims : int
+            The number of simulations. Default is 10,000.
+        noise : {"normal", "t"}
+            The distribution of the error of the margin around the spread, see `_SeasonSimulator`.
+        scale : float
+            The standard deviation of the error. Default is 13.5 points.
+        df : float
+            The degrees of freedom of the "t" noise. Default is 5.
+        seed : int, optional
+            The seed of the simulations and of the coin tosses breaking the remaining ties.
+        chunk_size : int
+            The maximum number of simulations ranked at once. Default is 10,000.
+        schedules_df : pd.DataFrame, optional
+            A DataFrame containing the schedule data for the season.
+            If not provided, it will be fetched.
+        team_desc_df : pd.DataFrame, optional
+            A DataFrame containing the team descriptions.
+            If not provided, it will be fetched.
+
+    Returns
+    -------
+        pd.DataFrame
+            The "mean_wins" of each team (index), the probability of winning its "division",
+            of making the "playoffs", of each seed ("seed_1" to "seed_7")
+            and of the "first_pick" of the draft.
+    """
+    if not isinstance(schedules_df, pd.DataFrame):
+        schedules_df = nfl_data.schedules(NflWeek(season, 1), NflWeek(season, 22))
+    if not isinstance(team_desc_df, pd.DataFrame):
+        team_desc_df = nfl_data.team_descriptions()
+    schedules_df = schedules_df[
+        (schedules_df["season"] == season) & (schedules_df["game_type"] == "REG")
+    ]
+    simulator = _SeasonSimulator(model, schedules_df, noise, scale, df)
+    engine = _StandingsEngine(schedules_df, team_desc_df)
+
+    # Separate streams for the margins and for the coin tosses
+    margin_seed, coin_seed = np.random.SeedSequence(seed).spawn(2)
+    coin_rng = np.random.default_rng(coin_seed)
+
+    n_teams = len(simulator.teams)
+    wins, division_wins, first_picks = np.zeros((3, n_teams))
+    seed_counts = np.zeros((n_teams, _PLAYOFF_SEEDS + 1))
+    for margins in simulator.chunks(n_sims, margin_seed, chunk_size):
+        wins += simulator.win_totals(margins).sum(axis=0)
+        margins = simulator.season_margins(margins)
+        division_ranks, seeds, draft_picks = engine.evaluate(
+            (np.sign(margins) + 1) / 2, margins, coin_rng.integers(2**32)
+        )
+        seed_counts += np.stack(
+            [
+                (seeds == seed_number).sum(axis=0)
+                for seed_number in range(_PLAYOFF_SEEDS + 1)
+            ],
+            axis=1,
+        )
+        division_wins += (division_ranks == 1).sum(axis=0)
+        first_picks += (draft_picks == 1).sum(axis=0)
+
+    odds = pd.DataFrame(
+        {
+            "mean_wins": wins / n_sims,
+            "division": division_wins / n_sims,
+            "playoffs": seed_counts[:, 1:].sum(axis=1) / n_sims,
+        },
+        index=pd.Index(simulator.teams.tolist(), name="Team"),
+    )
+    for seed_number in range(1, _PLAYOFF_SEEDS + 1):
+        odds[f"seed_{seed_number}"] = seed_counts[:, seed_number] / n_sims
+    odds["first_pick"] = first_picks / n_sims
+
+    return odds
@@ -1,11 +1,425 @@
+import copy
+import os
+import threading
+import warnings
 import pandas as pd
 import numpy as np
+from collections import OrderedDict
 from nfl_analytics.nfl_data import NflWeek
 from nfl_analytics import nfl_data
+from nfl_analytics.nfl_data import _source_data
+from typing import Literal
+
+# The number of windows whose normal equations are stacked and solved together
+_WINDOW_CHUNK_SIZE = 256
+
+# The version of the file format written by `SrsModel.save`
+_SAVE_FORMAT_VERSION = 1
+
+# The SRS frame columns written by `SrsModel.save`
+_SAVED_SRS_COLUMNS = ["MoV", "SoS", "SRS", "SRS_O", "SRS_D", "SRS_ST"]
+
+# Guards the refits of the models loaded by `SrsModelCache`, see `_SrsFitter._require_data`
+_REFIT_LOCK = threading.Lock()
+
+
+def _data_fingerprint(start_week: NflWeek, end_week: NflWeek) -> str:
+    """
+    Fingerprint the local schedules and play-by-play files an SRS over the given weeks is fit from.
+    """
+    sources = [("schedules", None)] + [
+        ("pbp", {"year": year})
+        for year in range(start_week.season, end_week.season + 1)
+    ]
+
+    return _source_data.fingerprint(sources)
+
+
+def _normal_equations(
+    pos_cols: np.ndarray,
+    neg_cols: np.ndarray,
+    score_diff: np.ndarray,
+    n_cols: int,
+    groups: np.ndarray = None,
+    n_groups: int = None,
+    weights: np.ndarray = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Accumulate the normal equations of a least squares problem with two nonzeros per row.
+
+    Each row of the design matrix is +1 in column `pos_cols[i]` and -1 in column `neg_cols[i]`,
+    so the normal matrix and right hand side are built directly with bincounts.
+
+    Parameters
+    ----------
+        pos_cols : np.ndarray
+            The column of the +1 entry of each row.
+        neg_cols : np.ndarray
+            The column of the -1 entry of each row.
+        score_diff : np.ndarray
+            The target of each row, or an (n_rows, k) array of several targets.
+        n_cols : int
+            The number of columns in the design matrix.
+        groups : np.ndarray, optional
+            The group of each row. If provided, separate normal equations are accumulated for each group.
+        n_groups : int, optional
+            The number of groups, required with `groups`.
+        weights : np.ndarray, optional
+            The weight of each row in the least squares. If not provided, every row has weight 1.
+
+    Returns
+    -------
+        ata, atb : tuple[np.ndarray, np.ndarray]
+            The (n_cols, n_cols) normal matrix and the (n_cols,) or (n_cols, k) right hand side.
+            With groups, each has a leading axis of length `n_groups`.
+    """
+    ones = np.ones(len(pos_cols)) if weights is None else weights
+    offset = 0 if groups is None else groups * n_cols
+    size = n_cols if groups is None else n_groups * n_cols
+
+    # Diagonal entries from the squares, off diagonal entries from the cross terms
+    flat_index = np.concatenate(
+        (
+            (offset + pos_cols) * n_cols + pos_cols,
+            (offset + neg_cols) * n_cols + neg_cols,
+            (offset + pos_cols) * n_cols + neg_cols,
+            (offset + neg_cols) * n_cols + pos_cols,
+        )
+    )
+    flat_values = np.concatenate((ones, ones, -ones, -ones))
+    ata = np.bincount(flat_index, weights=flat_values, minlength=size * n_cols)
+
+    # Right hand side for each target
+    targets = score_diff.reshape(len(pos_cols), -1)
+    if weights is not None:
+        targets = targets * weights[:, None]
+    atb = np.stack(
+        [
+            np.bincount(
+                np.concatenate((offset + pos_cols, offset + neg_cols)),
+                weights=np.concatenate((target, -target)),
+                minlength=size,
+            )
+            for target in targets.T
+        ],
+        axis=-1,
+    )
+    if score_diff.ndim == 1:
+        atb = atb[:, 0]
+
+    if groups is None:
+        return ata.reshape(n_cols, n_cols), atb
+    return ata.reshape(n_groups, n_cols, n_cols), atb.reshape(
+        n_groups, n_cols, *atb.shape[1:]
+    )
+
+
+def _batched_normal_equations(
+    pos_cols: np.ndarray,
+    neg_cols: np.ndarray,
+    targets: np.ndarray,
+    n_cols: int,
+    groups: np.ndarray,
+    weights: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Accumulate the normal equations of many weightings of the same rows at once.
+
+    The contribution of each group of rows is collapsed onto the distinct nonzero positions
+    of the normal matrix, so every weighting is a single matrix product.
+
+    Parameters
+    ----------
+        pos_cols : np.ndarray
+            The column of the +1 entry of each row.
+        neg_cols : np.ndarray
+            The column of the -1 entry of each row.
+        targets : np.ndarray
+            The (n_rows, k) targets of the rows.
+        n_cols : int
+            The number of columns in the design matrix.
+        groups : np.ndarray
+            The group of each row, e.g. its game. The rows of a group share their weight.
+        weights : np.ndarray
+            The (n_batch, n_groups) weight of each group in each batch.
+
+    Returns
+    -------
+        ata, atb : tuple[np.ndarray, np.ndarray]
+            The (n_batch, n_cols, n_cols) normal matrices and (n_batch, n_cols, k) right hand sides.
+    """
+    n_batch, n_groups = weights.shape
+
+    # The contribution of each group to the distinct nonzero positions of the normal matrix
+    flat_index = np.concatenate(
+        (
+            pos_cols * n_cols + pos_cols,
+            neg_cols * n_cols + neg_cols,
+            pos_cols * n_cols + neg_cols,
+            neg_cols * n_cols + pos_cols,
+        )
+    )
+    ones = np.ones(len(pos_cols))
+    positions, inverse = np.unique(flat_index, return_inverse=True)
+    contributions = np.bincount(
+        np.tile(groups, 4) * len(positions) + inverse,
+        weights=np.concatenate((ones, ones, -ones, -ones)),
+        minlength=n_groups * len(positions),
+    ).reshape(n_groups, len(positions))
+
+    ata = np.zeros((n_batch, n_cols * n_cols))
+    ata[:, positions] = weights @ contributions
+
+    # The contribution of each group to the right hand side
+    n_targets = targets.shape[1]
+    target_index = np.concatenate(
+        (
+            (groups * n_cols + pos_cols)[:, None] * n_targets + np.arange(n_targets),
+            (groups * n_cols + neg_cols)[:, None] * n_targets + np.arange(n_targets),
+        )
+    )
+    rhs = np.bincount(
+        target_index.ravel(),
+        weights=np.concatenate((targets, -targets)).ravel(),
+        minlength=n_groups * n_cols * n_targets,
+    ).reshape(n_groups, n_cols * n_targets)
+    atb = weights @ rhs
+
+    return ata.reshape(n_batch, n_cols, n_cols), atb.reshape(n_batch, n_cols, n_targets)
+
+
+def _design_columns(
+    home_codes: np.ndarray, away_codes: np.ndarray, n_teams: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Get the +1 and -1 columns of each row of the SRS teams matrix.
+
+    The rows are the offensive, then defensive, then special teams equations of every game.
+    The columns are the offensive, then defensive, then special teams SRS of every team.
+
+    Parameters
+    ----------
+        home_codes : np.ndarray
+            The team code of the home team of each game.
+        away_codes : np.ndarray
+            The team code of the away team of each game.
+        n_teams : int
+            The number of teams.
+
+    Returns
+    -------
+        pos_cols, neg_cols : tuple[np.ndarray, np.ndarray]
+    """
+    pos_cols = np.concatenate((home_codes, away_codes, home_codes + 2 * n_teams))
+    neg_cols = np.concatenate(
+        (away_codes + n_teams, home_codes + n_teams, away_codes + 2 * n_teams)
+    )
+
+    return pos_cols, neg_cols
+
+
+def _game_targets(games: pd.DataFrame, non_neutral: np.ndarray) -> np.ndarray:
+    """
+    Get the score differentials and neutral site indicators of the rows of the given games.
+
+    The rows are ordered as in `_design_columns`. The score differentials of the SRS are the first column,
+    minus `hfa_o`, plus `hfa_d` and minus `hfa_st` times the other three columns,
+    so the home field advantage can be applied after the rows are summed.
+
+    Parameters
+    ----------
+        games : pd.DataFrame
+            The point breakdown of the games.
+        non_neutral : np.ndarray
+            Whether each game is not played at a neutral site.
+
+    Returns
+    -------
+        np.ndarray
+            The (3 * n_games, 4) targets of the rows.
+    """
+    zeros = np.zeros(len(games))
+    score_diff = np.concatenate(
+        (
+            games["home_offensive_points"].to_numpy()
+            - games["away_defensive_points"].to_numpy(),
+            games["away_offensive_points"].to_numpy()
+            - games["home_defensive_points"].to_numpy(),
+            games["home_special_teams_points"].to_numpy()
+            - games["away_special_teams_points"].to_numpy(),
+        )
+    )
+
+    return np.column_stack(
+        (
+            score_diff,
+            np.concatenate((non_neutral, zeros, zeros)),
+            np.concatenate((zeros, non_neutral, zeros)),
+            np.concatenate((zeros, zeros, non_neutral)),
+        )
+    )
+
+
+def _solve_normal_equations(ata: np.ndarray, atb: np.ndarray) -> np.ndarray:
+    """
+    Get the minimum norm solution of (possibly stacked) rank deficient normal equations.
+
+    The SRS is only defined up to a constant per unit (the sum-to-zero constraint),
+    so the pseudo-inverse is applied through a symmetric eigendecomposition.
+    This gives the same solution as `np.linalg.lstsq` on the full design matrix.
+
+    Parameters
+    ----------
+        ata : np.ndarray
+            The (..., n, n) normal matrices.
+        atb : np.ndarray
+            The (..., n) right hand sides.
+    """
+    eigenvalues, eigenvectors = np.linalg.eigh(ata)
+
+    # Drop the eigenvalues that are zero up to rounding error
+    tolerance = (
+        eigenvalues.max(axis=-1, keepdims=True) * ata.shape[-1] * np.finfo(float).eps
+    )
+    keep = eigenvalues > tolerance
+    inverse = np.divide(1.0, eigenvalues, out=np.zeros_like(eigenvalues), where=keep)
+
+    projected = np.einsum("...ji,...j->...i", eigenvectors, atb)
+    return np.einsum("...ij,...j->...i", eigenvectors, inverse * projected)
+
+
+def _augmented_normal_matrix(
+    ata: np.ndarray, n_teams: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Remove the expected rank deficiency of (possibly stacked) SRS normal matrices.
+
+    The projector onto the constant vector of the offensive/defensive and of the special teams SRS
+    of the teams with games is added, with the identity on the columns of the teams without games.
+    This does not change the minimum norm solution, and the result is nonsingular
+    whenever the games pin down the ratings up to those constants.
+
+    Parameters
+    ----------
+        ata : np.ndarray
+            The (..., 3 * n_teams, 3 * n_teams) normal matrices.
+        n_teams : int
+            The number of teams.
+
+    Returns
+    -------
+        augmented, played : tuple[np.ndarray, np.ndarray]
+            The augmented normal matrices, and the (..., n_teams) mask of the teams with games.
+    """
+    played = np.diagonal(ata, axis1=-2, axis2=-1)[..., :n_teams] > 0
+    zeros = np.zeros(played.shape)
+
+    # The normalized constant vectors of the offensive/defensive and special teams SRS
+    null = np.stack(
+        (
+            np.concatenate((played, played, zeros), axis=-1),
+            np.concatenate((zeros, zeros, played), axis=-1),
+        ),
+        axis=-1,
+    )
+    null /= np.sqrt(np.maximum(null.sum(axis=-2, keepdims=True), 1))
+    augmented = ata + null @ np.swapaxes(null, -1, -2)
+
+    # The identity on the columns of the teams without games
+    diagonal = np.arange(3 * n_teams)
+    augmented[..., diagonal, diagonal] += np.tile(~played, 3)
+
+    return augmented, played
+
+
+def _is_well_posed(augmented: np.ndarray) -> np.ndarray:
+    """
+    Check which (possibly stacked) augmented normal matrices are numerically nonsingular.
+
+    A Cholesky factorization is attempted, and its pivots are compared to the scale of the matrix.
+
+    Parameters
+    ----------
+        augmented : np.ndarray
+            The (..., n, n) augmented normal matrices.
+
+    Returns
+    -------
+        np.ndarray
+            A (...) boolean mask, True where the matrix is positive definite.
+    """
+    stacked = augmented.reshape(-1, *augmented.shape[-2:])
+    well_posed = np.zeros(len(stacked), dtype=bool)
+    tolerance = 1e-10 * np.diagonal(stacked, axis1=-2, axis2=-1).max(axis=-1)
+
+    try:
+        pivots = np.diagonal(np.linalg.cholesky(stacked), axis1=-2, axis2=-1)
+        well_posed = pivots.min(axis=-1) ** 2 > tolerance
+    except np.linalg.LinAlgError:
+        # Find the matrices that failed one at a time
+        for i, matrix in enumerate(stacked):
+            try:
+                pivots = np.diagonal(np.linalg.cholesky(matrix))
+                well_posed[i] = pivots.min() ** 2 > tolerance[i]
+            except np.linalg.LinAlgError:
+                well_posed[i] = False
+
+    return well_posed.reshape(augmented.shape[:-2])
+
+
+def _solve_stacked_normal_equations(
+    ata: np.ndarray, atb: np.ndarray, n_teams: int
+) -> np.ndarray:
+    """
+    Get the minimum norm solutions of stacked SRS normal equations in one vectorized solve.
+
+    The augmented matrices of the well posed systems are solved together with `np.linalg.solve`.
+    The remaining systems (e.g. early season windows whose games leave teams unconnected)
+    fall back to the pseudo-inverse of `_solve_normal_equations`.
+
+    Parameters
+    ----------
+        ata : np.ndarray
+            The (n_systems, 3 * n_teams, 3 * n_teams) normal matrices.
+        atb : np.ndarray
+            The (n_systems, 3 * n_teams) right hand sides.
+        n_teams : int
+            The number of teams.
+    """
+    augmented, _ = _augmented_normal_matrix(ata, n_teams)
+
+    # The offensive/defensive and special teams equations share no columns, so they are solved apart
+    x = np.empty(atb.shape)
+    for block in (slice(0, 2 * n_teams), slice(2 * n_teams, 3 * n_teams)):
+        block_ata = ata[:, block, block]
+        block_augmented = augmented[:, block, block]
+        block_atb = atb[:, block]
+        well_posed = _is_well_posed(block_augmented)
+
+        if well_posed.any():
+            x[well_posed, block] = np.linalg.solve(
+                block_augmented[well_posed], block_atb[well_posed][..., None]
+            )[..., 0]
+        if not well_posed.all():
+            x[~well_posed, block] = _solve_normal_equations(
+                block_ata[~well_posed], block_atb[~well_posed]
+            )
+
+    return x
 
 
 class _SrsFitter:
-    def __init__(self, start_week: NflWeek, end_week: NflWeek):
+    def __init__(
+        self,
+        start_week: NflWeek,
+        end_week: NflWeek,
+        solver: Literal["normal", "lstsq"] = "normal",
+        session: nfl_data.AnalysisSession = None,
+        game_weights: pd.Series = None,
+        half_life: float = None,
+        ridge: float = None,
+        prior: pd.DataFrame | Literal["previous_season"] = None,
+    ):
         """
         Initialize the SRS fitter with the start and end weeks.
 
@@ -15,15 +429,62 @@ class _SrsFitter:
                 The start week of the season (inclusive).
             end_week : NflWeek
                 The end week of the season (inclusive).
+            solver : {"normal", "lstsq"}
+                "normal" solves the normal equations accumulated directly from the games.
+                "lstsq" runs `np.linalg.lstsq` on the dense teams matrix, useful for verification.
+            session : nfl_data.AnalysisSession, optional
+                A session covering the weeks, sharing its data with other analyses.
+                If not provided, the data is fetched.
+            game_weights : pd.Series, optional
+                The weight of each game in the least squares, indexed by game id.
+                If not provided, every game has weight 1.
+            half_life : float, optional
+                The half-life in weeks of an exponential decay of the game weights.
+                A game played k scheduled weeks before the last scheduled week of the window
+                has its weight multiplied by 0.5 ** (k / half_life).
+                The home field advantage and MoV stay unweighted.
+            ridge : float, optional
+                The penalty on the squared distance of the ratings to the prior.
+                If not provided, the ratings are not regularized. See `loo_errors` for choosing it.
+            prior : pd.DataFrame or "previous_season", optional
+                The ratings the ridge penalty shrinks toward, as an SRS frame with
+                "Team", "SRS_O", "SRS_D" and "SRS_ST" columns. Missing teams have a prior of 0.
+                "previous_season" uses the SRS of the whole previous season.
+                If not provided, the ratings are shrunk toward 0.
         """
+        if solver not in ("normal", "lstsq"):
+            raise ValueError(f'Unknown solver "{solver}". Use "normal" or "lstsq".')
+        if half_life is not None and half_life <= 0:
+            raise ValueError(f"Half-life must be positive, got {half_life}.")
+        if ridge is not None and ridge < 0:
+            raise ValueError(f"Ridge penalty must be non-negative, got {ridge}.")
+
         self.start_week = start_week
         self.end_week = end_week
+        self.solver = solver
+        self._session = session
+        self.game_weights = game_weights
+        self.half_life = half_life
+        self.ridge = ridge
+        self.prior = prior
+        self._loaded = False
+        self._refit_on_demand = False
+        self._shared = False
+
+        # The number of incremental updates of the fit, to detect results of an earlier game set
+        self._revision = 0
 
     def fit(self):
         self._get_data()
         self._calculate_score_diff()
-        self._setup_teams_matrix()
-        self._solve_least_squares()
+        self._setup_team_codes()
+        self._setup_game_weights()
+        self._setup_prior()
+        if self.solver == "lstsq":
+            self._setup_teams_matrix()
+            self._solve_least_squares()
+        else:
+            self._solve_normal_equations()
         self._create_srs_frame()
         self._normalize_srs()
 
@@ -31,18 +492,29 @@ class _SrsFitter:
         """
         Get the relevant computational data for the SRS.
         """
-        self._schedules_df = nfl_data.schedules(self.start_week, self.end_week)
-        self._point_breakdown_df = nfl_data.point_breakdown(
-            self.start_week, self.end_week
-        )
-        self._hfa, self._hfa_o, self._hfa_d, self._hfa_st = (
-            nfl_data.home_field_advantage(
-                self.start_week,
-                self.end_week,
-                self._schedules_df,
-                self._point_breakdown_df,
+        if self._session is not None:
+            self._schedules_df = self._session.schedules(self.start_week, self.end_week)
+            self._point_breakdown_df = self._session.point_breakdown(
+                self.start_week, self.end_week
+            )
+            self._hfa, self._hfa_o, self._hfa_d, self._hfa_st = (
+                nfl_data.home_field_advantage(
+                    self.start_week, self.end_week, session=self._session
+                )
+            )
+        else:
+            self._schedules_df = nfl_data.schedules(self.start_week, self.end_week)
+            self._point_breakdown_df = nfl_data.point_breakdown(
+                self.start_week, self.end_week
+            )
+            self._hfa, self._hfa_o, self._hfa_d, self._hfa_st = (
+                nfl_data.home_field_advantage(
+                    self.start_week,
+                    self.end_week,
+                    self._schedules_df,
+                    self._point_breakdown_df,
+                )
             )
-        )
 
         # Get a mask of games played at a neutral site, aligned with the point breakdown
         neutral_games = self._schedules_df.loc[
@@ -90,9 +562,9 @@ class _SrsFitter:
             (self._score_diff_eq1, self._score_diff_eq2, self._score_diff_eq3)
         )
 
-    def _setup_teams_matrix(self):
+    def _setup_team_codes(self):
         """
-        Set up the teams matrix for the SRS calculation.
+        Set up the team codes and the nonzero columns of each row of the teams matrix.
 
         Refer to the paper for additional details.
         Overall least squares problem is set up as:
@@ -105,100 +577,451 @@ class _SrsFitter:
         Special Teams Points =  0              0              +1 or 0 or -1
         """
         # Get all teams alphabetically from A to Z
-        teams = pd.Series(
+        self._teams = np.array(
             sorted(
                 pd.concat(
                     (self._schedules_df["home_team"], self._schedules_df["away_team"])
                 ).unique()
-            )
+            ),
+            dtype=object,
         )
+        self._n_teams = len(self._teams)
 
-        # Create a filler array of zeros (length = number of games)
-        filler = np.zeros(len(self._score_diff_eq1))
+        # Factorize the home and away teams of each game
+        team_index = pd.Index(self._teams)
+        self._home_codes = team_index.get_indexer(self._point_breakdown_df["home_team"])
+        self._away_codes = team_index.get_indexer(self._point_breakdown_df["away_team"])
+        if (self._home_codes < 0).any() or (self._away_codes < 0).any():
+            raise ValueError("Point breakdown has teams missing from the schedules.")
 
-        # The offensive breakdown: first 32 columns
-        offensive_dict = {
-            team
-            + "_O": np.concatenate(
-                (
-                    1 * (team == self._point_breakdown_df["home_team"]),
-                    1 * (team == self._point_breakdown_df["away_team"]),
-                    filler,
-                )
-            )
-            for team in teams
-        }
-
-        # The defensive breakdown: next 32 columns
-        defensive_dict = {
-            team
-            + "_D": np.concatenate(
-                (
-                    -1 * (team == self._point_breakdown_df["away_team"]),
-                    -1 * (team == self._point_breakdown_df["home_team"]),
-                    filler,
-                )
+        # The +1 and -1 columns of the offensive, defensive and special teams rows
+        self._pos_cols, self._neg_cols = _design_columns(
+            self._home_codes, self._away_codes, self._n_teams
+        )
+
+    def _setup_game_weights(self):
+        """
+        Set up the weight of each game from the given weights and half-life.
+
+        The weights are None when every game has weight 1.
+        """
+        self._game_weights = None
+        if self.game_weights is None and self.half_life is None:
+            return
+
+        weights = np.ones(len(self._point_breakdown_df))
+        if self.game_weights is not None:
+            game_weights = self.game_weights.reindex(self._point_breakdown_df.index)
+            if game_weights.isna().any():
+                raise ValueError("Game weights are missing for some games.")
+            weights *= game_weights.to_numpy(dtype=float)
+
+        if self.half_life is not None:
+            # Count the scheduled weeks from each game to the last week
+            week_keys = pd.Series(
+                nfl_data.week_key(self._schedules_df),
+                index=self._schedules_df["game_id"].to_numpy(),
             )
-            for team in teams
-        }
-
-        # The special teams breakdown: last 32 columns
-        special_dict = {
-            team
-            + "_ST": np.concatenate(
-                (
-                    filler,
-                    filler,
-                    1 * (team == self._point_breakdown_df["home_team"])
-                    + -1 * (team == self._point_breakdown_df["away_team"]),
+            unique_keys = np.unique(week_keys.to_numpy())
+            game_keys = week_keys.reindex(self._point_breakdown_df.index)
+            if game_keys.isna().any():
+                raise ValueError(
+                    "Point breakdown has games missing from the schedules."
                 )
+            weeks_ago = len(unique_keys) - 1 - np.searchsorted(unique_keys, game_keys)
+            weights *= 0.5 ** (weeks_ago / self.half_life)
+
+        self._game_weights = weights
+
+    def _setup_prior(self):
+        """
+        Set up the prior ratings the ridge penalty shrinks toward, in the column order of the teams matrix.
+        """
+        prior = self.prior
+        if isinstance(prior, str) and prior == "previous_season":
+            season = self.start_week.season - 1
+            prior_fitter = _SrsFitter(NflWeek(season, 1), NflWeek(season, 22))
+            prior_fitter.fit()
+            prior = prior_fitter.srs_frame
+
+        if prior is None:
+            self._prior_x = np.zeros(3 * self._n_teams)
+        else:
+            prior = prior.set_index("Team").reindex(self._teams)
+            self._prior_x = (
+                prior[["SRS_O", "SRS_D", "SRS_ST"]]
+                .fillna(0)
+                .to_numpy(dtype=float)
+                .T.ravel()
             )
-            for team in teams
-        }
 
-        # Combine all dictionaries into a single DataFrame
-        teams_df = pd.DataFrame({**offensive_dict, **defensive_dict, **special_dict})
-        self._teams_matrix = teams_df.to_numpy()
+    def _setup_teams_matrix(self):
+        """
+        Set up the dense teams matrix for the SRS calculation.
+
+        The columns are the offensive, defensive and special teams SRS of each team,
+        see `_setup_team_codes` for the layout.
+        """
+        rows = np.arange(len(self._pos_cols))
+        self._teams_matrix = np.zeros((len(rows), 3 * self._n_teams))
+        self._teams_matrix[rows, self._pos_cols] = 1
+        self._teams_matrix[rows, self._neg_cols] = -1
 
     def _solve_least_squares(self):
         """
         Solve the least squares problem to get the SRS values.
         """
+        teams_matrix, score_diff = self._teams_matrix, self._score_diff
+
+        # Scale the rows by the square root of their weight
+        if self._game_weights is not None:
+            row_scale = np.sqrt(np.tile(self._game_weights, 3))
+            teams_matrix = teams_matrix * row_scale[:, None]
+            score_diff = score_diff * row_scale
+
+        # The ridge penalty as extra rows pulling each rating toward its prior
+        if self.ridge:
+            penalty = np.sqrt(self.ridge)
+            teams_matrix = np.vstack(
+                (teams_matrix, penalty * np.eye(3 * self._n_teams))
+            )
+            score_diff = np.concatenate((score_diff, penalty * self._prior_x))
+
         # Run least squares to get the SRS
         self._x, self._residuals, self._rank, self._s = np.linalg.lstsq(
-            self._teams_matrix, self._score_diff, rcond=None
+            teams_matrix, score_diff, rcond=None
+        )
+
+    def _solve_normal_equations(self):
+        """
+        Solve the normal equations of the least squares problem to get the SRS values.
+
+        Every row of the teams matrix has at most two nonzeros,
+        so the normal equations are accumulated from the team codes without building the matrix.
+        """
+        row_weights = None
+        if self._game_weights is not None:
+            row_weights = np.tile(self._game_weights, 3)
+
+        ata, atb = _normal_equations(
+            self._pos_cols,
+            self._neg_cols,
+            self._score_diff,
+            3 * self._n_teams,
+            weights=row_weights,
+        )
+        if self.ridge:
+            self._x = np.linalg.solve(
+                ata + self.ridge * np.eye(len(ata)), atb + self.ridge * self._prior_x
+            )
+        else:
+            self._x = _solve_normal_equations(ata, atb)
+
+    def loo_errors(self, ridges: list[float] = None) -> np.ndarray:
+        """
+        Get the exact leave-one-game-out errors of the predicted margins in closed form.
+
+        With K the (regularized) normal matrix, the residuals of the three rows of a game
+        when the game is left out are (I - H_g)^-1 e_g, where e_g are its residuals in the fit
+        and H_g = w_g A_g K^-1 A_g^T its 3x3 block of the hat matrix.
+        The margin is the offensive minus the defensive plus the special teams equation,
+        so its error is [1, -1, 1] times those residuals. The home field advantage is kept fixed.
+
+        The normal matrix is diagonalized once, so every penalty costs a few matrix products.
+
+        Parameters
+        ----------
+            ridges : list[float], optional
+                The ridge penalties to evaluate, toward the fitter's prior.
+                If not provided, the fitter's penalty is used.
+
+        Returns
+        -------
+            np.ndarray
+                The (n_ridges, n_games) predicted minus actual margin of each game when left out,
+                in the order of the point breakdown. NaN when leaving the game out
+                leaves a rating undetermined.
+        """
+        self._require_data("loo_errors")
+        ridges = [self.ridge or 0.0] if ridges is None else ridges
+        n_games, n_cols = len(self._point_breakdown_df), 3 * self._n_teams
+        weights = np.ones(n_games) if self._game_weights is None else self._game_weights
+        ata, atb = _normal_equations(
+            self._pos_cols,
+            self._neg_cols,
+            self._score_diff,
+            n_cols,
+            weights=np.tile(weights, 3),
+        )
+        eigenvalues, eigenvectors = np.linalg.eigh(ata)
+        tolerance = eigenvalues.max() * n_cols * np.finfo(float).eps
+
+        # The columns of the three rows of each game
+        pos_cols = self._pos_cols.reshape(3, n_games).T
+        neg_cols = self._neg_cols.reshape(3, n_games).T
+
+        errors = np.empty((len(ridges), n_games))
+        for i, ridge in enumerate(ridges):
+            # The (pseudo-)inverse of the regularized normal matrix and the fitted ratings
+            if ridge > 0:
+                inverse_eigenvalues = 1 / (eigenvalues + ridge)
+            else:
+                inverse_eigenvalues = np.divide(
+                    1.0,
+                    eigenvalues,
+                    out=np.zeros_like(eigenvalues),
+                    where=eigenvalues > tolerance,
+                )
+            inverse = (eigenvectors * inverse_eigenvalues) @ eigenvectors.T
+            x = inverse @ (atb + ridge * self._prior_x)
+            residuals = self._score_diff - (x[self._pos_cols] - x[self._neg_cols])
+            residuals = residuals.reshape(3, n_games).T
+
+            # The 3x3 hat matrix block of each game
+            hat = (
+                inverse[pos_cols[:, :, None], pos_cols[:, None, :]]
+                - inverse[pos_cols[:, :, None], neg_cols[:, None, :]]
+                - inverse[neg_cols[:, :, None], pos_cols[:, None, :]]
+                + inverse[neg_cols[:, :, None], neg_cols[:, None, :]]
+            ) * weights[:, None, None]
+
+            # The residuals of each game when left out
+            complement = np.eye(3) - hat
+            defined = np.abs(np.linalg.det(complement)) > 1e-10
+            complement[~defined] = np.eye(3)
+            loo_residuals = np.linalg.solve(complement, residuals[..., None])[..., 0]
+            errors[i] = np.where(defined, -loo_residuals @ np.array([1, -1, 1]), np.nan)
+
+        return errors
+
+    def game_influence(self) -> np.ndarray:
+        """
+        Get the exact change of every team's ratings when each game is left out of the fit.
+
+        Leaving a game out is a rank-3 downdate of the normal matrix, applied to its (pseudo-)inverse
+        with the Woodbury identity, so every game costs a 3x3 solve instead of a refit.
+        The home field advantage is recomputed without the game, as a refit would.
+
+        Returns
+        -------
+            np.ndarray
+                The (n_games, n_teams, 4) normalized SRS, SRS_O, SRS_D, SRS_ST of the fit
+                minus those without each game, in the order of the point breakdown.
+                NaN when leaving the game out leaves a rating undetermined.
+        """
+        self._require_data("game_influence")
+        n_games, n_teams = len(self._point_breakdown_df), self._n_teams
+        inverse, atb_parts, weights = self._inverse_normal_equations()
+        non_neutral = ~self._neutral_mask
+
+        # The home field advantage without each game
+        hfa = np.array([self._hfa_o, self._hfa_d, self._hfa_st])
+        count = non_neutral.sum()
+        differences = self._unit_differences(self._point_breakdown_df)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            hfa_without = (count * hfa - differences * non_neutral[:, None]) / (
+                count - non_neutral
+            )[:, None]
+        signs = np.column_stack(
+            (
+                np.ones(n_games),
+                -hfa_without[:, 0],
+                hfa_without[:, 1],
+                -hfa_without[:, 2],
+            )
+        )
+
+        # The columns and score differentials of the three rows of each game
+        pos_cols = self._pos_cols.reshape(3, n_games).T
+        neg_cols = self._neg_cols.reshape(3, n_games).T
+        targets = _game_targets(self._point_breakdown_df, non_neutral)
+        game_score_diff = np.einsum("egk,gk->ge", targets.reshape(3, n_games, 4), signs)
+
+        # K^-1 A_g^T of each game, and the inverse applied to the right hand side without it
+        design_inverse = (inverse[:, pos_cols] - inverse[:, neg_cols]).transpose(
+            1, 0, 2
+        )
+        x = (inverse @ atb_parts @ signs.T).T
+        if self.ridge:
+            x += inverse @ (self.ridge * self._prior_x)
+        x -= np.einsum("gce,ge->gc", design_inverse, weights[:, None] * game_score_diff)
+
+        # Woodbury downdate by the rows of each game
+        rows = np.arange(n_games)[:, None, None]
+        hat = (
+            design_inverse[rows, pos_cols[:, :, None], np.arange(3)]
+            - design_inverse[rows, neg_cols[:, :, None], np.arange(3)]
+        ) * weights[:, None, None]
+        complement = np.eye(3) - hat
+        defined = np.abs(np.linalg.det(complement)) > 1e-10
+        complement[~defined] = np.eye(3)
+        fitted = np.take_along_axis(x, pos_cols, axis=1) - np.take_along_axis(
+            x, neg_cols, axis=1
+        )
+        correction = np.linalg.solve(
+            complement, (weights[:, None] * fitted)[..., None]
+        )[..., 0]
+        x += np.einsum("gce,ge->gc", design_inverse, correction)
+
+        ratings_without = self._normalized_ratings(x)
+        ratings_without[~defined] = np.nan
+
+        return self._normalized_ratings(self._x[None])[0] - ratings_without
+
+    def what_if(
+        self, scenarios: pd.DataFrame
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the exact ratings of a batch of hypothetical results, without refitting.
+
+        Changing results only changes the targets of the least squares, so the ratings move by
+        the (pseudo-)inverse of the normal matrix applied to the change of the right hand side,
+        including the change of the home field advantage. Every scenario is solved in one product.
+
+        Parameters
+        ----------
+            scenarios : pd.DataFrame
+                One row per changed game of each scenario, with a "scenario" label, the "game_id"
+                of a fitted game and its hypothetical point breakdown, in the columns of
+                `nfl_data.point_breakdown`. The games not listed in a scenario keep their results.
+
+        Returns
+        -------
+            labels, ratings, hfa : tuple[np.ndarray, np.ndarray, np.ndarray]
+                The scenario labels in order of appearance,
+                the (n_scenarios, n_teams, 4) normalized SRS, SRS_O, SRS_D, SRS_ST of each scenario,
+                and the (n_scenarios, 4) hfa, hfa_o, hfa_d, hfa_st of each scenario.
+        """
+        self._require_data("what_if")
+        if scenarios.duplicated(["scenario", "game_id"]).any():
+            raise ValueError("Scenarios change the same game more than once.")
+        game_index = self._point_breakdown_df.index.get_indexer(scenarios["game_id"])
+        if (game_index < 0).any():
+            raise ValueError("Scenarios have games missing from the fit.")
+
+        codes, labels = pd.factorize(scenarios["scenario"])
+        n_scenarios, n_cols = len(labels), 3 * self._n_teams
+        inverse, atb_parts, weights = self._inverse_normal_equations()
+        non_neutral = ~self._neutral_mask[game_index]
+        old_games = self._point_breakdown_df.iloc[game_index]
+
+        # The change of the home field advantage of each scenario
+        delta_hfa = np.zeros((n_scenarios, 3))
+        np.add.at(
+            delta_hfa,
+            codes,
+            (self._unit_differences(scenarios) - self._unit_differences(old_games))
+            * non_neutral[:, None],
+        )
+        delta_hfa /= (~self._neutral_mask).sum()
+        hfa = np.array([self._hfa_o, self._hfa_d, self._hfa_st]) + delta_hfa
+
+        # The change of the right hand side, from the home field advantage of every game
+        # and from the score differentials of the changed games
+        delta_atb = (
+            atb_parts[:, 1:]
+            @ np.column_stack((-delta_hfa[:, 0], delta_hfa[:, 1], -delta_hfa[:, 2])).T
+        ).T
+        delta_score_diff = (
+            _game_targets(scenarios, non_neutral)[:, 0]
+            - _game_targets(old_games, non_neutral)[:, 0]
+        ) * np.tile(weights[game_index], 3)
+        pos_cols, neg_cols = _design_columns(
+            self._home_codes[game_index], self._away_codes[game_index], self._n_teams
+        )
+        scenario_rows = np.tile(codes, 3)
+        np.add.at(delta_atb, (scenario_rows, pos_cols), delta_score_diff)
+        np.add.at(delta_atb, (scenario_rows, neg_cols), -delta_score_diff)
+
+        ratings = self._normalized_ratings(self._x + delta_atb @ inverse)
+
+        return (
+            np.asarray(labels),
+            ratings,
+            np.column_stack((hfa.sum(axis=1), hfa)),
+        )
+
+    def _inverse_normal_equations(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the (pseudo-)inverse of the regularized normal matrix of the fit,
+        the right hand side split as in `_game_targets` and the weight of each game.
+        """
+        n_games, n_cols = len(self._point_breakdown_df), 3 * self._n_teams
+        weights = np.ones(n_games) if self._game_weights is None else self._game_weights
+        ata, atb_parts = _normal_equations(
+            self._pos_cols,
+            self._neg_cols,
+            _game_targets(self._point_breakdown_df, ~self._neutral_mask),
+            n_cols,
+            weights=np.tile(weights, 3),
+        )
+
+        if self.ridge:
+            inverse = np.linalg.inv(ata + self.ridge * np.eye(n_cols))
+        else:
+            inverse = np.linalg.pinv(ata, hermitian=True)
+
+        return inverse, atb_parts, weights
+
+    def _unit_differences(self, games: pd.DataFrame) -> np.ndarray:
+        """
+        Get the home minus away offensive, defensive and special teams points of the given games.
+        """
+        return np.column_stack(
+            [
+                games[f"home_{unit}_points"].to_numpy(dtype=float)
+                - games[f"away_{unit}_points"].to_numpy(dtype=float)
+                for unit in ("offensive", "defensive", "special_teams")
+            ]
         )
 
-    def _create_srs_frame(self):
+    def _normalized_ratings(self, x: np.ndarray) -> np.ndarray:
+        """
+        Get the (..., n_teams, 4) SRS, SRS_O, SRS_D, SRS_ST of (..., 3 * n_teams) solutions,
+        normalized like `_normalize_srs`.
+        """
+        x = x.reshape(*x.shape[:-1], 3, self._n_teams)
+        x = np.swapaxes(x, -1, -2)
+        x = x - x.mean(axis=-2, keepdims=True)
+
+        return np.concatenate((x.sum(axis=-1, keepdims=True), x), axis=-1)
+
+    def _create_srs_frame(self, mov: pd.Series = None):
         """
         Create the SRS DataFrame.
+
+        Parameters
+        ----------
+            mov : pd.Series, optional
+                The MoV of each team, aligned with the teams.
+                If not provided, it is calculated from the schedules.
         """
         # Calculate the MoV and SoS for each team
-        mov = nfl_data.margin_of_victory(
-            self.start_week, self.end_week, self._schedules_df
-        )
-        srs = self._x[:32] + self._x[32:64] + self._x[64:]
-        sos = srs - mov["MoV"].to_numpy()
+        if mov is None and self._session is not None:
+            mov = nfl_data.margin_of_victory(
+                self.start_week, self.end_week, session=self._session
+            )["MoV"]
+        elif mov is None:
+            mov = nfl_data.margin_of_victory(
+                self.start_week, self.end_week, self._schedules_df
+            )["MoV"]
+        n_teams = self._n_teams
+        srs_o = self._x[:n_teams]
+        srs_d = self._x[n_teams : 2 * n_teams]
+        srs_st = self._x[2 * n_teams :]
+        srs = srs_o + srs_d + srs_st
+        sos = srs - mov.to_numpy()
 
         # Create the SRS DataFrame
         self.srs_frame = pd.DataFrame(
             {
-                "Team": pd.Series(
-                    sorted(
-                        pd.concat(
-                            (
-                                self._schedules_df["home_team"],
-                                self._schedules_df["away_team"],
-                            )
-                        ).unique()
-                    )
-                ),
-                "MoV": mov["MoV"],
+                "Team": pd.Series(self._teams.tolist()),
+                "MoV": mov,
                 "SoS": sos,
                 "SRS": srs,
-                "SRS_O": self._x[:32],
-                "SRS_D": self._x[32:64],
-                "SRS_ST": self._x[64:],
+                "SRS_O": srs_o,
+                "SRS_D": srs_d,
+                "SRS_ST": srs_st,
             }
         )
 
@@ -216,159 +1039,1745 @@ class _SrsFitter:
             self.srs_frame["SRS_ST"] - self.srs_frame["SRS_ST"].mean()
         )
 
-
-class _SrsPredictor:
-    def __init__(self, fitter: _SrsFitter):
-        self._srs_frame = fitter.srs_frame
-        self._hfa = fitter._hfa
-        self._hfa_o = fitter._hfa_o
-        self._hfa_d = fitter._hfa_d
-        self._hfa_st = fitter._hfa_st
-
-    def predict(self, games: pd.DataFrame) -> pd.DataFrame:
+    def bootstrap(
+        self, n_samples: int = 1000, seed: int = None
+    ) -> tuple[np.ndarray, np.ndarray]:
         """
-        Predict the spreads for a given schedule.
+        Get bootstrap replicates of the fitted SRS by resampling the games with replacement.
+
+        Each replicate is a vector of game weights. The home field advantage is recomputed
+        from the weighted games, the normal equations of every replicate are built together
+        and solved in stacked chunks.
 
         Parameters
         ----------
-        games : pd.DataFrame
-            A DataFrame containing the game schedule with columns:
-            - 'game_id': Unique identifier for the game
-            - 'home_team': Abbreviation of the home team
-            - 'away_team': Abbreviation of the away team
-            - 'is_neutral': Boolean indicating if the game is played at a neutral site
+            n_samples : int
+                The number of replicates. Default is 1000.
+            seed : int, optional
+                The seed of the resampling.
 
         Returns
         -------
-        pd.DataFrame
-            A DataFrame containing the predicted spreads for each game in the schedule.
+            ratings, hfa : tuple[np.ndarray, np.ndarray]
+                The (n_samples, n_teams, 4) normalized SRS, SRS_O, SRS_D, SRS_ST of each team,
+                NaN for the teams without games in a replicate,
+                and the (n_samples, 4) hfa, hfa_o, hfa_d, hfa_st of each replicate.
         """
-        self._games = games.copy()
+        self._require_data("bootstrap")
+        n_games, n_teams = len(self._point_breakdown_df), self._n_teams
+        rng = np.random.default_rng(seed)
+        weights = rng.multinomial(
+            n_games, np.full(n_games, 1 / n_games), size=n_samples
+        ).astype(float)
 
-        self._merge_srs_data()
-        self._predict_spreads()
+        # The home field advantage of each replicate from the weighted non-neutral games
+        non_neutral = ~self._neutral_mask
+        differences = self._unit_differences(self._point_breakdown_df)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            hfa_components = (weights @ (differences * non_neutral[:, None])) / (
+                weights @ non_neutral
+            )[:, None]
+        hfa = np.column_stack((hfa_components.sum(axis=1), hfa_components))
 
-        return self._games
+        # Remove the home field advantage from the score differentials
+        signs = np.column_stack((np.ones(n_samples), -hfa[:, 1], hfa[:, 2], -hfa[:, 3]))
+        targets = _game_targets(self._point_breakdown_df, non_neutral)
+        groups = np.tile(np.arange(n_games), 3)
 
-    def _merge_srs_data(self):
-        """
-        Merge home and away team SRS data into the games DataFrame.
-        """
-        # Merge home team SRS data
-        self._games = pd.merge(
-            self._games,
-            self._srs_frame[["Team", "SRS", "SRS_O", "SRS_D", "SRS_ST"]].rename(
-                {
-                    "SRS": "SRS_home",
-                    "SRS_O": "SRS_O_home",
-                    "SRS_D": "SRS_D_home",
-                    "SRS_ST": "SRS_ST_home",
-                },
-                axis="columns",
-            ),
-            left_on="home_team",
-            right_on="Team",
-            how="left",
-        ).drop(columns=["Team"])
-
-        # Merge away team SRS data
-        self._games = pd.merge(
-            self._games,
-            self._srs_frame[["Team", "SRS", "SRS_O", "SRS_D", "SRS_ST"]].rename(
-                {
-                    "SRS": "SRS_away",
-                    "SRS_O": "SRS_O_away",
-                    "SRS_D": "SRS_D_away",
-                    "SRS_ST": "SRS_ST_away",
-                },
-                axis="columns",
-            ),
-            left_on="away_team",
-            right_on="Team",
-            how="left",
-        ).drop(columns=["Team"])
-
-    def _predict_spreads(self):
-        """
-        Predict the game spreads based on the SRS values and home field advantage.
-        """
-        # Overal game spreads
-        self._games["pred_spread"] = (
-            self._games["SRS_home"]
-            - self._games["SRS_away"]
-            + self._hfa * ~self._games["is_neutral"]
-        )
-
-        # Offensive component of the spread
-        self._games["pred_spread_O"] = (
-            self._games["SRS_O_home"]
-            - self._games["SRS_O_away"]
-            + self._hfa_o * ~self._games["is_neutral"]
-        )
-
-        # Defensive component of the spread
-        self._games["pred_spread_D"] = (
-            self._games["SRS_D_home"]
-            - self._games["SRS_D_away"]
-            + self._hfa_d * ~self._games["is_neutral"]
-        )
-
-        # Special teams component of the spread
-        self._games["pred_spread_ST"] = (
-            self._games["SRS_ST_home"]
-            - self._games["SRS_ST_away"]
-            + self._hfa_st * ~self._games["is_neutral"]
-        )
-
-        # Drop unnecessary columns
-        self._games = self._games.drop(
-            columns=[
-                "is_neutral",
-                "SRS_home",
-                "SRS_away",
-                "SRS_O_home",
-                "SRS_O_away",
-                "SRS_D_home",
-                "SRS_D_away",
-                "SRS_ST_home",
-                "SRS_ST_away",
-            ]
-        )
+        # The resampled games keep their weights in the least squares
+        fit_weights = weights
+        if self._game_weights is not None:
+            fit_weights = weights * self._game_weights
+
+        ratings = np.full((n_samples, n_teams, 4), np.nan)
+        for chunk_start in range(0, n_samples, _WINDOW_CHUNK_SIZE):
+            chunk = slice(chunk_start, chunk_start + _WINDOW_CHUNK_SIZE)
+            ata, atb_parts = _batched_normal_equations(
+                self._pos_cols,
+                self._neg_cols,
+                targets,
+                3 * n_teams,
+                groups,
+                fit_weights[chunk],
+            )
+            atb = np.einsum("bnk,bk->bn", atb_parts, signs[chunk])
+            if self.ridge:
+                x = np.linalg.solve(
+                    ata + self.ridge * np.eye(3 * n_teams),
+                    (atb + self.ridge * self._prior_x)[..., None],
+                )[..., 0]
+            else:
+                x = _solve_stacked_normal_equations(ata, atb, n_teams)
+            x = x.reshape(-1, 3, n_teams).transpose(0, 2, 1)
 
+            # Normalize over the teams with games in each replicate
+            played = np.diagonal(ata, axis1=-2, axis2=-1)[:, :n_teams] > 0
+            x[~played] = np.nan
+            x -= np.nanmean(x, axis=1, keepdims=True)
+            ratings[chunk, :, 0] = x.sum(axis=2)
+            ratings[chunk, :, 1:] = x
 
-class SrsModel:
-    def __init__(self, start_week: NflWeek, end_week: NflWeek):
+        return ratings, hfa
+
+    def update(self, new_games: pd.DataFrame):
         """
-        Initialize the SRS model with the start and end weeks.
+        Add completed games to the fit without refitting the whole window.
+
+        The normal equations are updated with the rows of the new games,
+        and their factorization with a rank-k Woodbury update.
+        The resulting SRS matches a full refit with the games included, up to rounding error.
 
         Parameters
         ----------
-            start_week : NflWeek
-                The start week of the season (inclusive).
-            end_week : NflWeek
-                The end week of the season (inclusive).
+            new_games : pd.DataFrame
+                The point breakdown of the new games, as returned by `nfl_data.point_breakdown`,
+                with the game ids as a "game_id" column or index. The games must not be in the fit.
+                An optional boolean "is_neutral" column marks the games played at a neutral site,
+                else they are taken from the "location" of the games in the schedules, as in `fit`.
+                The teams' MoV is updated from the scores of the schedules, as in `fit`:
+                the "home_score" and "away_score" columns if given, else the scores of the games in the schedules.
         """
-        self._fitter = _SrsFitter(start_week, end_week)
-        self._fitter.fit()
-
-        self._predictor = _SrsPredictor(self._fitter)
+        self._require_data("update")
+        self._require_unshared("update")
+        self._apply_games(new_games, 1)
 
-    def predict(self, games: pd.DataFrame) -> pd.DataFrame:
+    def remove(self, old_games: pd.DataFrame):
         """
-        Predict the spreads for a given schedule.
+        Remove games from the fit without refitting the whole window, e.g. to slide the window forward.
 
         Parameters
         ----------
-        games : pd.DataFrame
-            A DataFrame containing the game schedule with columns:
-            - 'game_id': Unique identifier for the game
-            - 'home_team': Abbreviation of the home team
-            - 'away_team': Abbreviation of the away team
-            - 'is_neutral': Boolean indicating if the game is played at a neutral site
+            old_games : pd.DataFrame
+                The point breakdown of the games to remove, in the format of `update`.
+                The games must be in the fit.
+        """
+        self._require_data("remove")
+        self._require_unshared("remove")
+        self._apply_games(old_games, -1)
 
-        Returns
-        -------
-        pd.DataFrame
-            A DataFrame containing the predicted spreads for each game in the schedule.
+    def _require_data(self, operation: str):
+        """
+        Check the fitter holds the games of the fit, which a model loaded with `SrsModel.load` does not.
+
+        A model loaded by `SrsModelCache` is instead refit from the data the first time it is needed,
+        so it behaves like the models fit by the cache.
+        """
+        if self._loaded and self._refit_on_demand:
+            with _REFIT_LOCK:
+                if self._loaded:
+                    self._refit()
+        if self._loaded:
+            raise ValueError(
+                f"`{operation}` is not available on a loaded model, which only predicts. "
+                "Fit the model from the data instead."
+            )
+
+    def _refit(self):
+        """
+        Fit a loaded fitter from the data, replacing its saved state.
+
+        The fit runs on a new fitter whose state is then copied over, so the ratings are only replaced
+        once they are complete, and the fitter is marked as fit last.
+        """
+        fitter = _SrsFitter(self.start_week, self.end_week, self.solver)
+        fitter.fit()
+
+        flags = ["_loaded", "_refit_on_demand", "_shared"]
+        self.__dict__.update(
+            {name: value for name, value in vars(fitter).items() if name not in flags}
+        )
+        self._loaded = False
+
+    def _require_unshared(self, operation: str):
         """
-        return self._predictor.predict(games)
\ No newline at end of file
+        Check the fitter does not belong to a model shared by a `SrsModelCache`, which must not be changed.
+        """
+        if self._shared:
+            raise ValueError(
+                f"`{operation}` would change a model shared by the cache. "
+                "Call `copy()` on the model first."
+            )
+
+    def _setup_incremental_state(self):
+        """
+        Set up the running sums and factorization used by the incremental updates.
+        """
+        n_cols = 3 * self._n_teams
+
+        # The normal equations, with the right hand side split as in `_game_targets`
+        self._ata, self._atb_parts = _normal_equations(
+            self._pos_cols,
+            self._neg_cols,
+            _game_targets(self._point_breakdown_df, ~self._neutral_mask),
+            n_cols,
+        )
+
+        # The sums behind the home field advantage
+        self._hfa_sums = self._game_hfa_sums(
+            self._point_breakdown_df, ~self._neutral_mask
+        )
+
+        # The points scored and allowed behind the MoV
+        self._mov_sums = np.zeros((self._n_teams, 3))
+        team_index = pd.Index(self._teams)
+        home_score = self._schedules_df["home_score"].to_numpy(dtype=float)
+        away_score = self._schedules_df["away_score"].to_numpy(dtype=float)
+        for team_col, scored, allowed in (
+            ("home_team", home_score, away_score),
+            ("away_team", away_score, home_score),
+        ):
+            codes = team_index.get_indexer(self._schedules_df[team_col])
+            for i, values in enumerate(
+                (np.nan_to_num(scored), np.nan_to_num(allowed), ~np.isnan(scored))
+            ):
+                self._mov_sums[:, i] += np.bincount(
+                    codes, weights=values, minlength=self._n_teams
+                )
+
+        self._factorize()
+
+    def _game_hfa_sums(
+        self, games: pd.DataFrame, non_neutral: np.ndarray
+    ) -> np.ndarray:
+        """
+        Get the count and home/away point sums of the non-neutral games, in the order of the HFA.
+        """
+        games = games[non_neutral]
+        columns = [
+            "home_offensive_points",
+            "away_offensive_points",
+            "home_defensive_points",
+            "away_defensive_points",
+            "home_special_teams_points",
+            "away_special_teams_points",
+        ]
+
+        return np.concatenate(([len(games)], games[columns].to_numpy().sum(axis=0)))
+
+    def _factorize(self):
+        """
+        Factorize the normal equations for the incremental updates.
+
+        The expected rank deficiency is removed with `_augmented_normal_matrix`.
+        The inverse of the result is kept only when it is nonsingular, i.e. the games connect all the teams.
+        """
+        augmented, self._played = _augmented_normal_matrix(self._ata, self._n_teams)
+
+        if _is_well_posed(augmented):
+            self._ata_inverse = np.linalg.inv(augmented)
+        else:
+            self._ata_inverse = None
+
+    def _apply_games(self, games: pd.DataFrame, sign: int):
+        """
+        Add (sign=1) or remove (sign=-1) games from the fit and update the SRS.
+        """
+        if self._game_weights is not None or self.ridge:
+            raise ValueError(
+                "Incremental updates are not supported with game weights or a ridge penalty."
+            )
+        if getattr(self, "_ata", None) is None:
+            self._setup_incremental_state()
+
+        # Check the games against the games of the fit
+        game_ids = self._game_ids(games)
+        if pd.Index(game_ids).has_duplicates:
+            raise ValueError("Games have duplicate game ids.")
+        in_fit = self._point_breakdown_df.index.isin(game_ids).sum()
+        if sign > 0 and in_fit > 0:
+            raise ValueError("Games are already in the fit.")
+        if sign < 0 and in_fit < len(game_ids):
+            raise ValueError("Games are missing from the fit.")
+        games = games.set_index(pd.Index(game_ids, name="game_id"))
+
+        # Factorize the teams of the games
+        team_index = pd.Index(self._teams)
+        home_codes = team_index.get_indexer(games["home_team"])
+        away_codes = team_index.get_indexer(games["away_team"])
+        if (home_codes < 0).any() or (away_codes < 0).any():
+            raise ValueError("Games have teams missing from the fitted teams.")
+        if "is_neutral" in games:
+            non_neutral = ~games["is_neutral"].to_numpy(dtype=bool)
+        elif sign < 0:
+            positions = self._point_breakdown_df.index.get_indexer(game_ids)
+            non_neutral = ~self._neutral_mask[positions]
+        else:
+            locations = self._game_schedules(games, ["location"])["location"]
+            non_neutral = (locations != "Neutral").to_numpy()
+
+        # Update the normal equations with the rows of the games
+        n_cols = 3 * self._n_teams
+        pos_cols, neg_cols = _design_columns(home_codes, away_codes, self._n_teams)
+        ata, atb_parts = _normal_equations(
+            pos_cols, neg_cols, _game_targets(games, non_neutral), n_cols
+        )
+        self._ata += sign * ata
+        self._atb_parts += sign * atb_parts
+        self._hfa_sums += sign * self._game_hfa_sums(games, non_neutral)
+
+        # Update the scores behind the MoV, as accumulated in `_setup_incremental_state`
+        home_score, away_score = self._game_scores(games)
+        for codes, scored, allowed in (
+            (home_codes, home_score, away_score),
+            (away_codes, away_score, home_score),
+        ):
+            for i, values in enumerate(
+                (np.nan_to_num(scored), np.nan_to_num(allowed), ~np.isnan(scored))
+            ):
+                self._mov_sums[:, i] += sign * np.bincount(
+                    codes, weights=values, minlength=self._n_teams
+                )
+
+        # Keep the point breakdown in sync with the fit
+        if sign > 0:
+            self._point_breakdown_df = pd.concat(
+                (self._point_breakdown_df, games[self._point_breakdown_df.columns])
+            )
+            self._neutral_mask = np.concatenate((self._neutral_mask, ~non_neutral))
+        else:
+            keep = ~self._point_breakdown_df.index.isin(game_ids)
+            self._point_breakdown_df = self._point_breakdown_df[keep]
+            self._neutral_mask = self._neutral_mask[keep]
+        self._setup_team_codes()
+
+        # Rank-k Woodbury update of the inverse, unless the set of teams with games changed
+        played = np.diag(self._ata)[: self._n_teams] > 0
+        if self._ata_inverse is not None and (played == self._played).all():
+            rows = np.arange(len(pos_cols))
+            design = np.zeros((len(rows), n_cols))
+            design[rows, pos_cols] = 1
+            design[rows, neg_cols] = -1
+            inverse_design = self._ata_inverse @ design.T
+            capacitance = sign * np.eye(len(rows)) + design @ inverse_design
+            if np.linalg.cond(capacitance) < 1 / np.finfo(float).eps:
+                self._ata_inverse -= inverse_design @ np.linalg.solve(
+                    capacitance, inverse_design.T
+                )
+            else:
+                self._factorize()
+        else:
+            self._factorize()
+
+        self._solve_incremental()
+        self._revision += 1
+
+    @staticmethod
+    def _game_ids(games: pd.DataFrame) -> np.ndarray:
+        """
+        Get the game ids of the given games, from their "game_id" column or index.
+        """
+        if "game_id" in games.columns:
+            return games["game_id"].to_numpy()
+        if games.index.name == "game_id":
+            return games.index.to_numpy()
+
+        raise ValueError('Games need a "game_id" column or index.')
+
+    def _game_scores(self, games: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get the home and away scores of the given games, indexed by game id,
+        from their columns or else from the schedules.
+        """
+        if "home_score" in games.columns and "away_score" in games.columns:
+            return (
+                games["home_score"].to_numpy(dtype=float),
+                games["away_score"].to_numpy(dtype=float),
+            )
+
+        scores = self._game_schedules(games, ["home_score", "away_score"])
+
+        return (
+            scores["home_score"].to_numpy(dtype=float),
+            scores["away_score"].to_numpy(dtype=float),
+        )
+
+    def _game_schedules(self, games: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+        """
+        Get the given schedule columns of the given games, indexed by game id,
+        from the fitted schedules or else from every schedule.
+        """
+        schedules_df = self._schedules_df
+        if not games.index.isin(schedules_df["game_id"]).all():
+            schedules_df = _source_data.get("schedules", columns=["game_id", *columns])
+        if not games.index.isin(schedules_df["game_id"]).all():
+            raise ValueError("Games are missing from the schedules.")
+
+        return schedules_df.set_index("game_id").reindex(games.index)[columns]
+
+    def _solve_incremental(self):
+        """
+        Solve the updated normal equations and recreate the SRS frame.
+        """
+        # The home field advantage of the updated games
+        count, *sums = self._hfa_sums
+        self._hfa_o = float(sums[0] / count - sums[1] / count)
+        self._hfa_d = float(sums[2] / count - sums[3] / count)
+        self._hfa_st = float(sums[4] / count - sums[5] / count)
+        self._hfa = self._hfa_o + self._hfa_d + self._hfa_st
+
+        atb = self._atb_parts @ np.array([1, -self._hfa_o, self._hfa_d, -self._hfa_st])
+        if self._ata_inverse is not None:
+            self._x = self._ata_inverse @ atb
+        else:
+            self._x = _solve_normal_equations(self._ata, atb)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mov = (self._mov_sums[:, 0] - self._mov_sums[:, 1]) / self._mov_sums[:, 2]
+        self._create_srs_frame(pd.Series(mov))
+        self._normalize_srs()
+
+
+class _SrsPredictor:
+    def __init__(self, fitter: _SrsFitter):
+        """
+        Initialize the predictor with the ratings of a fitted SRS.
+
+        The ratings are kept in one array indexed by team code, with a trailing row of NaN
+        gathered by the teams without a rating, so the spreads are computed with array gathers.
+        The predictor holds no per-call state, so it can be shared between threads.
+
+        Parameters
+        ----------
+            fitter : _SrsFitter
+                The fitted SRS.
+        """
+        srs_frame = fitter.srs_frame
+        self._team_index = pd.Index(srs_frame["Team"])
+        self._ratings = np.vstack(
+            (
+                srs_frame[["SRS", "SRS_O", "SRS_D", "SRS_ST"]].to_numpy(dtype=float),
+                np.full((1, 4), np.nan),
+            )
+        )
+        self._hfa = fitter._hfa
+        self._hfa_o = fitter._hfa_o
+        self._hfa_d = fitter._hfa_d
+        self._hfa_st = fitter._hfa_st
+        self._hfas = np.array([self._hfa, self._hfa_o, self._hfa_d, self._hfa_st])
+        self._setup_spread_tensor()
+
+    def _setup_spread_tensor(self):
+        """
+        Precompute the spread of every matchup, at the home team's venue and at a neutral site.
+
+        The tensor is indexed by venue (0 for home, 1 for neutral), spread component
+        (pred_spread, pred_spread_O, pred_spread_D, pred_spread_ST), home team code and away team code.
+        It includes the trailing NaN row, so the code -1 of the teams without a rating gathers NaN.
+        """
+        differences = self._ratings.T[:, :, None] - self._ratings.T[:, None, :]
+        self._spread_tensor = np.stack(
+            (differences + self._hfas[:, None, None], differences)
+        )
+
+    def team_codes(self, teams: np.ndarray) -> np.ndarray:
+        """
+        Map team abbreviations to their rating codes.
+
+        Parameters
+        ----------
+            teams : np.ndarray
+                The team abbreviations.
+
+        Returns
+        -------
+            np.ndarray
+                The code of each team, -1 for the teams without a rating.
+        """
+        return self._team_index.get_indexer(teams)
+
+    def spreads(
+        self,
+        home_teams: np.ndarray,
+        away_teams: np.ndarray,
+        is_neutral: np.ndarray | bool = False,
+    ) -> np.ndarray:
+        """
+        Predict the spreads of many matchups.
+
+        Parameters
+        ----------
+            home_teams : np.ndarray
+                The home team of each matchup, as abbreviations or codes from `team_codes`.
+            away_teams : np.ndarray
+                The away team of each matchup, as abbreviations or codes from `team_codes`.
+            is_neutral : np.ndarray or bool
+                Whether each matchup is played at a neutral site. Default is False.
+
+        Returns
+        -------
+            np.ndarray
+                The (n_matchups, 4) pred_spread, pred_spread_O, pred_spread_D, pred_spread_ST
+                of each matchup, NaN when either team has no rating.
+        """
+        home_codes, away_codes = np.asarray(home_teams), np.asarray(away_teams)
+        if not np.issubdtype(home_codes.dtype, np.integer):
+            home_codes = self.team_codes(home_codes)
+        if not np.issubdtype(away_codes.dtype, np.integer):
+            away_codes = self.team_codes(away_codes)
+        non_neutral = ~np.asarray(is_neutral, dtype=bool)
+
+        return (
+            self._ratings[home_codes]
+            - self._ratings[away_codes]
+            + self._hfas * non_neutral[..., None]
+        )
+
+    def spread_tensor(self) -> np.ndarray:
+        """
+        Get the precomputed spread of every matchup.
+
+        Returns
+        -------
+            np.ndarray
+                The (2, 4, n_teams, n_teams) spreads, indexed by venue (0 for home, 1 for neutral),
+                spread component (pred_spread, pred_spread_O, pred_spread_D, pred_spread_ST),
+                home team code and away team code.
+        """
+        return self._spread_tensor[:, :, :-1, :-1]
+
+    def lookup_spreads(
+        self,
+        home_codes: np.ndarray | int,
+        away_codes: np.ndarray | int,
+        is_neutral: np.ndarray | bool = False,
+    ) -> np.ndarray:
+        """
+        Look up the precomputed spreads of single or batched matchups.
+
+        Parameters
+        ----------
+            home_codes : np.ndarray or int
+                The code of the home team of each matchup, from `team_codes`.
+            away_codes : np.ndarray or int
+                The code of the away team of each matchup, from `team_codes`.
+            is_neutral : np.ndarray or bool
+                Whether each matchup is played at a neutral site. Default is False.
+
+        Returns
+        -------
+            np.ndarray
+                The (..., 4) pred_spread, pred_spread_O, pred_spread_D, pred_spread_ST of each matchup,
+                NaN when either team has no rating.
+        """
+        venues = np.asarray(is_neutral, dtype=np.intp)
+        return self._spread_tensor[venues, :, home_codes, away_codes]
+
+    def predict(self, games: pd.DataFrame) -> pd.DataFrame:
+        """
+        Predict the spreads for a given schedule.
+
+        Parameters
+        ----------
+        games : pd.DataFrame
+            A DataFrame containing the game schedule with columns:
+            - 'game_id': Unique identifier for the game
+            - 'home_team': Abbreviation of the home team
+            - 'away_team': Abbreviation of the away team
+            - 'is_neutral': Boolean indicating if the game is played at a neutral site
+
+        Returns
+        -------
+        pd.DataFrame
+            A DataFrame containing the predicted spreads for each game in the schedule.
+        """
+        spreads = self.spreads(
+            games["home_team"].to_numpy(),
+            games["away_team"].to_numpy(),
+            games["is_neutral"].to_numpy(),
+        )
+
+        # Keep the given columns, re-indexed like a merge would
+        games = games.drop(columns=["is_neutral"]).reset_index(drop=True)
+        games[["pred_spread", "pred_spread_O", "pred_spread_D", "pred_spread_ST"]] = (
+            spreads
+        )
+
+        return games
+
+
+class _SrsWindowFitter:
+    def __init__(
+        self,
+        start_week: NflWeek,
+        end_week: NflWeek,
+        schedules_df: pd.DataFrame = None,
+        point_breakdown_df: pd.DataFrame = None,
+    ):
+        """
+        Initialize the window fitter with the weeks covering every window to fit.
+
+        The data is loaded once, and the normal equations of each week are accumulated into prefix sums,
+        so the SRS of any window is solved without revisiting the games.
+
+        Parameters
+        ----------
+            start_week : NflWeek
+                The earliest start week of the windows (inclusive).
+            end_week : NflWeek
+                The latest end week of the windows (inclusive).
+            schedules_df : pd.DataFrame, optional
+                A DataFrame containing the schedule data, covering at least the given weeks.
+                If not provided, it will be fetched.
+            point_breakdown_df : pd.DataFrame, optional
+                A DataFrame containing the point breakdown data, covering at least the given weeks.
+                If not provided, it will be fetched.
+                Games missing from the schedules of the given weeks are not included.
+        """
+        self.start_week = start_week
+        self.end_week = end_week
+        self._schedules_df = schedules_df
+        self._point_breakdown_df = point_breakdown_df
+
+    def prepare(self):
+        self._get_data()
+        self._setup_weekly_systems()
+
+    def _get_data(self):
+        """
+        Get the relevant computational data for every window.
+        """
+        # Use the readily available data when given
+        if isinstance(self._schedules_df, pd.DataFrame):
+            self._schedules_df = nfl_data.filter_data_weekly(
+                self._schedules_df, self.start_week, self.end_week
+            )
+        else:
+            self._schedules_df = nfl_data.schedules(self.start_week, self.end_week)
+        if not isinstance(self._point_breakdown_df, pd.DataFrame):
+            self._point_breakdown_df = nfl_data.point_breakdown(
+                self.start_week, self.end_week
+            )
+        self._cube = nfl_data.TeamWeekCube(
+            self.start_week,
+            self.end_week,
+            self._schedules_df,
+            self._point_breakdown_df,
+        )
+        self._teams = self._cube.teams
+        self._n_teams = len(self._teams)
+
+    def _setup_weekly_systems(self):
+        """
+        Accumulate the prefix sums of the normal equations of each week.
+
+        The right hand side is kept in four parts, the score differentials and the neutral site indicators
+        of each equation, so the home field advantage of a window is applied after summing.
+        """
+        # Get the week and location of each game, aligned with the point breakdown
+        games = pd.DataFrame(
+            {
+                "key": nfl_data.week_key(self._schedules_df),
+                "neutral": self._schedules_df["location"] == "Neutral",
+            }
+        )
+        games.index = self._schedules_df["game_id"].to_numpy()
+        games = games.reindex(self._point_breakdown_df.index)
+        mask = games["key"].notna().to_numpy()
+        point_breakdown_df = self._point_breakdown_df[mask]
+        week_idx = np.searchsorted(self._cube.week_keys, games["key"].to_numpy()[mask])
+        non_neutral = ~games["neutral"].to_numpy(dtype=bool)[mask]
+
+        # Factorize the home and away teams of each game
+        team_index = pd.Index(self._teams)
+        self._home_codes = team_index.get_indexer(point_breakdown_df["home_team"])
+        self._away_codes = team_index.get_indexer(point_breakdown_df["away_team"])
+        pos_cols, neg_cols = _design_columns(
+            self._home_codes, self._away_codes, self._n_teams
+        )
+
+        # The score differentials and neutral site indicators of each equation
+        targets = _game_targets(point_breakdown_df, non_neutral)
+
+        # Normal equations of each week, then the prefix sums over the weeks
+        n_weeks, n_cols = len(self._cube.week_keys), 3 * self._n_teams
+        ata, atb = _normal_equations(
+            pos_cols, neg_cols, targets, n_cols, np.tile(week_idx, 3), n_weeks
+        )
+        self._week_ata, self._week_atb = ata, atb
+        self._ata_prefix = np.concatenate(
+            (np.zeros((1, n_cols, n_cols)), np.cumsum(ata, axis=0))
+        )
+        self._atb_prefix = np.concatenate(
+            (np.zeros((1, n_cols, 4)), np.cumsum(atb, axis=0))
+        )
+
+    def _window_systems(
+        self, windows: list[tuple[NflWeek, NflWeek]]
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the normal equations and home field advantage of each window.
+
+        Returns
+        -------
+            ata, atb, hfa : tuple[np.ndarray, np.ndarray, np.ndarray]
+                The (n_windows, n, n) normal matrices, (n_windows, n) right hand sides
+                and (n_windows, 4) hfa, hfa_o, hfa_d, hfa_st.
+        """
+        lower, upper = self._cube.window_bounds(windows)
+        hfa = self._cube.home_field_advantage_windows(windows)
+
+        ata = self._ata_prefix[upper] - self._ata_prefix[lower]
+        atb_parts = self._atb_prefix[upper] - self._atb_prefix[lower]
+
+        # Remove the home field advantage from the score differentials
+        signs = np.column_stack(
+            (np.ones(len(windows)), -hfa[:, 1], hfa[:, 2], -hfa[:, 3])
+        )
+        atb = np.einsum("wnk,wk->wn", atb_parts, signs)
+
+        return ata, atb, hfa
+
+    def solve_windows(
+        self, windows: list[tuple[NflWeek, NflWeek]]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Solve the SRS of every window in stacked chunks.
+
+        Parameters
+        ----------
+            windows : list[tuple[NflWeek, NflWeek]]
+                The (start, end) weeks of each window (both inclusive), within the fitter's weeks.
+
+        Returns
+        -------
+            ratings, hfa : tuple[np.ndarray, np.ndarray]
+                The (n_windows, n_teams, 3) normalized SRS_O, SRS_D, SRS_ST of each team,
+                NaN for the teams not scheduled during a window (and every team of a window without games),
+                and the (n_windows, 4) hfa, hfa_o, hfa_d, hfa_st of each window.
+        """
+        n_teams = self._n_teams
+        ratings = np.full((len(windows), n_teams, 3), np.nan)
+        hfa = np.empty((len(windows), 4))
+        scheduled = self._cube.team_totals_windows(windows)[..., 0] > 0
+
+        # Bound the memory of the stacked normal matrices
+        for chunk_start in range(0, len(windows), _WINDOW_CHUNK_SIZE):
+            chunk = slice(chunk_start, chunk_start + _WINDOW_CHUNK_SIZE)
+            ata, atb, hfa[chunk] = self._window_systems(windows[chunk])
+
+            # Solve the windows with games together
+            has_games = ata.any(axis=(1, 2))
+            x = _solve_stacked_normal_equations(ata[has_games], atb[has_games], n_teams)
+            x = x.reshape(-1, 3, n_teams).transpose(0, 2, 1)
+
+            # Normalize over the teams scheduled during each window
+            present = scheduled[chunk][has_games]
+            x[~present] = np.nan
+            x -= np.nanmean(x, axis=1, keepdims=True)
+            ratings[np.arange(len(windows))[chunk][has_games]] = x
+
+        return ratings, hfa
+
+    def decay_errors(
+        self,
+        first_week: NflWeek,
+        last_week: NflWeek,
+        half_lives: np.ndarray,
+        window: Literal["season"] | None = "season",
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the errors of recency-weighted SRS predictions of each week, for many half-lives at once.
+
+        The decayed normal equations of every half-life follow the weekly recurrence
+        M_t = d * M_{t-1} + E_t, where E_t are the normal equations of week t and d = 0.5 ** (1 / half_life).
+        Each week's games are predicted from the stacked solve of the previous week's systems.
+
+        Parameters
+        ----------
+            first_week : NflWeek
+                The first week to predict (inclusive), after the fitter's start week.
+            last_week : NflWeek
+                The last week to predict (inclusive), within the fitter's weeks.
+            half_lives : np.ndarray
+                The half-lives in weeks to evaluate. np.inf gives equal weights.
+            window : "season", optional
+                "season" restarts the weights at each season. If None, the weights expand
+                from the fitter's start week.
+
+        Returns
+        -------
+            n_games, abs_errors, squared_errors : tuple[np.ndarray, np.ndarray, np.ndarray]
+                The number of predicted games, and the sums of absolute and squared errors
+                of each half-life.
+        """
+        decays = 0.5 ** (1 / np.asarray(half_lives, dtype=float))
+        week_keys, n_teams = self._cube.week_keys, self._n_teams
+
+        # Get the played games and their week
+        schedules_df = self._schedules_df
+        result = (schedules_df["home_score"] - schedules_df["away_score"]).to_numpy(
+            dtype=float
+        )
+        played = ~np.isnan(result)
+        game_week = np.searchsorted(week_keys, nfl_data.week_key(schedules_df))[played]
+        team_index = pd.Index(self._teams)
+        home_codes = team_index.get_indexer(schedules_df["home_team"])[played]
+        away_codes = team_index.get_indexer(schedules_df["away_team"])[played]
+        non_neutral = (schedules_df["location"] != "Neutral").to_numpy()[played]
+        result = result[played]
+
+        # The as-of weeks preceding each predicted week, and the home field advantage of their windows
+        first_key = nfl_data.week_key(first_week)
+        last_key = nfl_data.week_key(last_week)
+        targets = [
+            idx
+            for idx in range(1, len(week_keys))
+            if first_key <= week_keys[idx] <= last_key and (game_week == idx).any()
+        ]
+        windows = []
+        for idx in targets:
+            season, week = divmod(int(week_keys[idx - 1]), 100)
+            start_week = NflWeek(season, 1) if window == "season" else self.start_week
+            windows.append((start_week, NflWeek(season, week)))
+        hfa = dict(zip(targets, self._cube.home_field_advantage_windows(windows)))
+
+        ata = np.zeros((len(decays), *self._week_ata.shape[1:]))
+        atb = np.zeros((len(decays), *self._week_atb.shape[1:]))
+        n_games = np.zeros(len(decays))
+        abs_errors = np.zeros(len(decays))
+        squared_errors = np.zeros(len(decays))
+        for idx in range(len(week_keys) - 1):
+            # Restart the weights at the start of a season
+            if (
+                window == "season"
+                and idx > 0
+                and week_keys[idx] // 100 != week_keys[idx - 1] // 100
+            ):
+                ata[:] = 0
+                atb[:] = 0
+            ata = decays[:, None, None] * ata + self._week_ata[idx]
+            atb = decays[:, None, None] * atb + self._week_atb[idx]
+
+            if idx + 1 not in hfa:
+                continue
+
+            # Solve the SRS of every half-life as of this week
+            signs = np.array([1, -hfa[idx + 1][1], hfa[idx + 1][2], -hfa[idx + 1][3]])
+            x = _solve_stacked_normal_equations(ata, atb @ signs, n_teams)
+            srs = x.reshape(-1, 3, n_teams).sum(axis=1)
+            srs[np.diagonal(ata, axis1=-2, axis2=-1)[:, :n_teams] == 0] = np.nan
+
+            # Score the predictions of the next week's games
+            games = game_week == idx + 1
+            spreads = (
+                srs[:, home_codes[games]]
+                - srs[:, away_codes[games]]
+                + hfa[idx + 1][0] * non_neutral[games]
+            )
+            errors = spreads - result[games]
+            rated = ~np.isnan(errors)
+            n_games += rated.sum(axis=1)
+            abs_errors += np.where(rated, np.abs(errors), 0).sum(axis=1)
+            squared_errors += np.where(rated, errors**2, 0).sum(axis=1)
+
+        return n_games, abs_errors, squared_errors
+
+    def fit_windows(self, windows: list[tuple[NflWeek, NflWeek]]) -> pd.DataFrame:
+        """
+        Fit the SRS of every window.
+
+        Parameters
+        ----------
+            windows : list[tuple[NflWeek, NflWeek]]
+                The (start, end) weeks of each window (both inclusive), within the fitter's weeks.
+
+        Returns
+        -------
+            pd.DataFrame
+                The SRS frame of each window, labelled by the season and week the window ends on,
+                with the window's home field advantage. Windows without any games are left out.
+        """
+        ratings, hfa = self.solve_windows(windows)
+        mov = self._cube.margin_of_victory_windows(windows)
+
+        # One row per window and rated team
+        window_idx, team_idx = np.nonzero(~np.isnan(ratings[..., 0]))
+        srs = ratings[window_idx, team_idx].sum(axis=1)
+        srs_frame = pd.DataFrame(
+            {
+                "season": [windows[i][1].season for i in window_idx],
+                "week": [windows[i][1].week for i in window_idx],
+                "Team": self._teams[team_idx].tolist(),
+                "MoV": mov[window_idx, team_idx],
+                "SoS": srs - mov[window_idx, team_idx],
+                "SRS": srs,
+                "SRS_O": ratings[window_idx, team_idx, 0],
+                "SRS_D": ratings[window_idx, team_idx, 1],
+                "SRS_ST": ratings[window_idx, team_idx, 2],
+                "HFA": hfa[window_idx, 0],
+                "HFA_O": hfa[window_idx, 1],
+                "HFA_D": hfa[window_idx, 2],
+                "HFA_ST": hfa[window_idx, 3],
+            }
+        )
+
+        return srs_frame
+
+
+def fit_windows(
+    windows: list[tuple[NflWeek, NflWeek]],
+    schedules_df: pd.DataFrame = None,
+    point_breakdown_df: pd.DataFrame = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Fit the SRS of many week windows at once.
+
+    The data covering every window is loaded once, the normal equations of all the windows
+    are stacked into one array and solved together.
+
+    Parameters
+    ----------
+        windows : list[tuple[NflWeek, NflWeek]]
+            The (start, end) weeks of each window (both inclusive).
+            See `nfl_data.week_windows` for building rolling windows.
+        schedules_df : pd.DataFrame, optional
+            A DataFrame containing the schedule data, covering at least the windows.
+            If not provided, it will be fetched.
+        point_breakdown_df : pd.DataFrame, optional
+            A DataFrame containing the point breakdown data, covering at least the windows.
+            If not provided, it will be fetched.
+
+    Returns
+    -------
+        teams, ratings, hfa : tuple[np.ndarray, np.ndarray, np.ndarray]
+            The team abbreviations, the (n_windows, n_teams, 3) normalized SRS_O, SRS_D, SRS_ST
+            (NaN for the teams not scheduled during a window),
+            and the (n_windows, 4) hfa, hfa_o, hfa_d, hfa_st of each window.
+    """
+    start_week = min((start for start, _ in windows), key=nfl_data.week_key)
+    end_week = max((end for _, end in windows), key=nfl_data.week_key)
+
+    fitter = _SrsWindowFitter(start_week, end_week, schedules_df, point_breakdown_df)
+    fitter.prepare()
+    ratings, hfa = fitter.solve_windows(windows)
+
+    return fitter._teams, ratings, hfa
+
+
+class SrsModel:
+    def __init__(
+        self,
+        start_week: NflWeek,
+        end_week: NflWeek,
+        solver: Literal["normal", "lstsq"] = "normal",
+        session: nfl_data.AnalysisSession = None,
+        game_weights: pd.Series = None,
+        half_life: float = None,
+        ridge: float = None,
+        prior: pd.DataFrame | Literal["previous_season"] = None,
+    ):
+        """
+        Initialize the SRS model with the start and end weeks.
+
+        Parameters
+        ----------
+            start_week : NflWeek
+                The start week of the season (inclusive).
+            end_week : NflWeek
+                The end week of the season (inclusive).
+            solver : {"normal", "lstsq"}
+                The least squares solver, see `_SrsFitter`.
+            session : nfl_data.AnalysisSession, optional
+                A session covering the weeks, sharing its data with other analyses.
+                If not provided, the data is fetched.
+            game_weights : pd.Series, optional
+                The weight of each game, indexed by game id, see `_SrsFitter`.
+            half_life : float, optional
+                The half-life in weeks of the game weights, see `_SrsFitter`.
+                See `decay_search` for choosing it.
+            ridge : float, optional
+                The ridge penalty toward the prior ratings, see `_SrsFitter`.
+                See `ridge_search` for choosing it.
+            prior : pd.DataFrame or "previous_season", optional
+                The prior ratings of the ridge penalty, see `_SrsFitter`.
+        """
+        self._fitter = _SrsFitter(
+            start_week,
+            end_week,
+            solver,
+            session,
+            game_weights,
+            half_life,
+            ridge,
+            prior,
+        )
+        self._fitter.fit()
+
+        # Fingerprint the files after the fit, which downloads the missing ones
+        self._fingerprint = _data_fingerprint(start_week, end_week)
+        self._predictor = _SrsPredictor(self._fitter)
+        self._bootstrap_ratings = self._bootstrap_hfa = None
+
+    def save(self, path: str):
+        """
+        Save the fitted model to a compact binary file.
+
+        The ratings, teams, home field advantage, fit window, solver and data fingerprint
+        are written with `np.savez`, so the model is reloaded without refitting.
+
+        Parameters
+        ----------
+            path : str
+                The path of the file. The ".npz" extension is appended if missing.
+        """
+        fitter = self._fitter
+        np.savez(
+            path,
+            version=np.array(_SAVE_FORMAT_VERSION),
+            teams=fitter.srs_frame["Team"].to_numpy(dtype=str),
+            ratings=fitter.srs_frame[_SAVED_SRS_COLUMNS].to_numpy(dtype=float),
+            hfa=np.array([fitter._hfa, fitter._hfa_o, fitter._hfa_d, fitter._hfa_st]),
+            window=np.array(
+                [
+                    fitter.start_week.season,
+                    fitter.start_week.week,
+                    fitter.end_week.season,
+                    fitter.end_week.week,
+                ]
+            ),
+            solver=np.array(fitter.solver),
+            fingerprint=np.array(self._fingerprint),
+        )
+
+    @classmethod
+    def load(cls, path: str, check_stale: bool = True) -> "SrsModel":
+        """
+        Load a model saved with `save`.
+
+        Only the ratings are saved, so a loaded model is prediction-only:
+        `predict`, `spreads`, `team_codes`, `spread_tensor`, `lookup_spreads` and `ratings` are available,
+        while `bootstrap`, `rating_intervals`, `predict_intervals`, `game_influence`, `what_if`,
+        `what_if_predict` and the fitter's `update` and `remove`, which need the games of the fit,
+        raise a ValueError.
+
+        Parameters
+        ----------
+            path : str
+                The path of the file.
+            check_stale : bool
+                If True, the model is rejected when the local data files it was fit from have changed.
+                This only reads the size and modification time of the files.
+                If False, the datastore is not touched. Default is True.
+
+        Returns
+        -------
+            SrsModel
+                The fitted model.
+        """
+        with np.load(path, allow_pickle=False) as saved:
+            if int(saved["version"]) != _SAVE_FORMAT_VERSION:
+                raise ValueError(
+                    f"Unsupported model file version {int(saved['version'])}, "
+                    f"expected {_SAVE_FORMAT_VERSION}."
+                )
+            start_season, start_week, end_season, end_week = saved["window"].tolist()
+            teams = saved["teams"].tolist()
+            ratings = saved["ratings"]
+            hfa = saved["hfa"].tolist()
+            solver = str(saved["solver"])
+            fingerprint = str(saved["fingerprint"])
+
+        # Restore the fitted state needed for predictions
+        fitter = _SrsFitter(
+            NflWeek(start_season, start_week), NflWeek(end_season, end_week), solver
+        )
+        fitter._teams = np.array(teams, dtype=object)
+        fitter._n_teams = len(teams)
+        fitter.srs_frame = pd.DataFrame(ratings, columns=_SAVED_SRS_COLUMNS)
+        fitter.srs_frame.insert(0, "Team", pd.Series(teams))
+        fitter._hfa, fitter._hfa_o, fitter._hfa_d, fitter._hfa_st = hfa
+        fitter._loaded = True
+
+        model = cls.__new__(cls)
+        model._fingerprint = fingerprint
+        model._fitter = fitter
+        model._predictor = _SrsPredictor(fitter)
+        model._bootstrap_ratings = model._bootstrap_hfa = None
+
+        if check_stale and model.is_stale():
+            raise ValueError(
+                f'The model saved at "{path}" is stale, the data it was fit from has changed.'
+            )
+
+        return model
+
+    def bootstrap(self, n_samples: int = 1000, seed: int = None):
+        """
+        Resample the games of the fit to quantify the uncertainty of the ratings and spreads.
+
+        The replicates are kept for `rating_intervals` and `predict_intervals`, see `_SrsFitter.bootstrap`,
+        until the fitter's `update` or `remove` changes the games of the fit.
+
+        Parameters
+        ----------
+            n_samples : int
+                The number of replicates. Default is 1000.
+            seed : int, optional
+                The seed of the resampling.
+        """
+        self._fitter._require_unshared("bootstrap")
+        self._bootstrap_ratings, self._bootstrap_hfa = self._fitter.bootstrap(
+            n_samples, seed
+        )
+        self._bootstrap_revision = self._fitter._revision
+
+    def rating_intervals(self, level: float = 0.95) -> pd.DataFrame:
+        """
+        Get the bootstrap percentile intervals of the ratings. Requires `bootstrap`.
+
+        Parameters
+        ----------
+            level : float
+                The confidence level of the intervals. Default is 0.95.
+
+        Returns
+        -------
+            pd.DataFrame
+                The "Team", and the "_lower" and "_upper" bounds of "SRS", "SRS_O", "SRS_D" and "SRS_ST".
+        """
+        self._fitter._require_data("rating_intervals")
+        self._require_bootstrap(level)
+        lower, upper = self._percentiles(self._bootstrap_ratings, level)
+
+        intervals = pd.DataFrame({"Team": self._fitter.srs_frame["Team"]})
+        for i, column in enumerate(["SRS", "SRS_O", "SRS_D", "SRS_ST"]):
+            intervals[f"{column}_lower"] = lower[:, i]
+            intervals[f"{column}_upper"] = upper[:, i]
+
+        return intervals
+
+    def predict_intervals(
+        self, games: pd.DataFrame, level: float = 0.95
+    ) -> pd.DataFrame:
+        """
+        Predict the spreads for a given schedule with their bootstrap percentile intervals.
+        Requires `bootstrap`.
+
+        Parameters
+        ----------
+            games : pd.DataFrame
+                The game schedule, see `predict`.
+            level : float
+                The confidence level of the intervals. Default is 0.95.
+
+        Returns
+        -------
+            pd.DataFrame
+                The predictions of `predict`, with the "_lower" and "_upper" bounds of
+                "pred_spread", "pred_spread_O", "pred_spread_D" and "pred_spread_ST".
+        """
+        self._fitter._require_data("predict_intervals")
+        self._require_bootstrap(level)
+        predictions = self.predict(games)
+
+        # The spreads of every replicate, with NaN for the teams without a rating
+        n_samples = len(self._bootstrap_ratings)
+        ratings = np.concatenate(
+            (self._bootstrap_ratings, np.full((n_samples, 1, 4), np.nan)), axis=1
+        )
+        home_codes = self.team_codes(games["home_team"])
+        away_codes = self.team_codes(games["away_team"])
+        non_neutral = ~games["is_neutral"].to_numpy(dtype=bool)
+        spreads = (
+            ratings[:, home_codes]
+            - ratings[:, away_codes]
+            + self._bootstrap_hfa[:, None, :] * non_neutral[:, None]
+        )
+
+        lower, upper = self._percentiles(spreads, level)
+        for i, column in enumerate(
+            ["pred_spread", "pred_spread_O", "pred_spread_D", "pred_spread_ST"]
+        ):
+            predictions[f"{column}_lower"] = lower[:, i]
+            predictions[f"{column}_upper"] = upper[:, i]
+
+        return predictions
+
+    def _require_bootstrap(self, level: float):
+        """
+        Check the bootstrap replicates exist and the confidence level is valid.
+
+        The replicates are discarded once the fitter's `update` or `remove` changed the games of the fit.
+        """
+        if (
+            self._bootstrap_ratings is not None
+            and self._bootstrap_revision != self._fitter._revision
+        ):
+            self._bootstrap_ratings = self._bootstrap_hfa = None
+            raise ValueError(
+                "The games of the fit changed since `bootstrap()`. Call `bootstrap()` again."
+            )
+        if self._bootstrap_ratings is None:
+            raise ValueError("No bootstrap replicates. Call `bootstrap()` first.")
+        if not 0 < level < 1:
+            raise ValueError(f"Confidence level must be between 0 and 1, got {level}.")
+
+    def _percentiles(
+        self, replicates: np.ndarray, level: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get the lower and upper percentiles of the bootstrap replicates, along the first axis.
+        """
+        tail = 50 * (1 - level)
+        with warnings.catch_warnings():
+            # Teams never resampled have all-NaN replicates
+            warnings.simplefilter("ignore", RuntimeWarning)
+            lower, upper = np.nanpercentile(replicates, [tail, 100 - tail], axis=0)
+
+        return lower, upper
+
+    def copy(self) -> "SrsModel":
+        """
+        Get an independent copy of the model, which can be changed even if the model is shared by a cache.
+        """
+        model = copy.deepcopy(self)
+        model._fitter._shared = False
+
+        return model
+
+    def is_stale(self) -> bool:
+        """
+        Check whether the local data files the model was fit from have changed since.
+        """
+        return self._fingerprint != _data_fingerprint(
+            self._fitter.start_week, self._fitter.end_week
+        )
+
+    @classmethod
+    def cached(
+        cls,
+        start_week: NflWeek,
+        end_week: NflWeek,
+        solver: Literal["normal", "lstsq"] = "normal",
+        cache: "SrsModelCache" = None,
+    ) -> "SrsModel":
+        """
+        Get the model fit over the given weeks from a cache, fitting it only on a miss.
+
+        Parameters
+        ----------
+            start_week : NflWeek
+                The start week of the season (inclusive).
+            end_week : NflWeek
+                The end week of the season (inclusive).
+            solver : {"normal", "lstsq"}
+                The least squares solver, see `_SrsFitter`.
+            cache : SrsModelCache, optional
+                The cache to use. If not provided, the shared in-memory cache is used.
+
+        Returns
+        -------
+            SrsModel
+                The fitted model, shared with the other callers of the same weeks and solver.
+                It must not be changed: `bootstrap` and the fitter's `update` and `remove` raise a ValueError,
+                call `copy()` first to change it.
+        """
+        if cache is None:
+            cache = _MODEL_CACHE
+
+        return cache.get(start_week, end_week, solver)
+
+    def ratings(self, compact: bool = False) -> pd.DataFrame:
+        """
+        Get the fitted ratings of each team.
+
+        Parameters
+        ----------
+            compact : bool
+                If True, the ratings are returned in float32 with categorical teams,
+                see `nfl_data.compact_frame` for the precision bound.
+
+        Returns
+        -------
+            pd.DataFrame
+                A copy of the SRS frame, with the "Team", "MoV", "SoS", "SRS", "SRS_O", "SRS_D" and "SRS_ST".
+        """
+        if compact:
+            return nfl_data.compact_frame(self._fitter.srs_frame)
+        return self._fitter.srs_frame.copy()
+
+    def predict(self, games: pd.DataFrame, compact: bool = False) -> pd.DataFrame:
+        """
+        Predict the spreads for a given schedule.
+
+        Parameters
+        ----------
+        games : pd.DataFrame
+            A DataFrame containing the game schedule with columns:
+            - 'game_id': Unique identifier for the game
+            - 'home_team': Abbreviation of the home team
+            - 'away_team': Abbreviation of the away team
+            - 'is_neutral': Boolean indicating if the game is played at a neutral site
+        compact : bool
+            If True, the predictions are returned in float32 with categorical teams,
+            see `nfl_data.compact_frame` for the precision bound.
+
+        Returns
+        -------
+        pd.DataFrame
+            A DataFrame containing the predicted spreads for each game in the schedule.
+        """
+        predictions = self._predictor.predict(games)
+        if compact:
+            return nfl_data.compact_frame(predictions)
+        return predictions
+
+    def spreads(
+        self,
+        home_teams: np.ndarray,
+        away_teams: np.ndarray,
+        is_neutral: np.ndarray | bool = False,
+    ) -> np.ndarray:
+        """
+        Predict the spreads of many matchups without building a DataFrame.
+
+        Parameters
+        ----------
+            home_teams : np.ndarray
+                The home team of each matchup, as abbreviations or codes from `team_codes`.
+            away_teams : np.ndarray
+                The away team of each matchup, as abbreviations or codes from `team_codes`.
+            is_neutral : np.ndarray or bool
+                Whether each matchup is played at a neutral site. Default is False.
+
+        Returns
+        -------
+            np.ndarray
+                The (n_matchups, 4) pred_spread, pred_spread_O, pred_spread_D, pred_spread_ST
+                of each matchup, NaN when either team has no rating.
+        """
+        return self._predictor.spreads(home_teams, away_teams, is_neutral)
+
+    def team_codes(self, teams: np.ndarray) -> np.ndarray:
+        """
+        Map team abbreviations to the codes accepted by `spreads` and `lookup_spreads`.
+
+        Parameters
+        ----------
+            teams : np.ndarray
+                The team abbreviations.
+
+        Returns
+        -------
+            np.ndarray
+                The code of each team, -1 for the teams without a rating.
+        """
+        return self._predictor.team_codes(teams)
+
+    def spread_tensor(self) -> np.ndarray:
+        """
+        Get the spread of every matchup, precomputed when the model is fit.
+
+        Returns
+        -------
+            np.ndarray
+                The (2, 4, n_teams, n_teams) spreads, indexed by venue (0 for home, 1 for neutral),
+                spread component (pred_spread, pred_spread_O, pred_spread_D, pred_spread_ST),
+                home team code and away team code.
+        """
+        return self._predictor.spread_tensor()
+
+    def lookup_spreads(
+        self,
+        home_codes: np.ndarray | int,
+        away_codes: np.ndarray | int,
+        is_neutral: np.ndarray | bool = False,
+    ) -> np.ndarray:
+        """
+        Look up the spreads of single or batched matchups in the precomputed spread tensor.
+
+        Parameters
+        ----------
+            home_codes : np.ndarray or int
+                The code of the home team of each matchup, from `team_codes`.
+            away_codes : np.ndarray or int
+                The code of the away team of each matchup, from `team_codes`.
+            is_neutral : np.ndarray or bool
+                Whether each matchup is played at a neutral site. Default is False.
+
+        Returns
+        -------
+            np.ndarray
+                The (..., 4) pred_spread, pred_spread_O, pred_spread_D, pred_spread_ST of each matchup,
+                NaN when either team has no rating.
+        """
+        return self._predictor.lookup_spreads(home_codes, away_codes, is_neutral)
+
+    def game_influence(self, rating: str = "SRS") -> pd.DataFrame:
+        """
+        Get how much each game moved every team's rating, see `_SrsFitter.game_influence`.
+
+        Parameters
+        ----------
+            rating : {"SRS", "SRS_O", "SRS_D", "SRS_ST"}
+                The rating to get the influence on. Default is "SRS".
+
+        Returns
+        -------
+            pd.DataFrame
+                The rating of each team (columns) minus its rating without each game (index),
+                NaN when the rating is undetermined without the game.
+        """
+        columns = ["SRS", "SRS_O", "SRS_D", "SRS_ST"]
+        if rating not in columns:
+            raise ValueError(f"Rating must be one of {columns}, got {rating}.")
+
+        influence = self._fitter.game_influence()[:, :, columns.index(rating)]
+
+        return pd.DataFrame(
+            influence,
+            index=self._fitter._point_breakdown_df.index,
+            columns=self._fitter._teams.tolist(),
+        )
+
+    def what_if(self, scenarios: pd.DataFrame) -> pd.DataFrame:
+        """
+        Get the ratings of a batch of hypothetical results, see `_SrsFitter.what_if`.
+
+        Parameters
+        ----------
+            scenarios : pd.DataFrame
+                The changed games of each scenario, with a "scenario" label, the "game_id"
+                and the hypothetical point breakdown of each game.
+
+        Returns
+        -------
+            pd.DataFrame
+                The "scenario", "Team", "SRS", "SRS_O", "SRS_D" and "SRS_ST" of each team in each scenario.
+        """
+        labels, ratings, _ = self._fitter.what_if(scenarios)
+        n_scenarios, n_teams = ratings.shape[:2]
+
+        scenario_ratings = pd.DataFrame(
+            {
+                "scenario": np.repeat(labels, n_teams),
+                "Team": np.tile(self._fitter._teams, n_scenarios),
+            }
+        )
+        scenario_ratings[["SRS", "SRS_O", "SRS_D", "SRS_ST"]] = ratings.reshape(-1, 4)
+
+        return scenario_ratings
+
+    def what_if_predict(
+        self, scenarios: pd.DataFrame, games: pd.DataFrame
+    ) -> pd.DataFrame:
+        """
+        Predict the spreads for a given schedule under a batch of hypothetical results.
+
+        Parameters
+        ----------
+            scenarios : pd.DataFrame
+                The changed games of each scenario, see `what_if`.
+            games : pd.DataFrame
+                The game schedule, see `predict`.
+
+        Returns
+        -------
+            pd.DataFrame
+                The predictions of `predict` for each scenario, with its "scenario" label first.
+        """
+        labels, ratings, hfa = self._fitter.what_if(scenarios)
+
+        # Teams without a rating gather a trailing row of NaN
+        ratings = np.concatenate(
+            (ratings, np.full((len(labels), 1, 4), np.nan)), axis=1
+        )
+        home_codes = self.team_codes(games["home_team"])
+        away_codes = self.team_codes(games["away_team"])
+        non_neutral = ~games["is_neutral"].to_numpy(dtype=bool)
+        spreads = (
+            ratings[:, home_codes]
+            - ratings[:, away_codes]
+            + hfa[:, None, :] * non_neutral[:, None]
+        )
+
+        predictions = games.drop(columns=["is_neutral"]).reset_index(drop=True)
+        predictions = pd.concat([predictions] * len(labels), ignore_index=True)
+        predictions.insert(0, "scenario", np.repeat(labels, len(games)))
+        predictions[
+            ["pred_spread", "pred_spread_O", "pred_spread_D", "pred_spread_ST"]
+        ] = spreads.reshape(-1, 4)
+
+        return predictions
+
+    @staticmethod
+    def ridge_search(
+        start_week: NflWeek,
+        end_week: NflWeek,
+        ridges: list[float],
+        prior: pd.DataFrame | Literal["previous_season"] = None,
+    ) -> tuple[float, pd.DataFrame]:
+        """
+        Evaluate many ridge penalties by their exact leave-one-game-out errors, without refitting.
+
+        Parameters
+        ----------
+            start_week : NflWeek
+                The start week of the season (inclusive).
+            end_week : NflWeek
+                The end week of the season (inclusive).
+            ridges : list[float]
+                The ridge penalties to evaluate.
+            prior : pd.DataFrame or "previous_season", optional
+                The prior ratings of the ridge penalty, see `_SrsFitter`.
+
+        Returns
+        -------
+            best_ridge, results : tuple[float, pd.DataFrame]
+                The penalty with the lowest leave-one-out RMSE, and the "games", "MAE" and "RMSE"
+                of each penalty over the games whose leave-one-out error is defined.
+        """
+        fitter = _SrsFitter(start_week, end_week, prior=prior)
+        fitter.fit()
+        errors = fitter.loo_errors(ridges)
+
+        defined = ~np.isnan(errors)
+        n_games = defined.sum(axis=1)
+        errors = np.where(defined, errors, 0.0)
+
+        results = pd.DataFrame(
+            {
+                "ridge": np.asarray(ridges, dtype=float),
+                "games": n_games,
+                "MAE": np.abs(errors).sum(axis=1) / n_games,
+                "RMSE": np.sqrt((errors**2).sum(axis=1) / n_games),
+            }
+        )
+        best_ridge = float(results.loc[results["RMSE"].idxmin(), "ridge"])
+
+        return best_ridge, results
+
+    @staticmethod
+    def decay_search(
+        first_week: NflWeek,
+        last_week: NflWeek,
+        half_lives: list[float],
+        window: Literal["season"] | None = "season",
+    ) -> tuple[float, pd.DataFrame]:
+        """
+        Evaluate many half-lives of recency-weighted SRS on the next week's results.
+
+        Each week from `first_week` to `last_week` is predicted with the SRS fit as of the previous week,
+        for every half-life at once. The data is loaded and the weekly normal equations are built once.
+
+        Parameters
+        ----------
+            first_week : NflWeek
+                The first week to predict (inclusive).
+            last_week : NflWeek
+                The last week to predict (inclusive).
+            half_lives : list[float]
+                The half-lives in weeks to evaluate. np.inf gives equal weights.
+            window : "season", optional
+                "season" fits on the season to date. If None, the fits expand
+                from week 1 of the season of the week before `first_week`.
+
+        Returns
+        -------
+            best_half_life, results : tuple[float, pd.DataFrame]
+                The half-life with the lowest RMSE, and the "games", "MAE" and "RMSE" of each half-life.
+        """
+        as_of_week = NflWeek(first_week.season, first_week.week)
+        as_of_week.go_back()
+
+        fitter = _SrsWindowFitter(NflWeek(as_of_week.season, 1), last_week)
+        fitter.prepare()
+        n_games, abs_errors, squared_errors = fitter.decay_errors(
+            first_week, last_week, half_lives, window
+        )
+
+        results = pd.DataFrame(
+            {
+                "half_life": np.asarray(half_lives, dtype=float),
+                "games": n_games.astype(int),
+                "MAE": abs_errors / n_games,
+                "RMSE": np.sqrt(squared_errors / n_games),
+            }
+        )
+        best_half_life = float(results.loc[results["RMSE"].idxmin(), "half_life"])
+
+        return best_half_life, results
+
+    @staticmethod
+    def walk_forward(
+        first_week: NflWeek,
+        last_week: NflWeek,
+        window: int | Literal["season"] | None = None,
+        compact: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Fit the SRS as of every week in the given range.
+
+        The data is loaded once and every window is solved from shared prefix sums,
+        instead of constructing a new model for each week.
+
+        Parameters
+        ----------
+            first_week : NflWeek
+                The first as-of week (inclusive).
+            last_week : NflWeek
+                The last as-of week (inclusive).
+            window : int or "season", optional
+                The games used as of each week, see `nfl_data.week_windows`.
+                If not provided, the windows expand from `first_week`.
+                An integer gives trailing windows of that many weeks,
+                "season" gives the season to date.
+            compact : bool
+                If True, the frame is returned in float32 with categorical teams,
+                see `nfl_data.compact_frame` for the precision bound.
+                The windows are still solved in float64.
+
+        Returns
+        -------
+            pd.DataFrame
+                A long frame with one row per as-of "season", "week" and "Team",
+                holding the SRS frame columns and the "HFA", "HFA_O", "HFA_D", "HFA_ST" of the window.
+        """
+        windows = nfl_data.week_windows(first_week, last_week, window)
+        start_week = min((start for start, _ in windows), key=nfl_data.week_key)
+
+        fitter = _SrsWindowFitter(start_week, last_week)
+        fitter.prepare()
+
+        ratings = fitter.fit_windows(windows)
+        if compact:
+            return nfl_data.compact_frame(ratings)
+        return ratings
+
+
+class SrsModelCache:
+    """
+    A cache of fitted SRS models, keyed by their weeks, solver and data fingerprint.
+
+    Models are kept in memory up to a maximum count, evicting the least recently used,
+    and optionally saved to a directory so they outlive the process.
+    A model loaded from the directory predicts from its saved ratings and is refit from the data
+    the first time a method needs the games of the fit (e.g. `game_influence` or `rating_intervals`),
+    so it offers the same methods as a model fit by the cache.
+    Refreshing the local data files changes the fingerprint, so the models fit from the old files
+    are no longer returned.
+
+    The same model is returned to every caller, so the models must not be changed in place:
+    they are marked as shared, so `bootstrap` and the fitter's `update` and `remove` raise a ValueError.
+    Use `SrsModel.copy` to get a model that can be changed.
+    """
+
+    def __init__(self, maxsize: int = 32, directory: str = None):
+        """
+        Initialize an empty cache.
+
+        Parameters
+        ----------
+            maxsize : int
+                The maximum number of models kept in memory. Default is 32.
+            directory : str, optional
+                The directory the models are saved to and loaded from.
+                If not provided, the models are only kept in memory.
+        """
+        if maxsize < 1:
+            raise ValueError(f"Cache size must be at least 1, got {maxsize}.")
+
+        self.maxsize = maxsize
+        self.directory = directory
+        self._models = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        start_week: NflWeek,
+        end_week: NflWeek,
+        solver: Literal["normal", "lstsq"] = "normal",
+    ) -> SrsModel:
+        """
+        Get the model fit over the given weeks, fitting it on a miss.
+
+        Parameters
+        ----------
+            start_week : NflWeek
+                The start week of the season (inclusive).
+            end_week : NflWeek
+                The end week of the season (inclusive).
+            solver : {"normal", "lstsq"}
+                The least squares solver, see `_SrsFitter`.
+        """
+        window = (start_week.season, start_week.week, end_week.season, end_week.week)
+        key = (*window, solver, _data_fingerprint(start_week, end_week))
+
+        # Memory tier
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+                self.hits += 1
+                return self._models[key]
+
+        # Disk tier, then fit
+        path = self._path(key)
+        if path is not None and os.path.exists(path):
+            model = SrsModel.load(path, check_stale=False)
+            model._fitter._refit_on_demand = True
+            with self._lock:
+                self.disk_hits += 1
+        else:
+            model = SrsModel(start_week, end_week, solver)
+
+            # The fit may have downloaded the data, so key the model on its own fingerprint
+            key = (*window, solver, model._fingerprint)
+            path = self._path(key)
+            if path is not None:
+                os.makedirs(self.directory, exist_ok=True)
+                model.save(path)
+            with self._lock:
+                self.misses += 1
+        model._fitter._shared = True
+
+        with self._lock:
+            # Drop the models of the same weeks fit from older data
+            for stale_key in [k for k in self._models if k[:5] == key[:5]]:
+                del self._models[stale_key]
+
+            self._models[key] = model
+            while len(self._models) > self.maxsize:
+                self._models.popitem(last=False)
+
+        return model
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get the number of memory hits, disk hits and misses, and the number of models in memory.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "size": len(self._models),
+            }
+
+    def clear(self):
+        """
+        Remove every model from memory and reset the statistics. Saved models are kept.
+        """
+        with self._lock:
+            self._models.clear()
+            self.hits = self.disk_hits = self.misses = 0
+
+    def _path(self, key: tuple) -> str:
+        """
+        Get the path a model is saved at, None without a directory.
+        """
+        if self.directory is None:
+            return None
+
+        start_season, start_week, end_season, end_week, solver, fingerprint = key
+        filename = (
+            f"srs-{start_season}-{start_week}-{end_season}-{end_week}"
+            f"-{solver}-{fingerprint[:16]}.npz"
+        )
+        return os.path.join(self.directory, filename)
+
+
+# The cache shared by `SrsModel.cached`
+_MODEL_CACHE = SrsModelCache()
@@ -0,0 +1,464 @@
+import pandas as pd
+import numpy as np
+from nfl_analytics.nfl_data import NflWeek
+from nfl_analytics import nfl_data
+
+# The tie-breaking steps between clubs of the same division
+_DIVISION_STEPS = [
+    "head_to_head",
+    "division",
+    "common_games",
+    "conference",
+    "strength_of_victory",
+    "strength_of_schedule",
+    "net_points",
+    "coin_toss",
+]
+
+# The tie-breaking steps between clubs of different divisions of the same conference
+_CONFERENCE_STEPS = [
+    "head_to_head_sweep",
+    "conference",
+    "common_games_min_4",
+    "strength_of_victory",
+    "strength_of_schedule",
+    "net_points",
+    "coin_toss",
+]
+
+# The tie-breaking steps between clubs of different conferences, for the draft order
+_INTERCONFERENCE_STEPS = [
+    "head_to_head",
+    "common_games_min_4",
+    "strength_of_victory",
+    "strength_of_schedule",
+    "net_points",
+    "coin_toss",
+]
+
+# The number of playoff seeds of each conference
+_PLAYOFF_SEEDS = 7
+
+# The tolerance of comparing winning percentages
+_TIE_TOLERANCE = 1e-9
+
+
+class _StandingsEngine:
+    def __init__(self, schedules_df: pd.DataFrame, team_desc_df: pd.DataFrame):
+        """
+        Initialize the standings engine of a season's games.
+
+        Every simulation of the season is a vector of game results, and the standings of many
+        simulations are evaluated together: the records are (sims x teams) arrays and the
+        tie-breaking steps are applied to the tied clubs of every simulation at once,
+        each simulation advancing through the steps on its own.
+
+        The tiebreakers follow the NFL procedures up to the strength of schedule,
+        followed by the net points in all games and a (seeded) coin toss.
+        The rankings in points scored and allowed, and the net touchdowns, are not used.
+
+        Parameters
+        ----------
+            schedules_df : pd.DataFrame
+                The schedule data of the games of the season, as returned by `nfl_data.schedules`.
+            team_desc_df : pd.DataFrame
+                The "team_abbr", "team_conf" and "team_division" of the teams,
+                as returned by `nfl_data.team_descriptions`.
+        """
+        # Factorize the teams of every game
+        self.teams = np.array(
+            sorted(
+                pd.concat(
+                    (schedules_df["home_team"], schedules_df["away_team"])
+                ).unique()
+            ),
+            dtype=object,
+        )
+        self._n_teams = n_teams = len(self.teams)
+        team_index = pd.Index(self.teams)
+        self._home_codes = team_index.get_indexer(schedules_df["home_team"])
+        self._away_codes = team_index.get_indexer(schedules_df["away_team"])
+
+        # The conference and division of each team
+        team_desc = team_desc_df.drop_duplicates("team_abbr").set_index("team_abbr")
+        team_desc = team_desc.reindex(self.teams)
+        if team_desc[["team_conf", "team_division"]].isna().any().any():
+            raise ValueError("Teams are missing from the team descriptions.")
+        self.conferences = team_desc["team_conf"].to_numpy()
+        self.divisions = team_desc["team_division"].to_numpy()
+        self._conference_masks = (
+            np.unique(self.conferences)[:, None] == self.conferences[None, :]
+        )
+        self._division_masks = (
+            np.unique(self.divisions)[:, None] == self.divisions[None, :]
+        )
+
+        # The number of games between every pair of teams
+        self._games = np.zeros((n_teams, n_teams))
+        np.add.at(self._games, (self._home_codes, self._away_codes), 1)
+        np.add.at(self._games, (self._away_codes, self._home_codes), 1)
+        self._n_games = self._games.sum(axis=1)
+        same_division = self.divisions[:, None] == self.divisions[None, :]
+        same_conference = self.conferences[:, None] == self.conferences[None, :]
+        self._division_games = self._games * same_division
+        self._conference_games = self._games * same_conference
+
+        # The one-hot (winner, loser) pair of the home and away team winning each game
+        n_games = len(self._home_codes)
+        self._home_wins = np.zeros((n_games, n_teams * n_teams))
+        self._home_wins[
+            np.arange(n_games), self._home_codes * n_teams + self._away_codes
+        ] = 1
+        self._away_wins = np.zeros((n_games, n_teams * n_teams))
+        self._away_wins[
+            np.arange(n_games), self._away_codes * n_teams + self._home_codes
+        ] = 1
+
+        # The +1 home and -1 away indicators of the teams of each game
+        self._game_teams = np.zeros((n_games, n_teams))
+        self._game_teams[np.arange(n_games), self._home_codes] = 1
+        self._game_teams[np.arange(n_games), self._away_codes] = -1
+
+    def evaluate(
+        self, results: np.ndarray, margins: np.ndarray = None, seed: int = None
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the division ranks, playoff seeds and draft order of simulated seasons.
+
+        Parameters
+        ----------
+            results : np.ndarray
+                The (n_sims, n_games) result of each game for the home team:
+                1 for a win, 0.5 for a tie and 0 for a loss.
+            margins : np.ndarray, optional
+                The (n_sims, n_games) home margin of each game, for the net points tiebreaker.
+                If not provided, the net points do not break ties.
+            seed : int, optional
+                The seed of the coin tosses.
+
+        Returns
+        -------
+            division_ranks, seeds, draft_picks : tuple[np.ndarray, np.ndarray, np.ndarray]
+                The (n_sims, n_teams) rank of each team in its division, its playoff seed
+                in its conference (0 when it misses the playoffs) and its draft pick
+                among the teams missing the playoffs (0 for the playoff teams).
+        """
+        self._setup_records(results, margins, seed)
+        n_sims = len(results)
+        sims = np.arange(n_sims)
+
+        # Rank the teams of each division
+        division_ranks = np.zeros((n_sims, self._n_teams), dtype=int)
+        for division in self._division_masks:
+            remaining = np.repeat(division[None, :], n_sims, axis=0)
+            for rank in range(1, division.sum() + 1):
+                best = self._select_best(remaining, _DIVISION_STEPS)
+                division_ranks[sims, best] = rank
+                remaining[sims, best] = False
+
+        # Seed the division winners, then the wild cards of each conference
+        seeds = np.zeros((n_sims, self._n_teams), dtype=int)
+        for conference in self._conference_masks:
+            winners = (division_ranks == 1) & conference
+            n_winners = winners[0].sum()
+            for seed_number in range(1, n_winners + 1):
+                best = self._select_best(winners, _CONFERENCE_STEPS)
+                seeds[sims, best] = seed_number
+                winners[sims, best] = False
+
+            remaining = (division_ranks > 1) & conference
+            n_wild_cards = min(_PLAYOFF_SEEDS - n_winners, remaining[0].sum())
+            for seed_number in range(n_winners + 1, n_winners + n_wild_cards + 1):
+                # Only the highest ranked remaining club of each division is considered
+                candidates = self._division_leaders(remaining, division_ranks)
+                best = self._select_best(candidates, _CONFERENCE_STEPS)
+                seeds[sims, best] = seed_number
+                remaining[sims, best] = False
+
+        # Order the draft of the teams missing the playoffs, from the last pick to the first
+        draft_picks = np.zeros((n_sims, self._n_teams), dtype=int)
+        remaining = seeds == 0
+        for pick in range(remaining[0].sum(), 0, -1):
+            best = self._select_draft_pick(remaining, division_ranks)
+            draft_picks[sims, best] = pick
+            remaining[sims, best] = False
+
+        return division_ranks, seeds, draft_picks
+
+    def _setup_records(
+        self, results: np.ndarray, margins: np.ndarray | None, seed: int | None
+    ):
+        """
+        Set up the records behind the tiebreakers of each simulation.
+        """
+        n_sims, n_teams = len(results), self._n_teams
+
+        # The points (1 for a win, 0.5 for a tie) and wins of every team against every other team
+        self._points = (
+            results @ self._home_wins + (1 - results) @ self._away_wins
+        ).reshape(n_sims, n_teams, n_teams)
+        self._wins = (
+            (results == 1) @ self._home_wins + (results == 0) @ self._away_wins
+        ).reshape(n_sims, n_teams, n_teams)
+
+        # The winning percentages, overall, in the division and in the conference
+        with np.errstate(invalid="ignore", divide="ignore"):
+            team_points = self._points.sum(axis=2)
+            self._win_pct = team_points / self._n_games
+            self._division_pct = (self._points * (self._division_games > 0)).sum(
+                axis=2
+            ) / self._division_games.sum(axis=1)
+            self._conference_pct = (self._points * (self._conference_games > 0)).sum(
+                axis=2
+            ) / self._conference_games.sum(axis=1)
+
+            # The combined percentage of the teams beaten, and of the opponents
+            self._victory = np.einsum("stk,sk->st", self._wins, team_points) / (
+                self._wins @ self._n_games
+            )
+            self._schedule = (team_points @ self._games.T) / (
+                self._games @ self._n_games
+            )
+
+        # Teams without any game of a kind have a percentage of 0
+        self._division_pct = np.nan_to_num(self._division_pct)
+        self._conference_pct = np.nan_to_num(self._conference_pct)
+        self._victory = np.nan_to_num(self._victory)
+
+        if margins is None:
+            self._net_points = np.zeros((n_sims, n_teams))
+        else:
+            self._net_points = margins @ self._game_teams
+
+        self._coin = np.random.default_rng(seed).random((n_sims, n_teams))
+
+    def _select_best(
+        self, candidates: np.ndarray, steps: list[str], sims: np.ndarray = None
+    ) -> np.ndarray:
+        """
+        Select the best club among candidates of many simulations.
+
+        The clubs with the best winning percentage are compared with the tie-breaking steps in order.
+        Whenever a step eliminates some but not all of the remaining tied clubs,
+        the remaining clubs go back to the first step.
+
+        Parameters
+        ----------
+            candidates : np.ndarray
+                The (n, n_teams) mask of the candidate clubs of each simulation, with at least one per row.
+            steps : list[str]
+                The tie-breaking steps.
+            sims : np.ndarray, optional
+                The simulation of each row. Default is one row per simulation.
+
+        Returns
+        -------
+            np.ndarray
+                The (n,) code of the best club of each row.
+        """
+        sims = np.arange(len(candidates)) if sims is None else sims
+        tied = _keep_max(self._win_pct[sims], candidates)
+        step = np.zeros(len(tied), dtype=int)
+
+        unresolved = np.flatnonzero(tied.sum(axis=1) > 1)
+        while len(unresolved):
+            rows = tied[unresolved]
+            for i, name in enumerate(steps):
+                at_step = step[unresolved] == i
+                if at_step.any():
+                    metric = self._step_metric(
+                        name, rows[at_step], sims[unresolved[at_step]]
+                    )
+                    rows[at_step] = _keep_max(metric, rows[at_step])
+
+            # Restart the steps when clubs were eliminated, otherwise go to the next step
+            eliminated = rows.sum(axis=1) < tied[unresolved].sum(axis=1)
+            step[unresolved] = np.where(eliminated, 0, step[unresolved] + 1)
+            tied[unresolved] = rows
+            unresolved = unresolved[rows.sum(axis=1) > 1]
+
+        return tied.argmax(axis=1)
+
+    def _step_metric(self, name: str, tied: np.ndarray, sims: np.ndarray) -> np.ndarray:
+        """
+        Get the metric of a tie-breaking step, the higher the better, of the tied clubs of each row.
+
+        The metric is constant over a row when the step does not apply to its clubs.
+        """
+        n_tied = tied.sum(axis=1, keepdims=True)
+
+        if name in ("head_to_head", "head_to_head_sweep"):
+            # The percentage in the games between the tied clubs, if they all played each other
+            games = tied.astype(float) @ self._games.T
+            applies = ((games > 0) | ~tied).all(axis=1, keepdims=True)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                metric = np.einsum("ntk,nk->nt", self._points[sims], tied) / games
+            metric = np.where(applies, np.nan_to_num(metric), 0.0)
+            if name == "head_to_head":
+                return metric
+
+            # Between three or more clubs, a club that beat each of the others wins,
+            # and a club that lost to each of the others is eliminated
+            played = tied.astype(float) @ (self._games > 0).T == n_tied - 1
+            swept = ((self._wins[sims] == self._games) & (self._games > 0)).astype(
+                float
+            )
+            beat_all = played & tied
+            beat_all &= np.einsum("ntk,nk->nt", swept, tied) == n_tied - 1
+            lost_all = played & tied
+            lost_all &= np.einsum("nkt,nk->nt", swept, tied) == n_tied - 1
+            sweep = np.where(
+                beat_all.any(axis=1, keepdims=True),
+                beat_all,
+                np.where(lost_all.any(axis=1, keepdims=True), ~lost_all, True),
+            )
+            return np.where(n_tied > 2, sweep.astype(float), metric)
+
+        if name in ("common_games", "common_games_min_4"):
+            # The percentage in the games against the opponents every tied club played
+            common = (tied.astype(float) @ (self._games > 0) == n_tied) & ~tied
+            games = common.astype(float) @ self._games.T
+            minimum = 4 if name == "common_games_min_4" else 1
+            applies = ((games >= minimum) | ~tied).all(axis=1, keepdims=True)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                metric = np.einsum("ntk,nk->nt", self._points[sims], common) / games
+            return np.where(applies, np.nan_to_num(metric), 0.0)
+
+        return {
+            "division": self._division_pct,
+            "conference": self._conference_pct,
+            "strength_of_victory": self._victory,
+            "strength_of_schedule": self._schedule,
+            "net_points": self._net_points,
+            "coin_toss": self._coin,
+        }[name][sims]
+
+    def _division_leaders(
+        self, remaining: np.ndarray, division_ranks: np.ndarray
+    ) -> np.ndarray:
+        """
+        Get the mask of the highest ranked remaining club of each division.
+        """
+        leaders = np.zeros(remaining.shape, dtype=bool)
+        for division in self._division_masks:
+            ranks = np.where(remaining & division, division_ranks, np.iinfo(int).max)
+            leaders |= (
+                (ranks == ranks.min(axis=1, keepdims=True)) & remaining & division
+            )
+
+        return leaders
+
+    def _select_draft_pick(
+        self, remaining: np.ndarray, division_ranks: np.ndarray
+    ) -> np.ndarray:
+        """
+        Select the club with the latest pick among the remaining clubs of each simulation.
+
+        The best winning percentage picks last, ties are broken by the strength of schedule (higher picks later),
+        then by the division, conference or interconference tiebreakers of the tied clubs.
+        """
+        tied = _keep_max(self._win_pct, remaining)
+        tied = _keep_max(self._schedule, tied)
+        best = tied.argmax(axis=1)
+
+        # The tiebreakers that apply depend on where the tied clubs play
+        divisions = (tied[:, None, :] & self._division_masks).any(axis=2).sum(axis=1)
+        conferences = (
+            (tied[:, None, :] & self._conference_masks).any(axis=2).sum(axis=1)
+        )
+        unresolved = tied.sum(axis=1) > 1
+        for rows, steps in (
+            (unresolved & (divisions == 1), _DIVISION_STEPS),
+            (unresolved & (divisions > 1) & (conferences == 1), _CONFERENCE_STEPS),
+            (unresolved & (conferences > 1), _INTERCONFERENCE_STEPS),
+        ):
+            rows = np.flatnonzero(rows)
+            if len(rows):
+                candidates = tied[rows]
+                if steps is _CONFERENCE_STEPS:
+                    candidates = self._division_leaders(
+                        candidates, division_ranks[rows]
+                    )
+                best[rows] = self._select_best(candidates, steps, rows)
+
+        return best
+
+
+def _keep_max(metric: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """
+    Keep the candidates with the highest metric in each row.
+    """
+    masked = np.where(candidates, metric, -np.inf)
+    best = masked.max(axis=1, keepdims=True)
+
+    return candidates & (masked >= best - _TIE_TOLERANCE)
+
+
+def season_standings(
+    season: int,
+    schedules_df: pd.DataFrame = None,
+    team_desc_df: pd.DataFrame = None,
+) -> pd.DataFrame:
+    """
+    Get the standings of the completed regular season games of a season.
+
+    Parameters
+    ----------
+        season : int
+            The season.
+        schedules_df : pd.DataFrame, optional
+            A DataFrame containing the schedule data for the season.
+            If not provided, it will be fetched.
+        team_desc_df : pd.DataFrame, optional
+            A DataFrame containing the team descriptions.
+            If not provided, it will be fetched.
+
+    Returns
+    -------
+        pd.DataFrame
+            The "Team", "conference", "division", "wins", "losses", "ties", "win_pct",
+            "division_rank", "seed" (0 when missing the playoffs)
+            and "draft_pick" (among the teams missing the playoffs, 0 for the playoff teams) of each team.
+    """
+    if not isinstance(schedules_df, pd.DataFrame):
+        schedules_df = nfl_data.schedules(NflWeek(season, 1), NflWeek(season, 22))
+    if not isinstance(team_desc_df, pd.DataFrame):
+        team_desc_df = nfl_data.team_descriptions()
+
+    # Keep the completed regular season games
+    schedules_df = schedules_df[
+        (schedules_df["season"] == season)
+        & (schedules_df["game_type"] == "REG")
+        & schedules_df["home_score"].notna()
+        & schedules_df["away_score"].notna()
+    ]
+    margins = (schedules_df["home_score"] - schedules_df["away_score"]).to_numpy(
+        dtype=float
+    )
+    results = (np.sign(margins) + 1) / 2
+
+    engine = _StandingsEngine(schedules_df, team_desc_df)
+    division_ranks, seeds, draft_picks = engine.evaluate(
+        results[None, :], margins[None, :]
+    )
+
+    # The record of each team
+    wins = engine._wins[0].sum(axis=1)
+    # A tie is worth half a point, so the points beyond the wins count half the ties
+    ties = 2 * (engine._points[0].sum(axis=1) - wins)
+    losses = engine._n_games - wins - ties
+
+    return pd.DataFrame(
+        {
+            "Team": engine.teams.tolist(),
+            "conference": engine.conferences,
+            "division": engine.divisions,
+            "wins": wins.astype(int),
+            "losses": losses.astype(int),
+            "ties": ties.astype(int),
+            "win_pct": engine._win_pct[0],
+            "division_rank": division_ranks[0],
+            "seed": seeds[0],
+            "draft_pick": draft_picks[0],
+        }
+    )
@@ -0,0 +1,62 @@
+from nfl_analytics import backtest, srs_model, nfl_data
+from nfl_analytics.nfl_data import NflWeek
+import pandas as pd
+import numpy as np
+
+
+def test_run_srs_backtest():
+    # Backtest the end of the 2023 season and the start of the 2024 season
+    predictions = backtest.run_srs_backtest(NflWeek(2023, 17), NflWeek(2024, 2))
+    parallel_predictions = backtest.run_srs_backtest(
+        NflWeek(2023, 17), NflWeek(2024, 2), workers=2
+    )
+    pd.testing.assert_frame_equal(predictions, parallel_predictions)
+
+    # Week 17 should match a model fit on the season through week 16
+    model = srs_model.SrsModel(NflWeek(2023, 1), NflWeek(2023, 16))
+    schedules = nfl_data.schedules(NflWeek(2023, 17), NflWeek(2023, 17))
+    games = pd.DataFrame(
+        {
+            "game_id": schedules["game_id"],
+            "home_team": schedules["home_team"],
+            "away_team": schedules["away_team"],
+            "is_neutral": schedules["location"] == "Neutral",
+        }
+    )
+    expected = model.predict(games).sort_values("game_id")
+
+    columns = ["pred_spread", "pred_spread_O", "pred_spread_D", "pred_spread_ST"]
+    week_predictions = predictions[predictions["week"] == 17]
+    assert week_predictions["game_id"].tolist() == expected["game_id"].tolist()
+    assert np.allclose(week_predictions[columns], expected[columns])
+
+
+def test_score_srs_backtest():
+    scores = backtest.score_srs_backtest(NflWeek(2023, 15), NflWeek(2023, 17))
+
+    # The scores should match the predictions joined to the schedules
+    predictions = backtest.run_srs_backtest(NflWeek(2023, 15), NflWeek(2023, 17))
+    games = predictions.merge(
+        nfl_data.schedules(NflWeek(2023, 15), NflWeek(2023, 17))[
+            ["game_id", "home_score", "away_score", "spread_line"]
+        ],
+        on="game_id",
+    )
+    margins = games["home_score"] - games["away_score"]
+    errors = games["pred_spread"] - margins
+    picks = np.sign(games["pred_spread"] - games["spread_line"])
+    covers = np.sign(margins - games["spread_line"])
+    picked = (picks != 0) & (covers != 0)
+
+    assert scores["week"].tolist() == [15, 16, 17]
+    assert scores["games"].tolist() == games.groupby("week").size().tolist()
+    assert np.allclose(scores["MAE"], errors.abs().groupby(games["week"]).mean())
+    assert np.allclose(
+        scores["RMSE"], np.sqrt((errors**2).groupby(games["week"]).mean())
+    )
+    assert np.allclose(
+        scores["ATS_rate"], (picks == covers)[picked].groupby(games["week"]).mean()
+    )
+    for week, week_games in games.groupby("week"):
+        slope = np.polyfit(week_games["pred_spread"], margins[week_games.index], 1)[0]
+        assert np.isclose(scores.loc[scores["week"] == week, "calibration"], slope)
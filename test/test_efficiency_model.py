@@ -0,0 +1,70 @@
+import pytest
+from nfl_analytics import efficiency_model, nfl_data
+from nfl_analytics.nfl_data import NflWeek
+import pandas as pd
+import numpy as np
+
+
+@pytest.mark.parametrize("metric", ["epa", "success"])
+def test_efficiency_ratings(metric):
+    start_week, end_week = NflWeek(2023, 1), NflWeek(2024, 4)
+    ridge = 50.0
+    ratings, effects = efficiency_model.efficiency_ratings(
+        start_week, end_week, metric=metric, ridge=ridge
+    )
+
+    # Build the dense design of the same plays directly
+    pbp = nfl_data.play_by_play(start_week, end_week)
+    plays = pbp[
+        pbp["play_type"].isin(["pass", "run"])
+        & pbp["down"].notna()
+        & pbp[metric].notna()
+    ]
+    covariates = pd.DataFrame(
+        {
+            "intercept": 1.0,
+            "home": plays["posteam_type"] == "home",
+            "down_2": plays["down"] == 2,
+            "down_3": plays["down"] == 3,
+            "down_4": plays["down"] == 4,
+            "short_distance": plays["ydstogo"] <= 3,
+            "long_distance": plays["ydstogo"] >= 11,
+            "garbage_leading": plays["wp"] > 0.9,
+            "garbage_trailing": plays["wp"] < 0.1,
+        }
+    ).astype(float)
+    teams = ratings["Team"].tolist()
+    offense = pd.get_dummies(plays["posteam"]).reindex(columns=teams, fill_value=0)
+    defense = pd.get_dummies(plays["defteam"]).reindex(columns=teams, fill_value=0)
+    design = np.hstack(
+        [
+            covariates.to_numpy(),
+            offense.to_numpy(dtype=float),
+            -defense.to_numpy(dtype=float),
+        ]
+    )
+
+    # The ratings and effects should match the direct ridge solve
+    penalties = np.zeros(design.shape[1])
+    penalties[covariates.shape[1] :] = ridge
+    coefficients = np.linalg.solve(
+        design.T @ design + np.diag(penalties),
+        design.T @ plays[metric].to_numpy(dtype=float),
+    )
+    n_covariates = covariates.shape[1]
+    assert effects.index.tolist() == covariates.columns.tolist()
+    assert np.allclose(effects, coefficients[:n_covariates], atol=1e-6)
+    assert np.allclose(
+        ratings["off_rating"],
+        coefficients[n_covariates : n_covariates + len(teams)],
+        atol=1e-6,
+    )
+    assert np.allclose(
+        ratings["def_rating"], coefficients[n_covariates + len(teams) :], atol=1e-6
+    )
+    assert np.allclose(ratings["rating"], ratings["off_rating"] + ratings["def_rating"])
+
+    # The ridge penalty centers the ratings
+    assert abs(ratings["off_rating"].mean()) < 1e-6
+    assert abs(ratings["def_rating"].mean()) < 1e-6
+    assert ratings["off_plays"].sum() == len(plays)
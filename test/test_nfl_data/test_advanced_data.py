@@ -1,6 +1,8 @@
-from nfl_analytics.nfl_data import advanced_data
-from nfl_analytics.nfl_data import NflWeek
+import pytest
+from nfl_analytics.nfl_data import advanced_data, basic_data
+from nfl_analytics.nfl_data import NflWeek, utils
 import pandas as pd
+import numpy as np
 
 
 def test_get_point_breakdown():
@@ -179,9 +181,123 @@ def test_get_margin_of_victory():
 
 
 def test_home_field_advantage():
-    hfa, hfa_o, hfa_d, hfa_st = advanced_data.home_field_advantage(NflWeek(2024, 1), NflWeek(2024, 18))
+    hfa, hfa_o, hfa_d, hfa_st = advanced_data.home_field_advantage(
+        NflWeek(2024, 1), NflWeek(2024, 18)
+    )
 
     assert hfa == 1.7191011235955065
     assert hfa_o == 1.295880149812735
     assert hfa_d == 0.0449438202247191
     assert hfa_st == 0.37827715355805225
+
+
+def test_team_week_cube():
+    # Build the cube once over two seasons
+    cube = advanced_data.TeamWeekCube(NflWeek(2023, 1), NflWeek(2024, 18))
+
+    # Every range query should match the direct calculation
+    for start_week, end_week in [
+        (NflWeek(2024, 1), NflWeek(2024, 1)),
+        (NflWeek(2024, 1), NflWeek(2024, 18)),
+        (NflWeek(2023, 10), NflWeek(2024, 5)),
+    ]:
+        mov = cube.margin_of_victory(start_week, end_week)
+        expected_mov = advanced_data.margin_of_victory(start_week, end_week)
+        assert mov.equals(expected_mov)
+
+        hfa = cube.home_field_advantage(start_week, end_week)
+        expected_hfa = advanced_data.home_field_advantage(start_week, end_week)
+        assert hfa == expected_hfa
+
+
+def test_home_field_advantage_windows():
+    # Trailing 8 week windows over the 2024 season
+    windows = utils.week_windows(NflWeek(2024, 1), NflWeek(2024, 18), window=8)
+    hfa = advanced_data.home_field_advantage_windows(windows)
+
+    # Each window should match the direct calculation
+    assert hfa.shape == (len(windows), 4)
+    for (start_week, end_week), row in zip(windows, hfa):
+        expected_hfa = advanced_data.home_field_advantage(start_week, end_week)
+        assert tuple(row) == expected_hfa
+
+
+def test_team_week_stats():
+    # Calculate the efficiency metrics for the first two weeks of 2024
+    stats = advanced_data.team_week_stats(
+        NflWeek(2024, 1), NflWeek(2024, 2), metrics=["epa", "pass_success_rate"]
+    )
+
+    # Compare against a direct groupby over the offensive plays
+    pbp = basic_data.play_by_play(NflWeek(2024, 1), NflWeek(2024, 2))
+    plays = pbp[(pbp["pass"] == 1) | (pbp["rush"] == 1)]
+    expected_epa = plays.groupby(["week", "posteam"])["epa"].mean()
+    passes = plays[plays["pass"] == 1]
+    expected_success = passes.groupby(["week", "defteam"])["success"].mean()
+
+    stats = stats.set_index(["week", "team"])
+    assert len(stats) == 64
+    assert np.allclose(stats["off_epa"], expected_epa.loc[stats.index])
+    assert np.allclose(
+        stats["def_pass_success_rate"], expected_success.loc[stats.index]
+    )
+
+    # The cached result should be identical
+    cached = advanced_data.team_week_stats(
+        NflWeek(2024, 1), NflWeek(2024, 2), metrics=["epa", "pass_success_rate"]
+    )
+    assert cached.set_index(["week", "team"]).equals(stats)
+
+    # At least one known metric is needed
+    with pytest.raises(ValueError):
+        advanced_data.team_week_stats(NflWeek(2024, 1), NflWeek(2024, 2), metrics=[])
+    with pytest.raises(ValueError):
+        advanced_data.team_week_stats(
+            NflWeek(2024, 1), NflWeek(2024, 2), metrics=["points"]
+        )
+
+
+def test_team_week_stats_cache_invalidation(monkeypatch):
+    # Count the seasons computed from the play-by-play data
+    computed = []
+    season_team_week_stats = advanced_data._season_team_week_stats
+
+    def counting_season_team_week_stats(season, metrics, force_refresh=False):
+        computed.append(season)
+        return season_team_week_stats(season, metrics, force_refresh)
+
+    monkeypatch.setattr(
+        advanced_data, "_season_team_week_stats", counting_season_team_week_stats
+    )
+    monkeypatch.setattr(advanced_data, "_TEAM_WEEK_STATS_CACHE", {})
+
+    # The second call is served from the cache
+    start_week, end_week = NflWeek(2024, 1), NflWeek(2024, 2)
+    stats = advanced_data.team_week_stats(start_week, end_week)
+    advanced_data.team_week_stats(start_week, end_week)
+    assert computed == [2024]
+
+    # Once the play-by-play file changes, the season is recomputed
+    monkeypatch.setattr(advanced_data, "_pbp_fingerprint", lambda season: "changed")
+    refreshed = advanced_data.team_week_stats(start_week, end_week)
+    assert computed == [2024, 2024]
+    assert refreshed.equals(stats)
+
+
+def test_point_breakdown_by_season():
+    # The point breakdown from all the play-by-play data at once
+    start_week, end_week = NflWeek(2023, 15), NflWeek(2024, 3)
+    pbp = basic_data.play_by_play(start_week, end_week)
+    expected_df = advanced_data.point_breakdown(start_week, end_week, pbp)
+
+    # Reducing one season at a time should give the same result, in and out of process
+    point_breakdown = advanced_data.point_breakdown(start_week, end_week)
+    assert point_breakdown.equals(expected_df)
+    point_breakdown = advanced_data.point_breakdown(start_week, end_week, workers=2)
+    assert point_breakdown.equals(expected_df)
+
+    # A start week after the end week is rejected
+    with pytest.raises(ValueError):
+        advanced_data.point_breakdown(NflWeek(2024, 3), NflWeek(2023, 15))
+    with pytest.raises(ValueError):
+        advanced_data.point_breakdown(NflWeek(2024, 3), NflWeek(2024, 2))
@@ -0,0 +1,47 @@
+from nfl_analytics.nfl_data import advanced_data, basic_data
+from nfl_analytics.nfl_data import NflWeek, AnalysisSession
+from nfl_analytics import srs_model
+import pandas as pd
+
+
+def test_analysis_session(monkeypatch):
+    session = AnalysisSession(NflWeek(2024, 1), NflWeek(2024, 18))
+
+    # Count the loads from the storage
+    loads = []
+    schedules = basic_data.schedules
+    play_by_play = basic_data.play_by_play
+    monkeypatch.setattr(
+        basic_data,
+        "schedules",
+        lambda *args: loads.append("schedules") or schedules(*args),
+    )
+    monkeypatch.setattr(
+        basic_data,
+        "play_by_play",
+        lambda *args, **kwargs: loads.append("pbp") or play_by_play(*args, **kwargs),
+    )
+
+    # Several analyses over the session and a sub-range of it
+    model = srs_model.SrsModel(NflWeek(2024, 1), NflWeek(2024, 18), session=session)
+    sub_model = srs_model.SrsModel(NflWeek(2024, 1), NflWeek(2024, 9), session=session)
+    mov = advanced_data.margin_of_victory(
+        NflWeek(2024, 1), NflWeek(2024, 18), session=session
+    )
+    hfa = advanced_data.home_field_advantage(
+        NflWeek(2024, 1), NflWeek(2024, 9), session=session
+    )
+    assert loads == ["schedules", "pbp"]
+
+    # The results should match the analyses loading their own data
+    monkeypatch.undo()
+    expected = srs_model.SrsModel(NflWeek(2024, 1), NflWeek(2024, 18))
+    pd.testing.assert_frame_equal(model._fitter.srs_frame, expected._fitter.srs_frame)
+    expected = srs_model.SrsModel(NflWeek(2024, 1), NflWeek(2024, 9))
+    pd.testing.assert_frame_equal(
+        sub_model._fitter.srs_frame, expected._fitter.srs_frame
+    )
+    pd.testing.assert_frame_equal(
+        mov, advanced_data.margin_of_victory(NflWeek(2024, 1), NflWeek(2024, 18))
+    )
+    assert hfa == advanced_data.home_field_advantage(NflWeek(2024, 1), NflWeek(2024, 9))
@@ -129,3 +129,66 @@ def test_filter_data_seasonaly():
     expected_df = pd.DataFrame(expected_data)
 
     assert filtered_df.equals(expected_df)
+
+
+def test_week_windows():
+    # Expanding windows from the first week
+    windows = utils.week_windows(NflWeek(2023, 21), NflWeek(2024, 2))
+    assert [(s.season, s.week, e.season, e.week) for s, e in windows] == [
+        (2023, 21, 2023, 21),
+        (2023, 21, 2023, 22),
+        (2023, 21, 2024, 1),
+        (2023, 21, 2024, 2),
+    ]
+
+    # Trailing windows of three weeks
+    windows = utils.week_windows(NflWeek(2024, 1), NflWeek(2024, 3), window=3)
+    assert [(s.season, s.week, e.season, e.week) for s, e in windows] == [
+        (2023, 21, 2024, 1),
+        (2023, 22, 2024, 2),
+        (2024, 1, 2024, 3),
+    ]
+
+    # Season to date windows
+    windows = utils.week_windows(NflWeek(2023, 22), NflWeek(2024, 2), window="season")
+    assert [(s.season, s.week, e.season, e.week) for s, e in windows] == [
+        (2023, 1, 2023, 22),
+        (2024, 1, 2024, 1),
+        (2024, 1, 2024, 2),
+    ]
+
+
+def test_compact_frame():
+    df = pd.DataFrame(
+        {
+            "season": [2024, 2024, 2024],
+            "week": [1, 1, 2],
+            "team": ["KC", "BUF", "KC"],
+            "epa": [0.1, -1 / 3, 25.123456789],
+            "plays": [60, 62, 58],
+        },
+        index=[3, 5, 7],
+    )
+    compact = utils.compact_frame(df)
+
+    assert compact.index.equals(df.index)
+    assert compact["season"].dtype == "int16" and compact["week"].dtype == "int16"
+    assert compact["team"].dtype == "category"
+    assert compact["team"].astype(str).tolist() == df["team"].tolist()
+    assert compact["epa"].dtype == "float32"
+    assert compact["plays"].dtype == df["plays"].dtype
+
+    # Rounding stays within the documented relative error
+    error = (compact["epa"].astype("float64") - df["epa"]).abs()
+    assert (error <= utils.COMPACT_RELATIVE_ERROR * df["epa"].abs()).all()
+
+
+def test_week_key():
+    # Keys order the weeks chronologically across seasons
+    weeks = [NflWeek(2024, 1), NflWeek(2023, 22), NflWeek(2023, 3)]
+    assert [utils.week_key(week) for week in weeks] == [202401, 202322, 202303]
+    assert min(weeks, key=utils.week_key) is weeks[2]
+
+    # And the same keys for the rows of a DataFrame
+    df = pd.DataFrame({"season": [2024, 2023, 2023], "week": [1, 22, 3]})
+    assert utils.week_key(df).tolist() == [202401, 202322, 202303]
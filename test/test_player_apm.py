@@ -0,0 +1,48 @@
+from nfl_analytics import player_apm, nfl_data
+from nfl_analytics.nfl_data import NflWeek
+import pandas as pd
+import numpy as np
+
+
+def test_player_apm():
+    start_week, end_week = NflWeek(2023, 1), NflWeek(2023, 6)
+    ridge = 50.0
+    apm = player_apm.player_apm(start_week, end_week, ridge=ridge)
+
+    # Build the dense design of the same plays directly
+    pbp = nfl_data.play_by_play(start_week, end_week)
+    pbp = pbp[pbp["play_type"].isin(["pass", "run"]) & pbp["epa"].notna()]
+    participation = nfl_data.participation(start_week, end_week)
+    plays = pbp.merge(
+        participation,
+        left_on=["game_id", "play_id"],
+        right_on=["nflverse_game_id", "play_id"],
+    ).reset_index(drop=True)
+
+    players = apm["player_id"].tolist()
+    codes = {player: i for i, player in enumerate(players)}
+    design = np.zeros((len(plays), 1 + 2 * len(players)))
+    design[:, 0] = 1
+    for column, offset, sign in [
+        ("offense_players", 1, 1),
+        ("defense_players", 1 + len(players), -1),
+    ]:
+        on_field = plays[column].str.split(";").explode()
+        design[on_field.index, offset + on_field.map(codes).to_numpy()] = sign
+
+    # The ratings should match the direct ridge solve
+    penalties = np.full(design.shape[1], ridge)
+    penalties[0] = 0
+    coefficients = np.linalg.solve(
+        design.T @ design + np.diag(penalties), design.T @ plays["epa"].to_numpy()
+    )
+    assert np.allclose(apm["off_apm"], coefficients[1 : 1 + len(players)], atol=1e-6)
+    assert np.allclose(apm["def_apm"], coefficients[1 + len(players) :], atol=1e-6)
+
+    # And the play counts should match the design
+    assert np.array_equal(
+        apm["off_plays"], (design[:, 1 : 1 + len(players)] != 0).sum(axis=0)
+    )
+    assert np.array_equal(
+        apm["def_plays"], (design[:, 1 + len(players) :] != 0).sum(axis=0)
+    )
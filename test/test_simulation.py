@@ -0,0 +1,51 @@
+from nfl_analytics import simulation, srs_model, nfl_data
+from nfl_analytics.nfl_data import NflWeek
+from math import erf
+import pandas as pd
+import numpy as np
+
+
+def test_simulate_season():
+    model = srs_model.SrsModel(NflWeek(2024, 1), NflWeek(2024, 16))
+    distribution = simulation.simulate_season(model, 2024, n_sims=100_000, seed=1)
+
+    # The simulations should not depend on the chunk size
+    chunked = simulation.simulate_season(
+        model, 2024, n_sims=100_000, seed=1, chunk_size=7_000
+    )
+    assert np.array_equal(distribution.to_numpy(), chunked.to_numpy())
+    assert np.allclose(distribution.drop(columns="mean_wins").sum(axis=1), 1)
+
+    # The mean wins should be the wins so far plus the win probability of each remaining game
+    schedules = nfl_data.schedules(NflWeek(2024, 1), NflWeek(2024, 22))
+    schedules = schedules[schedules["game_type"] == "REG"]
+    margins = schedules["home_score"] - schedules["away_score"]
+    spreads = model.spreads(
+        schedules["home_team"],
+        schedules["away_team"],
+        schedules["location"] == "Neutral",
+    )[:, 0]
+    home_wins = np.where(
+        margins.isna(),
+        [0.5 * (1 + erf(spread / (13.5 * np.sqrt(2)))) for spread in spreads],
+        (margins > 0) + (margins == 0) / 2,
+    )
+    expected = (
+        pd.Series(home_wins).groupby(schedules["home_team"].to_numpy()).sum()
+        + pd.Series(1 - home_wins).groupby(schedules["away_team"].to_numpy()).sum()
+    )
+    assert np.allclose(
+        distribution["mean_wins"], expected[distribution.index], atol=0.02
+    )
+
+
+def test_simulate_playoff_odds():
+    model = srs_model.SrsModel(NflWeek(2024, 1), NflWeek(2024, 16))
+    odds = simulation.simulate_playoff_odds(model, 2024, n_sims=2_000, seed=1)
+
+    # Every simulation has one winner per division, seven seeds per conference and one first pick
+    assert np.isclose(odds["division"].sum(), 8)
+    assert np.isclose(odds["playoffs"].sum(), 14)
+    for seed_number in range(1, 8):
+        assert np.isclose(odds[f"seed_{seed_number}"].sum(), 2)
+    assert np.isclose(odds["first_pick"].sum(), 1)
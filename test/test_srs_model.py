@@ -1,6 +1,46 @@
-from nfl_analytics import srs_model
-from nfl_analytics.nfl_data import NflWeek
+import os
+import pytest
+from nfl_analytics import srs_model, nfl_data, _local_storage
+from nfl_analytics.nfl_data import NflWeek, _source_data
 import pandas as pd
+import numpy as np
+
+
+@pytest.fixture
+def empty_datastore(tmp_path, monkeypatch):
+    """
+    Point the datastore at an empty directory, sourcing the schedules and play-by-play
+    from the current datastore when it has them instead of from the web.
+    """
+    current_path = _local_storage._get_datastore_path()
+
+    def source(data_type):
+        web_source = _source_data._SOURCE_FUNCTIONS[data_type]
+
+        def copy_or_download(args):
+            file_path = os.path.join(
+                current_path or "",
+                _source_data._DATASTORE_SUBDIR,
+                _source_data._filename(data_type, args),
+            )
+            if current_path and os.path.exists(file_path):
+                return pd.read_parquet(file_path)
+            return web_source(args)
+
+        return copy_or_download
+
+    for data_type in ["schedules", "pbp"]:
+        monkeypatch.setitem(
+            _source_data._SOURCE_FUNCTIONS, data_type, source(data_type)
+        )
+
+    datastore = tmp_path / "datastore"
+    datastore.mkdir()
+    try:
+        _local_storage.set_datastore_path(str(datastore))
+        yield datastore
+    finally:
+        _local_storage.set_datastore_path(current_path)
 
 
 def test_srs_fitter():
@@ -406,5 +446,546 @@ def test_srs_predictor():
         ]
     )
 
-    # Check if the predicted games match the expected games
-    assert predicted_games.equals(expected_games)
+    # Check if the predicted games match the expected games,
+    # up to a rounding error of 1e-9 points between the least squares solvers
+    spread_columns = ["pred_spread", "pred_spread_O", "pred_spread_D", "pred_spread_ST"]
+    game_columns = ["game_id", "home_team", "away_team"]
+    assert predicted_games.columns.equals(expected_games.columns)
+    assert predicted_games[game_columns].equals(expected_games[game_columns])
+    assert np.allclose(
+        predicted_games[spread_columns],
+        expected_games[spread_columns],
+        rtol=0,
+        atol=1e-9,
+    )
+
+
+def test_srs_solvers_match():
+    # Fit the same weeks with the normal equations and the dense least squares
+    srs_frames = []
+    for solver in ["normal", "lstsq"]:
+        fitter = srs_model._SrsFitter(NflWeek(2024, 1), NflWeek(2024, 18), solver)
+        fitter.fit()
+        srs_frames.append(fitter.srs_frame)
+
+    # Both solvers should give the same normalized SRS
+    normal_srs, lstsq_srs = srs_frames
+    assert normal_srs["Team"].equals(lstsq_srs["Team"])
+    columns = ["MoV", "SoS", "SRS", "SRS_O", "SRS_D", "SRS_ST"]
+    assert np.allclose(normal_srs[columns], lstsq_srs[columns], rtol=0, atol=1e-9)
+
+
+def test_srs_fitter_team_count():
+    # The 2001 season had 31 teams
+    srs_frames = []
+    for solver in ["normal", "lstsq"]:
+        fitter = srs_model._SrsFitter(NflWeek(2001, 1), NflWeek(2001, 17), solver)
+        fitter.fit()
+        srs_frames.append(fitter.srs_frame)
+
+    # Every team should get a rating, normalized over the teams present
+    normal_srs, lstsq_srs = srs_frames
+    assert len(normal_srs) == 31
+    assert "HOU" not in normal_srs["Team"].values
+    assert abs(normal_srs["SRS_O"].mean()) < 1e-9
+    columns = ["MoV", "SoS", "SRS", "SRS_O", "SRS_D", "SRS_ST"]
+    assert np.allclose(normal_srs[columns], lstsq_srs[columns], rtol=0, atol=1e-9)
+
+
+def test_srs_walk_forward():
+    # Season to date SRS as of weeks 10 through 12 of 2024
+    walk_forward = srs_model.SrsModel.walk_forward(
+        NflWeek(2024, 10), NflWeek(2024, 12), window="season"
+    )
+    assert sorted(walk_forward["week"].unique()) == [10, 11, 12]
+
+    # Each as-of week should match a model fit on the same window
+    columns = ["MoV", "SoS", "SRS", "SRS_O", "SRS_D", "SRS_ST"]
+    for week in [10, 11, 12]:
+        fitter = srs_model._SrsFitter(NflWeek(2024, 1), NflWeek(2024, week))
+        fitter.fit()
+
+        srs_frame = walk_forward[walk_forward["week"] == week].reset_index(drop=True)
+        assert srs_frame["Team"].equals(fitter.srs_frame["Team"])
+        assert np.allclose(srs_frame[columns], fitter.srs_frame[columns], atol=1e-9)
+        assert np.allclose(srs_frame["HFA"], fitter._hfa)
+
+
+def test_srs_fitter_update():
+    def breakdown(start_week, end_week):
+        # Get the point breakdown of the games with their neutral site flags
+        games = nfl_data.point_breakdown(start_week, end_week)
+        schedules = nfl_data.schedules(start_week, end_week)
+        neutral_games = schedules.loc[schedules["location"] == "Neutral", "game_id"]
+        games["is_neutral"] = games.index.isin(neutral_games)
+        return games
+
+    columns = ["SRS", "SRS_O", "SRS_D", "SRS_ST"]
+
+    # Add week 10 to a fit through week 9
+    fitter = srs_model._SrsFitter(NflWeek(2024, 1), NflWeek(2024, 9))
+    fitter.fit()
+    fitter.update(breakdown(NflWeek(2024, 10), NflWeek(2024, 10)))
+
+    expected = srs_model._SrsFitter(NflWeek(2024, 1), NflWeek(2024, 10))
+    expected.fit()
+    assert np.allclose(fitter.srs_frame[columns], expected.srs_frame[columns])
+    assert np.isclose(fitter._hfa, expected._hfa)
+
+    # Slide the window forward by removing week 1
+    fitter.remove(breakdown(NflWeek(2024, 1), NflWeek(2024, 1)))
+
+    expected = srs_model._SrsFitter(NflWeek(2024, 2), NflWeek(2024, 10))
+    expected.fit()
+    assert np.allclose(fitter.srs_frame[columns], expected.srs_frame[columns])
+    assert np.isclose(fitter._hfa, expected._hfa)
+
+
+def test_srs_fitter_update_remove():
+    columns = ["MoV", "SoS", "SRS", "SRS_O", "SRS_D", "SRS_ST"]
+    fitter = srs_model._SrsFitter(NflWeek(2024, 1), NflWeek(2024, 9))
+    fitter.fit()
+    original = fitter.srs_frame.copy()
+
+    # The week 10 games, with their ids as a column and their neutral site flags
+    schedules = nfl_data.schedules(NflWeek(2024, 10), NflWeek(2024, 10))
+    games = nfl_data.point_breakdown(NflWeek(2024, 10), NflWeek(2024, 10))
+    games["is_neutral"] = games.index.isin(
+        schedules.loc[schedules["location"] == "Neutral", "game_id"]
+    )
+    games = games.reset_index()
+
+    # Adding the games should match a full refit, including the MoV from the schedule scores
+    fitter.update(games)
+    expected = srs_model._SrsFitter(NflWeek(2024, 1), NflWeek(2024, 10))
+    expected.fit()
+    assert np.allclose(fitter.srs_frame[columns], expected.srs_frame[columns])
+
+    # Games already in the fit cannot be added, and games outside it cannot be removed
+    with pytest.raises(ValueError):
+        fitter.update(games)
+    with pytest.raises(ValueError):
+        fitter.remove(nfl_data.point_breakdown(NflWeek(2024, 11), NflWeek(2024, 11)))
+    with pytest.raises(ValueError):
+        fitter.update(games.drop(columns=["game_id"]))
+
+    # Removing them again should restore the original ratings, up to rounding error,
+    # and the MoV exactly
+    fitter.remove(games)
+    assert fitter.srs_frame["MoV"].equals(original["MoV"])
+    assert np.allclose(fitter.srs_frame[columns], original[columns], rtol=0, atol=1e-10)
+
+    # Without the neutral site flags, they should be taken from the schedules
+    fitter.update(games.drop(columns=["is_neutral"]))
+    assert np.allclose(fitter.srs_frame[columns], expected.srs_frame[columns])
+    assert np.isclose(fitter._hfa, expected._hfa)
+
+
+def test_srs_fit_windows():
+    # Trailing eight week SRS for the second half of 2024
+    windows = nfl_data.week_windows(NflWeek(2024, 10), NflWeek(2024, 12), window=8)
+    teams, ratings, hfa = srs_model.fit_windows(windows)
+    assert ratings.shape == (len(windows), len(teams), 3)
+    assert hfa.shape == (len(windows), 4)
+
+    # Each window should match a model fit on the same weeks
+    for (start, end), window_ratings, window_hfa in zip(windows, ratings, hfa):
+        fitter = srs_model._SrsFitter(start, end)
+        fitter.fit()
+
+        srs_frame = fitter.srs_frame.set_index("Team").reindex(teams)
+        expected = srs_frame[["SRS_O", "SRS_D", "SRS_ST"]].to_numpy()
+        assert np.allclose(window_ratings, expected, atol=1e-9, equal_nan=True)
+        assert np.isclose(window_hfa[0], fitter._hfa)
+
+
+def test_srs_model_spreads():
+    model = srs_model.SrsModel(NflWeek(2024, 1), NflWeek(2024, 10))
+    schedules = nfl_data.schedules(NflWeek(2024, 11), NflWeek(2024, 11))
+    games = pd.DataFrame(
+        {
+            "game_id": schedules["game_id"],
+            "home_team": schedules["home_team"],
+            "away_team": schedules["away_team"],
+            "is_neutral": schedules["location"] == "Neutral",
+        }
+    )
+    predictions = model.predict(games)
+
+    # Abbreviations and team codes should give the predicted spreads
+    columns = ["pred_spread", "pred_spread_O", "pred_spread_D", "pred_spread_ST"]
+    spreads = model.spreads(games["home_team"], games["away_team"], games["is_neutral"])
+    assert np.array_equal(spreads, predictions[columns].to_numpy())
+    code_spreads = model.spreads(
+        model.team_codes(games["home_team"]),
+        model.team_codes(games["away_team"]),
+        games["is_neutral"],
+    )
+    assert np.array_equal(code_spreads, spreads)
+
+    # Unknown teams get no spread
+    assert np.isnan(model.spreads(["XXX"], ["KC"])).all()
+
+
+def test_srs_model_lookup_spreads():
+    model = srs_model.SrsModel(NflWeek(2024, 1), NflWeek(2024, 10))
+    home_teams = ["BAL", "KC", "XXX"]
+    away_teams = ["KC", "BUF", "KC"]
+    is_neutral = [False, True, False]
+
+    # Batched and single lookups should match the computed spreads
+    spreads = model.lookup_spreads(
+        model.team_codes(home_teams), model.team_codes(away_teams), is_neutral
+    )
+    assert np.allclose(
+        spreads, model.spreads(home_teams, away_teams, is_neutral), equal_nan=True
+    )
+    assert np.isnan(spreads[2]).all()
+    home_code, away_code = model.team_codes(["BAL", "KC"])
+    assert np.array_equal(model.lookup_spreads(home_code, away_code), spreads[0])
+
+    # The spread tensor should hold every matchup by venue and component
+    tensor = model.spread_tensor()
+    assert tensor.shape == (2, 4, 32, 32)
+    assert np.array_equal(tensor[:, :, home_code, away_code][0], spreads[0])
+
+
+def test_srs_model_save_load(tmp_path):
+    model = srs_model.SrsModel(NflWeek(2024, 1), NflWeek(2024, 10))
+    model.save(tmp_path / "srs_model.npz")
+    loaded = srs_model.SrsModel.load(tmp_path / "srs_model.npz")
+
+    # The reloaded model should give the same ratings and spreads
+    assert not loaded.is_stale()
+    pd.testing.assert_frame_equal(loaded._fitter.srs_frame, model._fitter.srs_frame)
+    assert np.array_equal(loaded.spread_tensor(), model.spread_tensor())
+
+    # A fingerprint that no longer matches the data should be rejected
+    model._fingerprint = "stale"
+    model.save(tmp_path / "stale_model.npz")
+    with pytest.raises(ValueError):
+        srs_model.SrsModel.load(tmp_path / "stale_model.npz")
+    assert srs_model.SrsModel.load(tmp_path / "stale_model.npz", check_stale=False)
+
+
+def test_srs_model_save_load_empty_datastore(empty_datastore, tmp_path):
+    # The fit downloads the data, which the fingerprint should include
+    model = srs_model.SrsModel(NflWeek(2024, 1), NflWeek(2024, 10))
+    assert not model.is_stale()
+
+    model.save(tmp_path / "srs_model.npz")
+    loaded = srs_model.SrsModel.load(tmp_path / "srs_model.npz")
+    assert not loaded.is_stale()
+    assert np.array_equal(loaded.spread_tensor(), model.spread_tensor())
+
+    # A loaded model only predicts
+    games = nfl_data.point_breakdown(NflWeek(2024, 11), NflWeek(2024, 11))
+    for call in [
+        lambda: loaded.bootstrap(n_samples=10),
+        lambda: loaded.rating_intervals(),
+        lambda: loaded.game_influence(),
+        lambda: loaded.what_if(
+            pd.DataFrame(columns=["scenario", "game_id", *games.columns])
+        ),
+        lambda: loaded._fitter.update(games),
+        lambda: loaded._fitter.remove(games),
+    ]:
+        with pytest.raises(ValueError, match="loaded model"):
+            call()
+
+
+def test_srs_model_cache(tmp_path, monkeypatch):
+    cache = srs_model.SrsModelCache(maxsize=2, directory=tmp_path)
+    model = srs_model.SrsModel.cached(NflWeek(2024, 1), NflWeek(2024, 10), cache=cache)
+
+    # Repeated constructions should return the cached model
+    assert (
+        srs_model.SrsModel.cached(NflWeek(2024, 1), NflWeek(2024, 10), cache=cache)
+        is model
+    )
+    assert cache.stats() == {"hits": 1, "disk_hits": 0, "misses": 1, "size": 1}
+
+    # A new cache on the same directory should load the saved model
+    disk_cache = srs_model.SrsModelCache(directory=tmp_path)
+    loaded = disk_cache.get(NflWeek(2024, 1), NflWeek(2024, 10))
+    assert disk_cache.stats()["disk_hits"] == 1
+    pd.testing.assert_frame_equal(loaded._fitter.srs_frame, model._fitter.srs_frame)
+
+    # The loaded model is refit when it needs the games, like the fitted one
+    pd.testing.assert_frame_equal(loaded.game_influence(), model.game_influence())
+    with pytest.raises(ValueError, match="shared"):
+        loaded.bootstrap(n_samples=10)
+
+    # Refreshed data should give a newly fitted model in place of the old one
+    monkeypatch.setattr(srs_model, "_data_fingerprint", lambda *_: "refreshed")
+    refit = cache.get(NflWeek(2024, 1), NflWeek(2024, 10))
+    assert refit is not model
+    assert cache.stats() == {"hits": 1, "disk_hits": 0, "misses": 2, "size": 1}
+
+
+def test_srs_model_cache_empty_datastore(empty_datastore, tmp_path):
+    # The first fit downloads the data, and the next call should still hit the cached model
+    cache = srs_model.SrsModelCache(directory=tmp_path / "models")
+    model = cache.get(NflWeek(2024, 1), NflWeek(2024, 10))
+    assert cache.get(NflWeek(2024, 1), NflWeek(2024, 10)) is model
+    assert cache.stats() == {"hits": 1, "disk_hits": 0, "misses": 1, "size": 1}
+
+    # And a new cache should find the saved model
+    disk_cache = srs_model.SrsModelCache(directory=tmp_path / "models")
+    disk_cache.get(NflWeek(2024, 1), NflWeek(2024, 10))
+    assert disk_cache.stats()["disk_hits"] == 1
+
+
+def test_srs_model_cache_shared():
+    cache = srs_model.SrsModelCache()
+    model = cache.get(NflWeek(2024, 1), NflWeek(2024, 9))
+    ratings = model.ratings()
+    games = nfl_data.point_breakdown(NflWeek(2024, 10), NflWeek(2024, 10))
+
+    # The shared model cannot be changed in place
+    with pytest.raises(ValueError, match="shared"):
+        model.bootstrap(n_samples=10)
+    with pytest.raises(ValueError, match="shared"):
+        model._fitter.update(games)
+
+    # A copy can be changed without affecting the cached model
+    copied = model.copy()
+    copied._fitter.update(games)
+    copied.bootstrap(n_samples=10, seed=0)
+    assert not copied.ratings().equals(ratings)
+    assert cache.get(NflWeek(2024, 1), NflWeek(2024, 9)) is model
+    pd.testing.assert_frame_equal(model.ratings(), ratings)
+
+
+def test_srs_model_bootstrap():
+    model = srs_model.SrsModel(NflWeek(2024, 1), NflWeek(2024, 18))
+    schedules = nfl_data.schedules(NflWeek(2024, 18), NflWeek(2024, 18))
+    games = pd.DataFrame(
+        {
+            "game_id": schedules["game_id"],
+            "home_team": schedules["home_team"],
+            "away_team": schedules["away_team"],
+            "is_neutral": schedules["location"] == "Neutral",
+        }
+    )
+
+    # The intervals need the replicates of `bootstrap`
+    with pytest.raises(ValueError, match="bootstrap"):
+        model.rating_intervals()
+    with pytest.raises(ValueError, match="bootstrap"):
+        model.predict_intervals(games)
+
+    model.bootstrap(n_samples=200, seed=0)
+    intervals = model.rating_intervals(level=0.9)
+
+    # The intervals should be ordered and cover most point estimates
+    srs_frame = model._fitter.srs_frame
+    assert intervals["Team"].equals(srs_frame["Team"])
+    for column in ["SRS", "SRS_O", "SRS_D", "SRS_ST"]:
+        assert (intervals[f"{column}_lower"] <= intervals[f"{column}_upper"]).all()
+        covered = (intervals[f"{column}_lower"] <= srs_frame[column]) & (
+            srs_frame[column] <= intervals[f"{column}_upper"]
+        )
+        assert covered.mean() > 0.8
+
+    # The same seed should give the same replicates
+    other_model = srs_model.SrsModel(NflWeek(2024, 1), NflWeek(2024, 18))
+    other_model.bootstrap(n_samples=200, seed=0)
+    pd.testing.assert_frame_equal(other_model.rating_intervals(level=0.9), intervals)
+
+    # The predictions should keep their spreads, with intervals around them
+    predictions = model.predict_intervals(games, level=0.9)
+    pd.testing.assert_frame_equal(
+        predictions[model.predict(games).columns], model.predict(games)
+    )
+    assert (predictions["pred_spread_lower"] < predictions["pred_spread_upper"]).all()
+
+    # Changing the games of the fit discards the replicates
+    model._fitter.remove(nfl_data.point_breakdown(NflWeek(2024, 1), NflWeek(2024, 1)))
+    with pytest.raises(ValueError, match="changed"):
+        model.predict_intervals(games)
+    with pytest.raises(ValueError, match="bootstrap"):
+        model.rating_intervals()
+
+
+def test_srs_fitter_weights():
+    # The weighted normal equations should match the weighted dense least squares
+    srs_frames = []
+    for solver in ["normal", "lstsq"]:
+        fitter = srs_model._SrsFitter(
+            NflWeek(2024, 1), NflWeek(2024, 12), solver, half_life=4
+        )
+        fitter.fit()
+        srs_frames.append(fitter.srs_frame)
+    columns = ["SRS", "SRS_O", "SRS_D", "SRS_ST"]
+    assert np.allclose(srs_frames[0][columns], srs_frames[1][columns], atol=1e-9)
+
+    # Equal game weights should give the unweighted SRS
+    games = nfl_data.point_breakdown(NflWeek(2024, 1), NflWeek(2024, 12))
+    weighted = srs_model._SrsFitter(
+        NflWeek(2024, 1), NflWeek(2024, 12), game_weights=pd.Series(2.0, games.index)
+    )
+    weighted.fit()
+    unweighted = srs_model._SrsFitter(NflWeek(2024, 1), NflWeek(2024, 12))
+    unweighted.fit()
+    assert np.allclose(weighted.srs_frame[columns], unweighted.srs_frame[columns])
+
+
+def test_srs_decay_search():
+    best_half_life, results = srs_model.SrsModel.decay_search(
+        NflWeek(2024, 10), NflWeek(2024, 11), [2, 8, np.inf]
+    )
+    assert best_half_life == results.loc[results["RMSE"].idxmin(), "half_life"]
+
+    # Each half-life should match the models fit as of the previous weeks
+    for half_life, rmse in zip(results["half_life"], results["RMSE"]):
+        errors = []
+        for week in [10, 11]:
+            model = srs_model.SrsModel(
+                NflWeek(2024, 1),
+                NflWeek(2024, week - 1),
+                half_life=None if np.isinf(half_life) else half_life,
+            )
+            schedules = nfl_data.schedules(NflWeek(2024, week), NflWeek(2024, week))
+            spreads = model.spreads(
+                schedules["home_team"],
+                schedules["away_team"],
+                schedules["location"] == "Neutral",
+            )[:, 0]
+            errors.append(
+                spreads - (schedules["home_score"] - schedules["away_score"]).to_numpy()
+            )
+        assert np.isclose(rmse, np.sqrt(np.mean(np.concatenate(errors) ** 2)))
+
+
+def test_srs_ridge_loo():
+    start_week, end_week = NflWeek(2024, 1), NflWeek(2024, 6)
+
+    # Both solvers should agree on the regularized fit
+    normal_model = srs_model.SrsModel(start_week, end_week, ridge=5.0)
+    lstsq_model = srs_model.SrsModel(start_week, end_week, "lstsq", ridge=5.0)
+    assert np.allclose(
+        normal_model._fitter.srs_frame["SRS"].to_numpy(),
+        lstsq_model._fitter.srs_frame["SRS"].to_numpy(),
+    )
+
+    best_ridge, results = srs_model.SrsModel.ridge_search(
+        start_week, end_week, [1.0, 5.0, 50.0]
+    )
+    assert best_ridge == results.loc[results["RMSE"].idxmin(), "ridge"]
+
+    # The closed-form errors should match refitting without each game
+    fitter = srs_model._SrsFitter(start_week, end_week, ridge=5.0)
+    fitter.fit()
+    loo = fitter.loo_errors()[0]
+    schedules = nfl_data.schedules(start_week, end_week).set_index("game_id")
+    game_ids = fitter._point_breakdown_df.index
+    for i in [0, 7, 42]:
+        weights = pd.Series(1.0, index=game_ids)
+        weights.iloc[i] = 0.0
+        model = srs_model.SrsModel(
+            start_week, end_week, game_weights=weights, ridge=5.0
+        )
+        game = schedules.loc[game_ids[i]]
+        spread = model.spreads(
+            [game["home_team"]], [game["away_team"]], game["location"] == "Neutral"
+        )[0, 0]
+        assert np.isclose(loo[i], spread - (game["home_score"] - game["away_score"]))
+
+
+def test_srs_what_if():
+    start_week, end_week = NflWeek(2024, 1), NflWeek(2024, 6)
+    model = srs_model.SrsModel(start_week, end_week)
+    point_breakdown = nfl_data.point_breakdown(start_week, end_week)
+    columns = ["SRS", "SRS_O", "SRS_D", "SRS_ST"]
+
+    def refit(point_breakdown_df):
+        # Fit from a session holding the given results
+        session = nfl_data.AnalysisSession(start_week, end_week)
+        session.point_breakdown()
+        session._tables["point_breakdown"] = point_breakdown_df
+        return srs_model.SrsModel(start_week, end_week, session=session)
+
+    # Each game's influence should match refitting without it
+    influence = model.game_influence()
+    for game_id in point_breakdown.index[[0, 17]]:
+        without = refit(point_breakdown.drop(game_id))
+        assert np.allclose(
+            influence.loc[game_id].to_numpy(),
+            model._fitter.srs_frame["SRS"].to_numpy()
+            - without._fitter.srs_frame["SRS"].to_numpy(),
+        )
+
+    # A scenario where a game had a 14 point swing in offense
+    game_id = point_breakdown.index[5]
+    scenarios = point_breakdown.loc[[game_id]].rename_axis("game_id").reset_index()
+    scenarios["home_offensive_points"] += 14
+    scenarios["scenario"] = "swing"
+    changed = point_breakdown.copy()
+    changed.loc[game_id, "home_offensive_points"] += 14
+    changed_model = refit(changed)
+
+    ratings = model.what_if(scenarios)
+    assert np.allclose(
+        ratings[columns].to_numpy(),
+        changed_model._fitter.srs_frame[columns].to_numpy(),
+    )
+
+    games = nfl_data.schedules(NflWeek(2024, 7), NflWeek(2024, 7))[
+        ["game_id", "home_team", "away_team"]
+    ].assign(is_neutral=False)
+    predictions = model.what_if_predict(scenarios, games)
+    assert (predictions["scenario"] == "swing").all()
+    assert np.allclose(
+        predictions["pred_spread"].to_numpy(),
+        changed_model.predict(games)["pred_spread"].to_numpy(),
+    )
+
+
+def test_srs_model_compact():
+    model = srs_model.SrsModel(NflWeek(2024, 1), NflWeek(2024, 10))
+    schedules = nfl_data.schedules(NflWeek(2024, 11), NflWeek(2024, 11))
+    games = pd.DataFrame(
+        {
+            "game_id": schedules["game_id"],
+            "home_team": schedules["home_team"],
+            "away_team": schedules["away_team"],
+            "is_neutral": schedules["location"] == "Neutral",
+        }
+    )
+    bound = nfl_data.COMPACT_RELATIVE_ERROR
+
+    # Compact predictions should be float32 within the documented bound of the full ones
+    predictions = model.predict(games)
+    compact = model.predict(games, compact=True)
+    columns = ["pred_spread", "pred_spread_O", "pred_spread_D", "pred_spread_ST"]
+    assert (compact[columns].dtypes == np.float32).all()
+    assert compact["home_team"].dtype == "category"
+    full = predictions[columns].to_numpy()
+    assert np.all(
+        np.abs(compact[columns].to_numpy(np.float64) - full) <= bound * np.abs(full)
+    )
+
+    # The same for the ratings, whose teams keep their order
+    ratings = model.ratings()
+    compact = model.ratings(compact=True)
+    columns = ["MoV", "SoS", "SRS", "SRS_O", "SRS_D", "SRS_ST"]
+    assert (compact[columns].dtypes == np.float32).all()
+    assert compact["Team"].astype(str).tolist() == ratings["Team"].tolist()
+    full = ratings[columns].to_numpy()
+    assert np.all(
+        np.abs(compact[columns].to_numpy(np.float64) - full) <= bound * np.abs(full)
+    )
+
+    # And for the walk forward ratings
+    walk_forward = srs_model.SrsModel.walk_forward(
+        NflWeek(2024, 9), NflWeek(2024, 10), window="season"
+    )
+    compact = srs_model.SrsModel.walk_forward(
+        NflWeek(2024, 9), NflWeek(2024, 10), window="season", compact=True
+    )
+    assert compact["week"].dtype == np.int16
+    full = walk_forward[columns].to_numpy()
+    assert np.all(
+        np.abs(compact[columns].to_numpy(np.float64) - full) <= bound * np.abs(full)
+    )
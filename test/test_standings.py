@@ -0,0 +1,77 @@
+import pytest
+from nfl_analytics import standings
+
+
+@pytest.mark.parametrize(
+    "season, afc_seeds, nfc_seeds, draft_order, division_ranks, records",
+    [
+        # PIT and DET tie, LV edges NE for the 5th seed and HOU, NYJ and NYG are 4-13
+        (
+            2021,
+            ["TEN", "KC", "BUF", "CIN", "LV", "NE", "PIT"],
+            ["GB", "TB", "DAL", "LA", "ARI", "SF", "PHI"],
+            ["JAX", "DET", "HOU", "NYJ", "NYG", "CAR", "CHI", "ATL", "DEN"]
+            + ["SEA", "WAS", "MIN", "CLE", "BAL", "MIA", "IND", "LAC", "NO"],
+            {},
+            {"PIT": (9, 7, 1), "DET": (3, 13, 1)},
+        ),
+        # Two tie games, and the BUF-CIN no contest is left out of both records
+        (
+            2022,
+            ["KC", "BUF", "CIN", "JAX", "LAC", "BAL", "MIA"],
+            ["PHI", "SF", "MIN", "TB", "DAL", "NYG", "SEA"],
+            ["CHI", "HOU", "ARI", "IND", "DEN", "LA", "LV", "ATL", "CAR"]
+            + ["NO", "TEN", "CLE", "NYJ", "NE", "GB", "WAS", "PIT", "DET"],
+            {},
+            {
+                "NYG": (9, 7, 1),
+                "WAS": (8, 8, 1),
+                "IND": (4, 12, 1),
+                "HOU": (3, 13, 1),
+                "BUF": (13, 3, 0),
+                "CIN": (12, 4, 0),
+            },
+        ),
+        # Ties for the division titles: BUF over MIA and TB over NO
+        (
+            2023,
+            ["BAL", "BUF", "KC", "HOU", "CLE", "MIA", "PIT"],
+            ["SF", "DAL", "DET", "TB", "PHI", "LA", "GB"],
+            ["CAR", "WAS", "NE", "ARI", "LAC", "NYG", "TEN", "ATL", "CHI"]
+            + ["NYJ", "MIN", "DEN", "LV", "NO", "IND", "SEA", "JAX", "CIN"],
+            {"MIA": 2, "NO": 2},
+            {"BUF": (11, 6, 0), "MIA": (11, 6, 0)},
+        ),
+        # LA wins the NFC West over SEA on strength of victory
+        (
+            2024,
+            ["KC", "BUF", "BAL", "HOU", "LAC", "PIT", "DEN"],
+            ["DET", "PHI", "TB", "LA", "MIN", "WAS", "GB"],
+            ["TEN", "CLE", "NYG", "NE", "JAX", "LV", "NYJ", "CAR", "NO"]
+            + ["CHI", "SF", "DAL", "MIA", "IND", "ATL", "ARI", "CIN", "SEA"],
+            {"SEA": 2},
+            {"LA": (10, 7, 0), "SEA": (10, 7, 0)},
+        ),
+    ],
+)
+def test_season_standings(
+    season, afc_seeds, nfc_seeds, draft_order, division_ranks, records
+):
+    # The final standings of the season
+    season_standings = standings.season_standings(season).set_index("Team")
+
+    seeds = season_standings.loc[season_standings["seed"] > 0].sort_values(
+        ["conference", "seed"]
+    )
+    assert seeds.loc[seeds["conference"] == "AFC"].index.tolist() == afc_seeds
+    assert seeds.loc[seeds["conference"] == "NFC"].index.tolist() == nfc_seeds
+
+    for team, division_rank in division_ranks.items():
+        assert season_standings.loc[team, "division_rank"] == division_rank
+
+    for team, record in records.items():
+        assert tuple(season_standings.loc[team, ["wins", "losses", "ties"]]) == record
+
+    # The draft order of the teams missing the playoffs, before trades
+    draft_picks = season_standings.loc[season_standings["draft_pick"] > 0]
+    assert draft_picks.sort_values("draft_pick").index.tolist() == draft_order